@@ -8,11 +8,13 @@ from .install import InstallOperation
 from .uninstall import UninstallOperation
 from .update import UpdateOperation
 from .backup import BackupOperation
+from .mcp import MCPOperation
 
 __all__ = [
     'OperationBase',
     'InstallOperation',
     'UninstallOperation', 
     'UpdateOperation',
-    'BackupOperation'
+    'BackupOperation',
+    'MCPOperation'
 ]
\ No newline at end of file
@@ -9,17 +9,20 @@ import tarfile
 import json
 from pathlib import Path
 from ...utils.paths import get_home_directory
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
+from ...services.backup import (
+    BackupService, SNAPSHOTS_DIR, get_index_path, read_backup_index
+)
 from ...services.settings import SettingsService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR
+from ... import DEFAULT_INSTALL_DIR, __version__
 from . import OperationBase
 
 
@@ -41,6 +44,7 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperClaude backup --create               # Create new backup
+  SuperClaude backup --create --dedup       # Create deduplicated snapshot
   SuperClaude backup --list --verbose       # List available backups (verbose)
   SuperClaude backup --restore              # Interactive restore
   SuperClaude backup --restore backup.tar.gz  # Restore specific backup
@@ -105,6 +109,19 @@ Examples:
         help="Compression method (default: gzip)"
     )
     
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Store the backup in the deduplicating object store (for --create)"
+    )
+    
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="NAME",
+        help="Additional top-level entry to leave out of the backup (repeatable)"
+    )
+    
     # Restore options
     parser.add_argument(
         "--overwrite",
@@ -144,6 +161,11 @@ def check_installation_exists(install_dir: Path) -> bool:
     return settings_manager.check_installation_exists() or settings_manager.check_v2_installation_exists()
 
 
+def is_snapshot(backup_path: Path) -> bool:
+    """Check whether a backup path is a deduplicated snapshot manifest"""
+    return backup_path.parent.name == SNAPSHOTS_DIR and backup_path.suffix == ".json"
+
+
 def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     """Get information about a backup file"""
     info = {
@@ -163,6 +185,25 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
         info["size"] = stats.st_size
         info["created"] = datetime.fromtimestamp(stats.st_mtime)
         
+        # Deduplicated snapshots carry everything in their manifest
+        if is_snapshot(backup_path):
+            manifest = json.loads(backup_path.read_text(encoding='utf-8'))
+            info["metadata"] = manifest.get("metadata", {})
+            info["files"] = manifest.get("files", 0)
+            info["size"] = manifest.get("total_size", 0)
+            info["total_size"] = manifest.get("total_size", 0)
+            info["dedup"] = True
+            return info
+        
+        # Prefer the sidecar index so the archive is never decompressed
+        index = read_backup_index(backup_path)
+        if index is not None:
+            info["metadata"] = index.get("metadata", {})
+            info["files"] = index.get("files", 0)
+            info["total_size"] = index.get("total_size", 0)
+            info["index"] = get_index_path(backup_path)
+            return info
+        
         # Try to read metadata from backup
         if backup_path.suffix == ".gz":
             mode = "r:gz"
@@ -203,6 +244,10 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
             info = get_backup_info(backup_file)
             backups.append(info)
     
+    # Deduplicated snapshots are listed from their manifests
+    for snapshot in BackupService(backup_dir.parent, backup_dir).list_snapshots():
+        backups.append(get_backup_info(snapshot["path"]))
+    
     # Sort by creation date (newest first)
     backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
     
@@ -282,61 +327,29 @@ def create_backup(args: argparse.Namespace) -> bool:
         else:
             backup_name = f"superclaude_backup_{timestamp}"
         
-        # Determine compression
-        if args.compress == "gzip":
-            backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
-        elif args.compress == "bzip2":
-            backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
-        else:
-            backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
-        
-        logger.info(f"Creating backup: {backup_file}")
+        logger.info(f"Creating backup: {backup_dir / backup_name}")
         
         # Create metadata
         metadata = create_backup_metadata(args.install_dir)
         
-        # Create backup
-        start_time = time.time()
+        # Stream the installation into the archive (excluding backups and local dirs)
+        service = BackupService(args.install_dir, backup_dir, excludes=args.exclude)
         
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
-            
-            # Add installation directory contents (excluding backups and local dirs)
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        
-                        # Skip files in excluded directories
-                        if rel_path.parts and rel_path.parts[0] in ["backups", "local"]:
-                            continue
-                            
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
-                        
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+        if args.dedup:
+            stats = service.create_snapshot(backup_name, metadata=metadata)
+            logger.success(f"Backup created successfully in {stats['duration']:.1f} seconds")
+            logger.info(f"Snapshot: {stats['path']}")
+            logger.info(f"Files archived: {stats['files']} ({format_size(stats['bytes'])})")
+            logger.info(f"New data stored: {stats['new_objects']} objects ({format_size(stats['new_bytes'])})")
+            return True
         
-        duration = time.time() - start_time
-        file_size = backup_file.stat().st_size
+        stats = service.create_backup(backup_name, compression=args.compress, metadata=metadata)
         
-        logger.success(f"Backup created successfully in {duration:.1f} seconds")
-        logger.info(f"Backup file: {backup_file}")
-        logger.info(f"Files archived: {files_added}")
+        file_size = stats["path"].stat().st_size
+        
+        logger.success(f"Backup created successfully in {stats['duration']:.1f} seconds")
+        logger.info(f"Backup file: {stats['path']}")
+        logger.info(f"Files archived: {stats['files']} ({format_size(stats['bytes'])})")
         logger.info(f"Backup size: {format_size(file_size)}")
         
         return True
@@ -363,6 +376,14 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Restoring from backup: {backup_path}")
         
+        if is_snapshot(backup_path):
+            start_time = time.time()
+            service = BackupService(args.install_dir, backup_path.parent.parent)
+            files_restored = service.restore_snapshot(backup_path, args.install_dir, overwrite=args.overwrite)
+            logger.success(f"Restore completed successfully in {time.time() - start_time:.1f} seconds")
+            logger.info(f"Files restored: {files_restored}")
+            return True
+        
         # Determine compression
         if backup_path.suffix == ".gz":
             mode = "r:gz"
@@ -477,7 +498,15 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         
         for backup in to_remove:
             try:
-                backup["path"].unlink()
+                if backup.get("dedup"):
+                    # Objects shared with remaining snapshots are kept
+                    removed = BackupService(backup_dir.parent, backup_dir).delete_snapshot(backup["path"])
+                    logger.debug(f"Released {removed} unreferenced objects")
+                else:
+                    backup["path"].unlink()
+                    index_path = get_index_path(backup["path"])
+                    if index_path.exists():
+                        index_path.unlink()
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
@@ -559,6 +588,8 @@ def run(args: argparse.Namespace) -> int:
                 print(f"Size: {format_size(info['size'])}")
                 print(f"Created: {info['created']}")
                 print(f"Files: {info.get('files', 'unknown')}")
+                if info.get("total_size"):
+                    print(f"Uncompressed: {format_size(info['total_size'])}")
                 
                 if info["metadata"]:
                     metadata = info["metadata"]
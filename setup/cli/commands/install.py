@@ -13,6 +13,7 @@ import argparse
 from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.config import ConfigService
+from ...services.mcp_catalog import get_mcp_catalog
 from ...core.validator import Validator
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
@@ -60,12 +61,79 @@ Examples:
     )
     
     # Installation options
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of MCP servers to install or verify concurrently (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--component-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Install components that share a dependency level concurrently, "
+             "N at a time (default: 1, one after another)"
+    )
+    
+    parser.add_argument(
+        "--mcp-backend",
+        choices=["cli", "config"],
+        default="cli",
+        help="Register MCP servers through the Claude CLI (default) or by "
+             "editing ~/.claude.json directly in one write"
+    )
+    
+    parser.add_argument(
+        "--mcp-cache",
+        type=Path,
+        metavar="DIR",
+        help="Resolve MCP server packages from a cache made by 'SuperClaude mcp prefetch'"
+    )
+    
+    parser.add_argument(
+        "--mcp-registry",
+        metavar="URL",
+        help="npm registry for MCP server packages (e.g. a local mirror)"
+    )
+    
+    parser.add_argument(
+        "--mcp-offline",
+        action="store_true",
+        help="Never download MCP server packages; use --mcp-cache only"
+    )
+    
+    parser.add_argument(
+        "--backup-format",
+        choices=["archive", "dedup"],
+        default="archive",
+        help="Backup format: archive (tar.gz, default) or dedup (content-addressed snapshot)"
+    )
+    
     parser.add_argument(
         "--no-backup",
         action="store_true",
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--copy-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of parallel file copy workers (default: 8)"
+    )
+    
+    parser.add_argument(
+        "--copy-mode",
+        choices=["copy", "clone", "hardlink"],
+        default="copy",
+        help="How files are installed: copy (default), clone (reflink/copy_file_range "
+             "with copy fallback) or hardlink (read-only shared deployments)"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -155,23 +223,23 @@ def get_components_to_install(args: argparse.Namespace, registry: ComponentRegis
     return interactive_component_selection(registry, config_manager)
 
 
-def collect_api_keys_for_servers(selected_servers: List[str], mcp_instance) -> Dict[str, str]:
+def collect_api_keys_for_servers(selected_servers: List[str], mcp_servers: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
     """
     Collect API keys for servers that require them
     
     Args:
         selected_servers: List of selected server keys
-        mcp_instance: MCP component instance
+        mcp_servers: MCP server definitions (the MCP catalog)
         
     Returns:
         Dictionary of environment variable names to API key values
     """
     # Filter servers needing keys
     servers_needing_keys = [
-        (server_key, mcp_instance.mcp_servers[server_key])
+        (server_key, mcp_servers[server_key])
         for server_key in selected_servers
-        if server_key in mcp_instance.mcp_servers and
-           mcp_instance.mcp_servers[server_key].get("requires_api_key", False)
+        if server_key in mcp_servers and
+           mcp_servers[server_key].get("requires_api_key", False)
     ]
     
     if not servers_needing_keys:
@@ -199,14 +267,8 @@ def select_mcp_servers(registry: ComponentRegistry) -> List[str]:
     logger = get_logger()
     
     try:
-        # Get MCP component to access server list
-        mcp_instance = registry.get_component_instance("mcp", get_home_directory() / ".claude")
-        if not mcp_instance or not hasattr(mcp_instance, 'mcp_servers'):
-            logger.error("Could not access MCP server information")
-            return []
-        
-        # Create MCP server menu
-        mcp_servers = mcp_instance.mcp_servers
+        # Create MCP server menu from the shared catalog
+        mcp_servers = get_mcp_catalog().servers
         server_options = []
         
         for server_key, server_info in mcp_servers.items():
@@ -242,14 +304,11 @@ def select_mcp_servers(registry: ComponentRegistry) -> List[str]:
             logger.info(f"Selected MCP servers: {', '.join(selected_servers)}")
             
             # NEW: Collect API keys for selected servers
-            collected_keys = collect_api_keys_for_servers(selected_servers, mcp_instance)
+            collected_keys = collect_api_keys_for_servers(selected_servers, mcp_servers)
             
             # Set up environment variables
             if collected_keys:
                 setup_environment_variables(collected_keys)
-                
-                # Store keys for MCP component to use during installation
-                mcp_instance.collected_api_keys = collected_keys
         else:
             logger.info("No MCP servers selected")
         
@@ -489,7 +548,16 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
         config = {
             "force": args.force,
             "backup": not args.no_backup,
+            "backup_format": getattr(args, 'backup_format', "archive"),
             "dry_run": args.dry_run,
+            "copy_workers": getattr(args, 'copy_workers', None),
+            "copy_mode": getattr(args, 'copy_mode', "copy"),
+            "component_jobs": getattr(args, 'component_jobs', 1),
+            "mcp_jobs": getattr(args, 'mcp_jobs', 4),
+            "mcp_backend": getattr(args, 'mcp_backend', "cli"),
+            "mcp_cache": getattr(args, 'mcp_cache', None),
+            "mcp_registry": getattr(args, 'mcp_registry', None),
+            "mcp_offline": getattr(args, 'mcp_offline', False),
             "selected_mcp_servers": getattr(config_manager, '_installation_context', {}).get("selected_mcp_servers", [])
         }
         
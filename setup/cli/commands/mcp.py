@@ -0,0 +1,270 @@
+"""
+SuperClaude MCP Operation Module
+Maintenance tasks for MCP servers outside of install/update
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+import argparse
+
+from ...services.mcp_catalog import get_mcp_catalog
+from ...services.mcp_cache import MCPPackageCache, default_cache_dir
+from ...services.mcp_health import DEFAULT_HEALTH_JOBS, DEFAULT_HEALTH_TIMEOUT, check_servers
+from ...services.mcp_registry import ClaudeConfigRegistry
+from ...utils.paths import get_home_directory
+from ...utils.process import get_runner
+from ...utils.ui import display_header, display_success, display_error, Colors
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class MCPOperation(OperationBase):
+    """MCP maintenance operation implementation"""
+
+    def __init__(self):
+        super().__init__("mcp")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register mcp CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "mcp",
+        help="MCP server maintenance (package prefetch, health checks)",
+        description="Maintenance tasks for SuperClaude MCP servers",
+        epilog="""
+Examples:
+  SuperClaude mcp prefetch                        # Cache all MCP server packages
+  SuperClaude mcp prefetch --servers context7 magic
+  SuperClaude mcp prefetch --mcp-cache /srv/mcp-cache
+  SuperClaude install --mcp-cache /srv/mcp-cache --mcp-offline
+  SuperClaude mcp doctor                          # Start every server and time its handshake
+  SuperClaude mcp doctor --json --quiet --timeout 60
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["prefetch", "doctor"],
+        help="prefetch: download MCP server packages into a local cache; "
+             "doctor: start configured servers and measure their startup"
+    )
+
+    parser.add_argument(
+        "--servers",
+        nargs="+",
+        metavar="NAME",
+        help="MCP servers to act on (default: all)"
+    )
+
+    parser.add_argument(
+        "--mcp-cache",
+        type=Path,
+        metavar="DIR",
+        help="Package cache directory (default: <install-dir>/.superclaude-cache/mcp-packages)"
+    )
+
+    parser.add_argument(
+        "--mcp-registry",
+        metavar="URL",
+        help="npm registry to download from (e.g. a local mirror)"
+    )
+
+    parser.add_argument(
+        "--claude-config",
+        type=Path,
+        metavar="FILE",
+        help="Claude config with the mcpServers to check (default: ~/.claude.json)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_HEALTH_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Startup and handshake time allowed per server (default: {DEFAULT_HEALTH_TIMEOUT:g})"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_HEALTH_JOBS,
+        metavar="N",
+        help=f"Servers started at once (default: {DEFAULT_HEALTH_JOBS})"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print doctor results as JSON (add --quiet for clean output)"
+    )
+
+    return parser
+
+
+def select_servers(names: Optional[List[str]]) -> Optional[dict]:
+    """
+    Pick the catalog server definitions to act on
+
+    Args:
+        names: Requested server names or aliases (None: all)
+
+    Returns:
+        Dict of server name -> server info, or None if a name is unknown
+    """
+    catalog = get_mcp_catalog()
+    if not names:
+        return dict(catalog.servers)
+
+    unknown = [name for name in names if catalog.resolve(name) is None]
+    if unknown:
+        display_error(f"Unknown MCP servers: {', '.join(unknown)}")
+        print(f"Available: {', '.join(catalog.servers)}")
+        return None
+    return {catalog.resolve(name): catalog.get(name) for name in names}
+
+
+def prefetch_packages(args: argparse.Namespace) -> bool:
+    """Download MCP server packages into the package cache"""
+    logger = get_logger()
+    servers = select_servers(args.servers)
+    if servers is None:
+        return False
+
+    cache_dir = args.mcp_cache or default_cache_dir(args.install_dir)
+    if args.dry_run:
+        for name, server_info in servers.items():
+            logger.info(f"[DRY RUN] Would prefetch {name} into {cache_dir}")
+        return True
+
+    cache = MCPPackageCache(cache_dir, runner=get_runner().run, registry=args.mcp_registry)
+    results = cache.prefetch(servers)
+
+    failed = [name for name, success in results.items() if not success]
+    fetched = len(results) - len(failed)
+    if not args.quiet:
+        print(f"\n{Colors.CYAN}{Colors.BRIGHT}MCP package cache{Colors.RESET}: {cache_dir}")
+        for name, success in results.items():
+            status = f"{Colors.GREEN}cached{Colors.RESET}" if success else f"{Colors.RED}failed{Colors.RESET}"
+            print(f"  {name:<22} {status}")
+        print(f"\nInstall from this cache with: SuperClaude install --mcp-cache {cache_dir}")
+
+    if failed:
+        logger.error(f"Failed to prefetch: {', '.join(failed)}")
+        return False
+    logger.success(f"Prefetched {fetched} MCP server packages")
+    return True
+
+
+def display_health_table(results: List[dict]) -> None:
+    """Display doctor results as a table"""
+    def ms(value) -> str:
+        return f"{value:.0f} ms" if value is not None else "-"
+
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}{'Server':<22} {'Status':<8} {'Startup':>10} "
+          f"{'Handshake':>10} {'Tools':>6}{Colors.RESET}")
+    print("-" * 60)
+    for result in sorted(results, key=lambda r: -(r["startup_ms"] or 0)):
+        color = {"ok": Colors.GREEN, "skipped": Colors.YELLOW}.get(result["status"], Colors.RED)
+        tools = str(result["tools"]) if result["tools"] is not None else "-"
+        print(f"{result['name']:<22} {color}{result['status']:<8}{Colors.RESET} "
+              f"{ms(result['startup_ms']):>10} {ms(result['handshake_ms']):>10} {tools:>6}")
+        if result["error"]:
+            print(f"  {Colors.RED}{result['error']}{Colors.RESET}")
+    print()
+
+
+def run_doctor(args: argparse.Namespace) -> bool:
+    """Start configured MCP servers concurrently and report their health"""
+    logger = get_logger()
+    registry = ClaudeConfigRegistry(args.claude_config)
+    try:
+        servers = registry.get_server_specs()
+    except ValueError as e:
+        logger.error(str(e))
+        return False
+
+    if args.servers:
+        missing = [name for name in args.servers if name not in servers]
+        if missing:
+            logger.error(f"Not configured in {registry.config_path}: {', '.join(missing)}")
+            return False
+        servers = {name: servers[name] for name in args.servers}
+
+    if not servers:
+        logger.warning(f"No MCP servers configured in {registry.config_path}")
+        return True
+
+    if args.dry_run:
+        for name in servers:
+            logger.info(f"[DRY RUN] Would start and check {name}")
+        return True
+
+    results = check_servers(servers, timeout=args.timeout, max_workers=args.jobs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    elif not args.quiet:
+        display_health_table(results)
+
+    failed = [result["name"] for result in results if result["status"] == "failed"]
+    if failed:
+        logger.error(f"MCP servers failing to start: {', '.join(failed)}")
+        return False
+    return True
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute mcp operation with parsed arguments"""
+    operation = MCPOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    expected_home = get_home_directory().resolve()
+    actual_dir = args.install_dir.resolve()
+
+    if not str(actual_dir).startswith(str(expected_home)):
+        print(f"\n[x] Installation must be inside your user profile directory.")
+        print(f"    Expected prefix: {expected_home}")
+        print(f"    Provided path:   {actual_dir}")
+        sys.exit(1)
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if not args.quiet and not args.json:
+            from setup.cli.base import __version__
+            display_header(
+                f"SuperClaude MCP v{__version__}",
+                "MCP server maintenance"
+            )
+
+        if args.action == "prefetch":
+            success = prefetch_packages(args)
+        elif args.action == "doctor":
+            success = run_doctor(args)
+        else:
+            logger.error(f"Unknown MCP action: {args.action}")
+            success = False
+
+        if success:
+            if not args.quiet and not args.json:
+                display_success(f"MCP {args.action} completed successfully!")
+            return 0
+        return 1
+
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}MCP operation cancelled by user{Colors.RESET}")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("mcp", e)
@@ -643,6 +643,17 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
         registry.discover_components()
         
+        # Remove dependents before the components they rely on
+        components = list(reversed(registry.dependency_graph.sort(components)))
+        removing = set(components)
+        for component_name in components:
+            left_behind = sorted(
+                dependent for dependent in registry.get_dependents(component_name, transitive=True)
+                if dependent in info["components"] and dependent not in removing
+            )
+            if left_behind:
+                logger.warning(f"{component_name} is still required by: {', '.join(left_behind)}")
+        
         # Create component instances
         component_instances = registry.create_component_instances(components, args.install_dir)
         
@@ -71,6 +71,57 @@ Examples:
         help="Create backup before update"
     )
     
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of MCP servers to install or verify concurrently (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--component-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Install components that share a dependency level concurrently, "
+             "N at a time (default: 1, one after another)"
+    )
+    
+    parser.add_argument(
+        "--mcp-backend",
+        choices=["cli", "config"],
+        default="cli",
+        help="Register MCP servers through the Claude CLI (default) or by "
+             "editing ~/.claude.json directly in one write"
+    )
+    
+    parser.add_argument(
+        "--mcp-cache",
+        type=Path,
+        metavar="DIR",
+        help="Resolve MCP server packages from a cache made by 'SuperClaude mcp prefetch'"
+    )
+    
+    parser.add_argument(
+        "--mcp-registry",
+        metavar="URL",
+        help="npm registry for MCP server packages (e.g. a local mirror)"
+    )
+    
+    parser.add_argument(
+        "--mcp-offline",
+        action="store_true",
+        help="Never download MCP server packages; use --mcp-cache only"
+    )
+    
+    parser.add_argument(
+        "--backup-format",
+        choices=["archive", "dedup"],
+        default="archive",
+        help="Backup format: archive (tar.gz, default) or dedup (content-addressed snapshot)"
+    )
+    
     parser.add_argument(
         "--no-backup",
         action="store_true",
@@ -175,23 +226,23 @@ def get_components_to_update(args: argparse.Namespace, installed_components: Dic
     return []
 
 
-def collect_api_keys_for_servers(selected_servers: List[str], mcp_instance) -> Dict[str, str]:
+def collect_api_keys_for_servers(selected_servers: List[str], mcp_servers: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
     """
     Collect API keys for servers that require them during update
     
     Args:
         selected_servers: List of selected server keys
-        mcp_instance: MCP component instance
+        mcp_servers: MCP server definitions (the MCP catalog)
         
     Returns:
         Dictionary of environment variable names to API key values
     """
     # Filter servers needing keys
     servers_needing_keys = [
-        (server_key, mcp_instance.mcp_servers[server_key])
+        (server_key, mcp_servers[server_key])
         for server_key in selected_servers
-        if server_key in mcp_instance.mcp_servers and
-           mcp_instance.mcp_servers[server_key].get("requires_api_key", False)
+        if server_key in mcp_servers and
+           mcp_servers[server_key].get("requires_api_key", False)
     ]
     
     if not servers_needing_keys:
@@ -276,6 +327,26 @@ def display_update_plan(components: List[str], available_updates: Dict[str, Dict
     print()
 
 
+def display_mcp_update_plan(registry: ComponentRegistry, install_dir: Path) -> None:
+    """Display which MCP servers the update will install or reinstall"""
+    instances = registry.create_component_instances(["mcp"], install_dir)
+    mcp_instance = instances.get("mcp")
+    if mcp_instance is None or not hasattr(mcp_instance, 'plan_update'):
+        return
+
+    plan = mcp_instance.plan_update()
+    if not plan:
+        return
+
+    print(f"{Colors.BLUE}MCP servers:{Colors.RESET}")
+    for server_name, action in plan.items():
+        if action == "unchanged":
+            print(f"  {server_name}: up to date")
+        else:
+            print(f"  {server_name}: {Colors.YELLOW}{action}{Colors.RESET} ({mcp_instance.get_server_spec(server_name)})")
+    print()
+
+
 def perform_update(components: List[str], args: argparse.Namespace, registry: ComponentRegistry) -> bool:
     """Perform the actual update"""
     logger = get_logger()
@@ -285,6 +356,10 @@ def perform_update(components: List[str], args: argparse.Namespace, registry: Co
         # Create installer
         installer = Installer(args.install_dir, dry_run=args.dry_run)
         
+        # Update dependencies before their dependents
+        registry.discover_components()
+        components = registry.dependency_graph.sort(components)
+        
         # Create component instances
         component_instances = registry.create_component_instances(components, args.install_dir)
         
@@ -294,14 +369,18 @@ def perform_update(components: List[str], args: argparse.Namespace, registry: Co
         
         # Handle MCP component specially - collect API keys for new servers
         collected_api_keys = {}
+        installed_servers = []
         if "mcp" in components and "mcp" in component_instances:
             mcp_instance = component_instances["mcp"]
             if hasattr(mcp_instance, 'mcp_servers'):
-                # Get all available MCP servers
-                all_server_keys = list(mcp_instance.mcp_servers.keys())
+                # Only servers the user installed are updated
+                installed_servers = [
+                    name for name in mcp_instance.settings_manager.get_metadata_setting("mcp.servers", []) or []
+                    if name in mcp_instance.mcp_servers
+                ]
                 
                 # Collect API keys for any servers that require them
-                collected_api_keys = collect_api_keys_for_servers(all_server_keys, mcp_instance)
+                collected_api_keys = collect_api_keys_for_servers(installed_servers, mcp_instance.mcp_servers)
                 
                 # Set up environment variables if any keys were collected
                 if collected_api_keys:
@@ -331,9 +410,16 @@ def perform_update(components: List[str], args: argparse.Namespace, registry: Co
         config = {
             "force": args.force,
             "backup": backup,
+            "backup_format": getattr(args, 'backup_format', "archive"),
             "dry_run": args.dry_run,
             "update_mode": True,
-            "selected_mcp_servers": list(mcp_instance.mcp_servers.keys()) if "mcp" in component_instances else []
+            "component_jobs": getattr(args, 'component_jobs', 1),
+            "mcp_jobs": getattr(args, 'mcp_jobs', 4),
+            "mcp_backend": getattr(args, 'mcp_backend', "cli"),
+            "mcp_cache": getattr(args, 'mcp_cache', None),
+            "mcp_registry": getattr(args, 'mcp_registry', None),
+            "mcp_offline": getattr(args, 'mcp_offline', False),
+            "selected_mcp_servers": installed_servers if "mcp" in component_instances else []
         }
         
         success = installer.update_components(components, config)
@@ -450,6 +536,8 @@ def run(args: argparse.Namespace) -> int:
         # Display update plan
         if not args.quiet:
             display_update_plan(components, available_updates, installed_components, args.install_dir)
+            if "mcp" in components:
+                display_mcp_update_plan(registry, args.install_dir)
             
             if not args.dry_run:
                 if not args.yes and not confirm("Proceed with update?", default=True):
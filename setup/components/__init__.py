@@ -1,11 +1,25 @@
 """Component implementations for SuperClaude installation system"""
 
-from .core import CoreComponent
-from .commands import CommandsComponent
-from .mcp import MCPComponent
-from .agents import AgentsComponent
-from .modes import ModesComponent
-from .mcp_docs import MCPDocsComponent
+import importlib
+
+# Component modules are imported on first attribute access so that loading
+# one component does not import all of them
+_COMPONENT_MODULES = {
+    'CoreComponent': 'core',
+    'CommandsComponent': 'commands',
+    'MCPComponent': 'mcp',
+    'AgentsComponent': 'agents',
+    'ModesComponent': 'modes',
+    'MCPDocsComponent': 'mcp_docs'
+}
+
+
+def __getattr__(name):
+    module_name = _COMPONENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+
 
 __all__ = [
     'CoreComponent',
@@ -14,4 +28,4 @@ __all__ = [
     'AgentsComponent',
     'ModesComponent',
     'MCPDocsComponent'
-]
\ No newline at end of file
+]
@@ -12,19 +12,15 @@ from setup import __version__
 class AgentsComponent(Component):
     """SuperClaude specialized AI agents component"""
     
+    NAME = "agents"
+    DESCRIPTION = "15 specialized AI agents with domain expertise and intelligent routing"
+    CATEGORY = "agents"
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize agents component"""
         super().__init__(install_dir, Path("agents"))
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "agents",
-            "version": __version__,
-            "description": "15 specialized AI agents with domain expertise and intelligent routing",
-            "category": "agents"
-        }
-    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for agents"""
         return {
@@ -115,10 +111,6 @@ class AgentsComponent(Component):
             self.logger.exception(f"Unexpected error during agents uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get component dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update agents component"""
         try:
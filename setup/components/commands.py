@@ -11,19 +11,15 @@ from setup import __version__
 class CommandsComponent(Component):
     """SuperClaude slash commands component"""
     
+    NAME = "commands"
+    DESCRIPTION = "SuperClaude slash command definitions"
+    CATEGORY = "commands"
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize commands component"""
         super().__init__(install_dir, Path("commands/sc"))
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "commands",
-            "version": __version__,
-            "description": "SuperClaude slash command definitions",
-            "category": "commands"
-        }
-    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for commands component"""
         return {
@@ -143,10 +139,6 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update commands component"""
         try:
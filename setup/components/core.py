@@ -13,19 +13,15 @@ from setup import __version__
 class CoreComponent(Component):
     """Core SuperClaude framework files component"""
     
+    NAME = "core"
+    DESCRIPTION = "SuperClaude framework documentation and core files"
+    CATEGORY = "core"
+    DEPENDENCIES = ()
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize core component"""
         super().__init__(install_dir)
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "core",
-            "version": __version__,
-            "description": "SuperClaude framework documentation and core files",
-            "category": "core"
-        }
-    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for SuperClaude"""
         return {
@@ -129,10 +125,6 @@ class CoreComponent(Component):
             self.logger.exception(f"Unexpected error during core uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get component dependencies (core has none)"""
-        return []
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update core component"""
         try:
@@ -2,99 +2,109 @@
 MCP component for MCP server integration
 """
 
+import copy
 import os
-import platform
 import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from setup import __version__
 
 from ..core.base import Component
+from ..services.mcp_catalog import get_mcp_catalog
+from ..services.mcp_cache import MCPPackageCache, default_cache_dir
+from ..services.mcp_registry import ClaudeConfigRegistry, load_server_templates, parse_mcp_list_output
+from ..services.tool_probe import PROBE_CACHE_FILE, ToolProbeService
+from ..utils.paths import CACHE_DIR
+from ..utils.process import get_runner
 from ..utils.ui import display_info, display_warning
 
 
+# Default number of MCP servers installed or verified concurrently
+DEFAULT_MCP_JOBS = 4
+
+_server_templates: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _get_server_templates() -> Dict[str, Dict[str, Any]]:
+    """Load the MCP server templates shipped in SuperClaude/MCP/configs once"""
+    global _server_templates
+    if _server_templates is None:
+        configs_dir = Path(__file__).parent.parent.parent / "SuperClaude" / "MCP" / "configs"
+        _server_templates = load_server_templates(configs_dir)
+    return _server_templates
+
+
+def _npm_package(command: List[str]) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Get the package an npx command line runs
+
+    Args:
+        command: Command and arguments, e.g. ["npx", "-y", "tavily-mcp@0.1.2"]
+
+    Returns:
+        (package name, version or None), or None if this is not an npx command
+    """
+    if not command or Path(command[0]).stem.lower() != "npx":
+        return None
+    for arg in command[1:]:
+        if arg.startswith("-"):
+            continue
+        # The leading "@" of a scoped package is not a version separator
+        name, separator, version = arg[1:].partition("@")
+        return (arg[0] + name, version or None) if separator else (arg, None)
+    return None
+
+
 class MCPComponent(Component):
     """MCP servers integration component"""
     
+    NAME = "mcp"
+    DESCRIPTION = "MCP server integration (Context7, Sequential, Magic, Playwright)"
+    CATEGORY = "integration"
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
         self.installed_servers_in_session: List[str] = []
         
-        # Define MCP servers to install
-        self.mcp_servers = {
-            "sequential-thinking": {
-                "name": "sequential-thinking",
-                "description": "Multi-step problem solving and systematic analysis",
-                "npm_package": "@modelcontextprotocol/server-sequential-thinking",
-                "required": True
-            },
-            "context7": {
-                "name": "context7", 
-                "description": "Official library documentation and code examples",
-                "npm_package": "@upstash/context7-mcp",
-                "required": True
-            },
-            "magic": {
-                "name": "magic",
-                "description": "Modern UI component generation and design systems",
-                "npm_package": "@21st-dev/magic",
-                "required": False,
-                "api_key_env": "TWENTYFIRST_API_KEY",
-                "api_key_description": "21st.dev API key for UI component generation"
-            },
-            "playwright": {
-                "name": "playwright",
-                "description": "Cross-browser E2E testing and automation",
-                "npm_package": "@playwright/mcp@latest",
-                "required": False
-            },
-            "serena": {
-                "name": "serena",
-                "description": "Semantic code analysis and intelligent editing",
-                "install_method": "github",
-                "install_command": "uvx --from git+https://github.com/oraios/serena serena --help",
-                "run_command": "uvx --from git+https://github.com/oraios/serena serena start-mcp-server --context ide-assistant",
-                "required": False
-            },
-            "morphllm-fast-apply": {
-                "name": "morphllm-fast-apply",
-                "description": "Fast Apply capability for context-aware code modifications",
-                "npm_package": "@morph-llm/morph-fast-apply",
-                "required": False,
-                "api_key_env": "MORPH_API_KEY",
-                "api_key_description": "Morph API key for Fast Apply"
-            },
-            "tavily": {
-                "name": "tavily",
-                "description": "Web search and real-time information retrieval for deep research",
-                "install_method": "npm",
-                "install_command": "npx -y tavily-mcp@0.1.2",
-                "required": False,
-                "api_key_env": "TAVILY_API_KEY",
-                "api_key_description": "Tavily API key for web search (get from https://app.tavily.com)"
-            },
-            "chrome-devtools": {
-                "name": "chrome-devtools",
-                "description": "Chrome DevTools debugging and performance analysis",
-                "install_method": "npm",
-                "install_command": "npx -y chrome-devtools-mcp@latest",
-                "required": False
-            }
-        }
+        # Snapshot of `claude mcp list` shared by every check in this session;
+        # dropped whenever a server is added or removed
+        self._server_list_output: Optional[str] = None
+        self._server_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._server_list_lock = threading.Lock()
+        # `claude mcp add/remove` rewrite the same config file, so they never overlap
+        self._registration_lock = threading.Lock()
+        
+        # Optional in-process .claude.json backend ("config"); the Claude CLI
+        # stays the default and the fallback
+        self._config_registry: Optional[ClaudeConfigRegistry] = None
+        # (server name, command) in staging order; a reinstall stages a
+        # remove and then an add for the same server
+        self._pending_cli_commands: List[Tuple[str, List[str]]] = []
+        
+        # Local npm/uv package cache (--mcp-cache) used while installing
+        # and by the registered servers at runtime
+        self._package_cache: Optional[MCPPackageCache] = None
+        
+        # Registered command line of each managed server ("mcp.server_specs"),
+        # compared against the target spec to decide what an update touches
+        self._server_specs: Dict[str, str] = {}
+        
+        # node/npm/claude/uv lookups, shared across checks and cached on disk
+        self._tool_probe = ToolProbeService(
+            self.install_dir / CACHE_DIR / PROBE_CACHE_FILE,
+            runner=self._run_command_cross_platform
+        )
+        
+        # MCP server definitions come from the shared catalog (read-only)
+        self.mcp_servers = get_mcp_catalog().servers
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "mcp",
-            "version": __version__,
-            "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
-            "category": "integration"
-        }
-
     def is_reinstallable(self) -> bool:
         """This component manages sub-components (servers) and should be re-run."""
         return True
@@ -107,96 +117,203 @@ class MCPComponent(Component):
             cmd: Command as list of strings
             **kwargs: Additional subprocess.run arguments
 
+        Returns:
+            CompletedProcess result (exit status 127 if the command is not on
+            PATH; set SUPERCLAUDE_SHELL_FALLBACK=1 to resolve shell aliases)
+        """
+        if self._package_cache is not None and "env" not in kwargs:
+            kwargs["env"] = {**os.environ, **self._package_cache.environment()}
+        return get_runner().run(cmd, **kwargs)
+    
+    def _mcp_add_command(self, server_name: str) -> List[str]:
+        """
+        Get the `claude mcp add` prefix for a server
+        
+        When a package cache is in use, its environment is registered with
+        the server so npx/uvx resolve packages from the cache at runtime.
+        
+        Args:
+            server_name: Server name
+            
+        Returns:
+            Command up to and including the server name; append the run command
+        """
+        cmd = ["claude", "mcp", "add", "-s", "user"]
+        if self._package_cache is not None:
+            for key, value in self._package_cache.environment().items():
+                cmd += ["-e", f"{key}={value}"]
+        return cmd + ["--", server_name]
+    
+    def _run_mcp_change(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a `claude mcp add/remove` command and drop the listing snapshot
+        
+        Changes are serialized even when servers are installed concurrently.
+        
+        Args:
+            cmd: Command as list of strings
+            **kwargs: Additional subprocess.run arguments
+            
         Returns:
             CompletedProcess result
         """
-        if platform.system() == "Windows":
-            # On Windows, wrap command in 'cmd /c' to properly handle commands like npx
-            cmd = ["cmd", "/c"] + cmd
-            return subprocess.run(cmd, **kwargs)
+        with self._registration_lock:
+            try:
+                if self._config_registry is not None:
+                    return self._stage_config_change(cmd)
+                return self._run_command_cross_platform(cmd, **kwargs)
+            finally:
+                self._invalidate_server_list()
+    
+    def _use_config_backend(self, config: Dict[str, Any]) -> None:
+        """
+        Select the MCP registry backend for this session
+        
+        Args:
+            config: Installation configuration ("mcp_backend": "cli" or "config")
+        """
+        self._config_registry = None
+        if config.get("mcp_backend", "cli") != "config":
+            return
+
+        registry = ClaudeConfigRegistry(config.get("claude_config_path"))
+        try:
+            registry.list_servers()
+        except ValueError as e:
+            self.logger.warning(f"{e} - falling back to the Claude CLI")
+            return
+
+        self.logger.debug(f"Managing MCP servers directly in {registry.config_path}")
+        self._config_registry = registry
+        self._invalidate_server_list()
+    
+    def _stage_config_change(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Translate a `claude mcp add/remove` command into a staged registry change
+        
+        Args:
+            cmd: ["claude", "mcp", "add", ..., "--", name, *run_args] or
+                 ["claude", "mcp", "remove", name]
+            
+        Returns:
+            Successful CompletedProcess (nothing is written until flush)
+        """
+        if cmd[2] == "remove":
+            name = cmd[3]
+            self._config_registry.remove_server(name)
         else:
-            # macOS/Linux: Use string format with proper shell to support aliases
-            cmd_str = " ".join(shlex.quote(str(arg)) for arg in cmd)
+            separator = cmd.index("--")
+            name, run_args = cmd[separator + 1], cmd[separator + 2:]
+            spec = self._build_server_spec(name, run_args)
+            options = cmd[:separator]
+            for i, option in enumerate(options[:-1]):
+                if option == "-e" and "=" in options[i + 1]:
+                    key, value = options[i + 1].split("=", 1)
+                    spec["env"][key] = value
+            self._config_registry.add_server(name, spec)
+
+        self._pending_cli_commands.append((name, cmd))
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+    
+    def _build_server_spec(self, server_name: str, run_args: List[str]) -> Dict[str, Any]:
+        """
+        Build the .claude.json entry for a server
+        
+        The template from SuperClaude/MCP/configs is used when there is one;
+        empty env placeholders are filled from the environment or dropped.
+        
+        Args:
+            server_name: Server name
+            run_args: Command line the CLI backend would register
+            
+        Returns:
+            mcpServers entry
+        """
+        template = _get_server_templates().get(server_name)
+        if not template:
+            return {"type": "stdio", "command": run_args[0], "args": run_args[1:], "env": {}}
+
+        spec = copy.deepcopy(template)
+        env = {}
+        for key, value in spec.get("env", {}).items():
+            value = value or os.environ.get(key, "")
+            if value:
+                env[key] = value
+        spec["env"] = env
+
+        # Keep project-specific arguments (Serena's --project) from the run command
+        if "--project" in run_args:
+            spec["args"] = list(spec.get("args", [])) + run_args[run_args.index("--project"):]
+        return spec
+    
+    def _flush_config_backend(self) -> List[str]:
+        """
+        Write staged registry changes in one go, falling back to the CLI
+        
+        Returns:
+            Names of servers whose registration could not be written
+        """
+        if self._config_registry is None or not self._config_registry.has_pending_changes():
+            return []
 
-            # Use the user's shell to execute the command, supporting aliases
-            user_shell = os.environ.get('SHELL', '/bin/bash')
-            return subprocess.run(cmd_str, shell=True, env=os.environ, executable=user_shell, **kwargs)
+        pending = list(self._pending_cli_commands)
+        self._pending_cli_commands.clear()
+        try:
+            self._config_registry.flush()
+            self.logger.success(f"Wrote {len(pending)} MCP server changes to {self._config_registry.config_path}")
+            return []
+        except (ValueError, OSError) as e:
+            self.logger.warning(f"Could not write {self._config_registry.config_path}: {e} - falling back to the Claude CLI")
+
+        self._config_registry = None
+        failed = []
+        for name, cmd in pending:
+            result = self._run_mcp_change(cmd, capture_output=True, text=True, timeout=120)
+            if result.returncode != 0:
+                self.logger.error(f"Failed to register MCP server {name}: {result.stderr.strip() if result.stderr else 'Unknown error'}")
+                if name not in failed:
+                    failed.append(name)
+        return failed
     
     def validate_prerequisites(self, installSubPath: Optional[Path] = None) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
 
-        # Check if Node.js is available
-        try:
-            result = self._run_command_cross_platform(
-                ["node", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("Node.js not found - required for MCP servers")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Node.js {version}")
+        probes = self._tool_probe.probe_many(["node", "claude", "npm", "uv"])
 
-                # Check version (require 18+)
-                try:
-                    version_num = int(version.lstrip('v').split('.')[0])
-                    if version_num < 18:
-                        errors.append(f"Node.js version {version} found, but version 18+ required")
-                except:
-                    self.logger.warning(f"Could not parse Node.js version: {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if Node.js is available
+        node = probes["node"]
+        if not node["available"]:
             errors.append("Node.js not found - required for MCP servers")
+        else:
+            version = node["version"]
+            self.logger.debug(f"Found Node.js {version}")
+
+            # Check version (require 18+)
+            try:
+                version_num = int(version.lstrip('v').split('.')[0])
+                if version_num < 18:
+                    errors.append(f"Node.js version {version} found, but version 18+ required")
+            except:
+                self.logger.warning(f"Could not parse Node.js version: {version}")
 
         # Check if Claude CLI is available
-        try:
-            result = self._run_command_cross_platform(
-                ["claude", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("Claude CLI not found - required for MCP server management")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Claude CLI {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if not probes["claude"]["available"]:
             errors.append("Claude CLI not found - required for MCP server management")
+        else:
+            self.logger.debug(f"Found Claude CLI {probes['claude']['version']}")
 
         # Check if npm is available
-        try:
-            result = self._run_command_cross_platform(
-                ["npm", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("npm not found - required for MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found npm {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if not probes["npm"]["available"]:
             errors.append("npm not found - required for MCP server installation")
+        else:
+            self.logger.debug(f"Found npm {probes['npm']['version']}")
 
         # Check if uv is available (required for Serena)
-        try:
-            result = self._run_command_cross_platform(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                self.logger.warning("uv not found - required for Serena MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found uv {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if not probes["uv"]["available"]:
             self.logger.warning("uv not found - required for Serena MCP server installation")
+        else:
+            self.logger.debug(f"Found uv {probes['uv']['version']}")
 
         return len(errors) == 0, errors
     
@@ -217,6 +334,7 @@ class MCPComponent(Component):
             "mcp": {
                 "enabled": True,
                 "servers": self.installed_servers_in_session,
+                "server_specs": dict(self._server_specs),
                 "auto_update": False
             }
         }
@@ -242,17 +360,7 @@ class MCPComponent(Component):
                 return True
 
             # Check if uv is available
-            try:
-                uv_check = self._run_command_cross_platform(
-                    ["uv", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if uv_check.returncode != 0:
-                    self.logger.error(f"uv not found - required for {server_name} installation")
-                    return False
-            except (subprocess.TimeoutExpired, FileNotFoundError):
+            if not self._tool_probe.probe("uv")["available"]:
                 self.logger.error(f"uv not found - required for {server_name} installation")
                 return False
 
@@ -280,12 +388,12 @@ class MCPComponent(Component):
                     current_dir = os.getcwd()
                     serena_run_cmd = f"{run_command} --project {shlex.quote(current_dir)}"
                     self.logger.info(f"Registering {server_name} with Claude CLI for project: {current_dir}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(serena_run_cmd)
+                    reg_cmd = self._mcp_add_command(server_name) + shlex.split(serena_run_cmd)
                 else:
                     self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
+                    reg_cmd = self._mcp_add_command(server_name) + shlex.split(run_command)
 
-                reg_result = self._run_command_cross_platform(
+                reg_result = self._run_mcp_change(
                     reg_cmd,
                     capture_output=True,
                     text=True,
@@ -333,17 +441,7 @@ class MCPComponent(Component):
                 return True
 
             # Check if uvx is available
-            try:
-                uvx_check = self._run_command_cross_platform(
-                    ["uvx", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if uvx_check.returncode != 0:
-                    self.logger.error(f"uvx not found - required for {server_name} installation")
-                    return False
-            except (subprocess.TimeoutExpired, FileNotFoundError):
+            if not self._tool_probe.probe("uvx")["available"]:
                 self.logger.error(f"uvx not found - required for {server_name} installation")
                 return False
 
@@ -367,9 +465,9 @@ class MCPComponent(Component):
 
                 # Register with Claude CLI using the run command
                 self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
+                reg_cmd = self._mcp_add_command(server_name) + shlex.split(run_command)
 
-                reg_result = self._run_command_cross_platform(
+                reg_result = self._run_mcp_change(
                     reg_cmd,
                     capture_output=True,
                     text=True,
@@ -395,27 +493,63 @@ class MCPComponent(Component):
             self.logger.error(f"Error installing MCP server {server_name} from GitHub: {e}")
             return False
 
-    def _check_mcp_server_installed(self, server_name: str) -> bool:
-        """Check if MCP server is already installed"""
-        try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+    def _list_mcp_servers(self) -> Optional[str]:
+        """
+        Get the `claude mcp list` output for this session
+        
+        The CLI is only run when no snapshot exists yet or the last one was
+        invalidated by an add or remove.
+        
+        Returns:
+            Listing output, or None if the Claude CLI could not be queried
+        """
+        with self._server_list_lock:
+            if self._server_list_output is not None:
+                return self._server_list_output
+
+            try:
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "list"],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+                self.logger.warning(f"Error checking MCP server status: {e}")
+                return None
 
             if result.returncode != 0:
                 self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
+                return None
 
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+            self._server_list_output = result.stdout
+            self._server_index = parse_mcp_list_output(result.stdout)
+            return self._server_list_output
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            self.logger.warning(f"Error checking MCP server status: {e}")
-            return False
+    def _get_server_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get the parsed server listing for this session
+        
+        Returns:
+            Dict of lowercased server name -> {name, command, args, scope, status},
+            or None if the Claude CLI could not be queried
+        """
+        if self._config_registry is not None:
+            return self._config_registry.list_servers()
+        if self._list_mcp_servers() is None:
+            return None
+        return self._server_index
+
+    def _invalidate_server_list(self) -> None:
+        """Drop the listing snapshot after the set of servers changed"""
+        with self._server_list_lock:
+            self._server_list_output = None
+            self._server_index = None
+
+    def _check_mcp_server_installed(self, server_name: str) -> bool:
+        """Check if MCP server is already installed"""
+        index = self._get_server_index()
+        return index is not None and server_name.lower() in index
 
     def _detect_existing_mcp_servers_from_config(self) -> List[str]:
         """Detect existing MCP servers from Claude Desktop config"""
@@ -466,27 +600,14 @@ class MCPComponent(Component):
         detected_servers = []
 
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                self.logger.debug(f"Could not list MCP servers: {result.stderr}")
+            index = self._get_server_index()
+            if index is None:
                 return detected_servers
 
-            # Parse the output to extract server names
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines:
-                line = line.strip().lower()
-                if line and not line.startswith('#') and not line.startswith('no'):
-                    # Extract server name (usually the first word or before first space/colon)
-                    server_name = line.split()[0] if line.split() else ""
-                    normalized_name = self._normalize_server_name(server_name)
-                    if normalized_name and normalized_name in self.mcp_servers:
-                        detected_servers.append(normalized_name)
+            for server_name in index:
+                normalized_name = self._normalize_server_name(server_name)
+                if normalized_name and normalized_name in self.mcp_servers:
+                    detected_servers.append(normalized_name)
 
             if detected_servers:
                 self.logger.info(f"Detected existing MCP servers from CLI: {detected_servers}")
@@ -498,25 +619,7 @@ class MCPComponent(Component):
 
     def _normalize_server_name(self, server_name: str) -> Optional[str]:
         """Normalize server name to match our internal naming"""
-        if not server_name:
-            return None
-
-        server_name = server_name.lower().strip()
-
-        # Map common variations to our standard names
-        name_mappings = {
-            "context7": "context7",
-            "sequential-thinking": "sequential-thinking",
-            "sequential": "sequential-thinking",
-            "magic": "magic",
-            "playwright": "playwright",
-            "serena": "serena",
-            "morphllm": "morphllm-fast-apply",
-            "morphllm-fast-apply": "morphllm-fast-apply",
-            "morph": "morphllm-fast-apply"
-        }
-
-        return name_mappings.get(server_name)
+        return get_mcp_catalog().resolve(server_name)
 
     def _merge_server_lists(self, existing_servers: List[str], selected_servers: List[str], previous_servers: List[str]) -> List[str]:
         """Merge existing, selected, and previously installed servers"""
@@ -585,29 +688,30 @@ class MCPComponent(Component):
             # Install using Claude CLI
             if install_command:
                 # Use the full install command (e.g., for tavily-mcp@0.1.2)
-                install_args = install_command.split()
+                add_cmd = self._mcp_add_command(server_name) + install_command.split()
                 if config.get("dry_run"):
-                    self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {' '.join(install_args)}")
+                    self.logger.info(f"Would install MCP server (user scope): {' '.join(add_cmd)}")
                     return True
                 
-                self.logger.debug(f"Running: claude mcp add -s user {server_name} {' '.join(install_args)}")
+                self.logger.debug(f"Running: {' '.join(add_cmd)}")
                 
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name] + install_args,
+                result = self._run_mcp_change(
+                    add_cmd,
                     capture_output=True,
                     text=True,
                     timeout=120  # 2 minutes timeout for installation
                 )
             else:
                 # Use npm_package
+                add_cmd = self._mcp_add_command(server_name) + [command, "-y", npm_package]
                 if config.get("dry_run"):
-                    self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {command} -y {npm_package}")
+                    self.logger.info(f"Would install MCP server (user scope): {' '.join(add_cmd)}")
                     return True
                 
-                self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
+                self.logger.debug(f"Running: {' '.join(add_cmd)}")
                 
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
+                result = self._run_mcp_change(
+                    add_cmd,
                     capture_output=True,
                     text=True,
                     timeout=120  # 2 minutes timeout for installation
@@ -628,6 +732,105 @@ class MCPComponent(Component):
             self.logger.error(f"Error installing MCP server {server_name}: {e}")
             return False
     
+    def _ensure_mcp_server(self, server_name: str, config: Dict[str, Any],
+                           action: Optional[str] = None) -> bool:
+        """
+        Verify one MCP server is installed, installing it if needed
+        
+        Args:
+            server_name: Server name from self.mcp_servers
+            config: Installation configuration
+            action: Planned update action ("install", "reinstall" or
+                    "unchanged"), None outside of updates
+            
+        Returns:
+            True if the server is installed
+        """
+        if action == "unchanged":
+            self.logger.info(f"MCP server {server_name} is up to date")
+            return True
+
+        if action == "reinstall":
+            if config.get("dry_run"):
+                self.logger.info(f"Would reinstall MCP server {server_name}: {self.get_server_spec(server_name)}")
+                return True
+            if not self._uninstall_mcp_server(server_name):
+                return False
+        elif self._check_mcp_server_installed(server_name):
+            # Check if already installed and working
+            self.logger.info(f"MCP server {server_name} already installed and working")
+            return True
+
+        if not self._install_mcp_server(self.mcp_servers[server_name], config):
+            return False
+        if not config.get("dry_run"):
+            self._server_specs[server_name] = self.get_server_spec(server_name)
+        return True
+    
+    def get_server_spec(self, server_name: str) -> str:
+        """
+        Get the command line SuperClaude registers for a server
+        
+        Args:
+            server_name: Server name from self.mcp_servers
+            
+        Returns:
+            e.g. "npx -y @upstash/context7-mcp" (package versions included)
+        """
+        server_info = self.mcp_servers[server_name]
+        if server_info.get("install_method") in ("uv", "github"):
+            return server_info.get("run_command", "")
+        if server_info.get("install_command"):
+            return server_info["install_command"]
+        return f"npx -y {server_info.get('npm_package', '')}"
+    
+    def plan_update(self, server_names: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Decide which servers an update needs to touch
+        
+        The spec recorded at install time is compared with the target spec.
+        Servers installed before specs were recorded are compared with the
+        command line in the `claude mcp list` output instead: npx servers by
+        package name and version, others by the whole command line.
+        
+        Args:
+            server_names: Servers to plan for (default: the installed servers
+                          recorded in metadata)
+            
+        Returns:
+            Dict of server name -> "install", "reinstall" or "unchanged"
+        """
+        if server_names is None:
+            server_names = self.settings_manager.get_metadata_setting("mcp.servers", []) or []
+        recorded = self.settings_manager.get_metadata_setting("mcp.server_specs", {}) or {}
+        index = self._get_server_index()
+
+        plan = {}
+        for name in server_names:
+            if name not in self.mcp_servers:
+                continue
+            target = self.get_server_spec(name)
+            entry = index.get(name.lower()) if index is not None else None
+
+            if index is not None and entry is None:
+                plan[name] = "install"
+            elif name in recorded:
+                plan[name] = "unchanged" if recorded[name] == target else "reinstall"
+            elif entry is not None and entry.get("command"):
+                registered = [entry["command"]] + entry.get("args", [])
+                target_command = shlex.split(target)
+                registered_package = _npm_package(registered)
+                target_package = _npm_package(target_command)
+                if registered_package is not None and target_package is not None:
+                    unchanged = registered_package == target_package
+                else:
+                    unchanged = registered == target_command
+                plan[name] = "unchanged" if unchanged else "reinstall"
+            else:
+                # Nothing to compare against; keep the registration as is
+                plan[name] = "unchanged"
+        return plan
+    
     def _uninstall_mcp_server(self, server_name: str) -> bool:
         """Uninstall a single MCP server"""
         try:
@@ -640,7 +843,7 @@ class MCPComponent(Component):
             
             self.logger.debug(f"Running: claude mcp remove {server_name} (auto-detect scope)")
             
-            result = self._run_command_cross_platform(
+            result = self._run_mcp_change(
                 ["claude", "mcp", "remove", server_name],
                 capture_output=True,
                 text=True,
@@ -673,6 +876,16 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
 
+        self._use_config_backend(config)
+
+        if config.get("mcp_cache") or config.get("mcp_registry") or config.get("mcp_offline"):
+            self._package_cache = MCPPackageCache(
+                Path(config.get("mcp_cache") or default_cache_dir(self.install_dir)),
+                registry=config.get("mcp_registry"),
+                offline=config.get("mcp_offline", False)
+            )
+            self.logger.info(f"Resolving MCP server packages from {self._package_cache.cache_dir}")
+
         # Auto-detect existing servers
         self.logger.info("Auto-detecting existing MCP servers...")
         existing_from_config = self._detect_existing_mcp_servers_from_config()
@@ -695,34 +908,63 @@ class MCPComponent(Component):
 
         self.logger.info(f"Managing MCP servers: {', '.join(all_servers)}")
 
-        # Install/verify each server
-        installed_count = 0
-        failed_servers = []
-        verified_servers = []
+        # Install/verify servers concurrently; each server is independent
+        jobs = max(1, config.get("mcp_jobs") or DEFAULT_MCP_JOBS)
+        results: Dict[str, bool] = {}
+        required_failed = None
+
+        unknown_servers = [name for name in all_servers if name not in self.mcp_servers]
+        for server_name in unknown_servers:
+            self.logger.warning(f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude")
+        known_servers = [name for name in all_servers if name in self.mcp_servers]
+
+        # Updates only touch servers whose spec differs from the target
+        plan: Dict[str, str] = {}
+        if config.get("update_mode"):
+            plan = self.plan_update(known_servers)
+            changed = [name for name in known_servers if plan.get(name) != "unchanged"]
+            self.logger.info(f"MCP update plan: {len(changed)} of {len(known_servers)} servers to change")
+            for name in changed:
+                self.logger.info(f"  - {plan[name]} {name}: {self.get_server_spec(name)}")
+
+        recorded_specs = self.settings_manager.get_metadata_setting("mcp.server_specs", {}) or {}
+        self._server_specs = {
+            name: spec for name, spec in recorded_specs.items() if name in self.mcp_servers
+        }
+
+        with ThreadPoolExecutor(max_workers=min(jobs, max(1, len(known_servers)))) as executor:
+            futures = {
+                executor.submit(self._ensure_mcp_server, name, config, plan.get(name)): name
+                for name in known_servers
+            }
+            for future in as_completed(futures):
+                server_name = futures[future]
+                try:
+                    results[server_name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"[{server_name}] Unexpected error: {e}")
+                    results[server_name] = False
+
+                if not results[server_name] and self.mcp_servers[server_name].get("required", False):
+                    required_failed = server_name
+                    # Stop servers that have not started yet; running ones finish
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
-        for server_name in all_servers:
-            if server_name in self.mcp_servers:
-                server_info = self.mcp_servers[server_name]
+        if required_failed:
+            self.logger.error(f"Required MCP server {required_failed} failed to install")
+            return False
 
-                # Check if already installed and working
-                if self._check_mcp_server_installed(server_name):
-                    self.logger.info(f"MCP server {server_name} already installed and working")
-                    installed_count += 1
-                    verified_servers.append(server_name)
-                else:
-                    # Try to install
-                    if self._install_mcp_server(server_info, config):
-                        installed_count += 1
-                        verified_servers.append(server_name)
-                    else:
-                        failed_servers.append(server_name)
-
-                        # Check if this is a required server
-                        if server_info.get("required", False):
-                            self.logger.error(f"Required MCP server {server_name} failed to install")
-                            return False
-            else:
-                self.logger.warning(f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude")
+        # The config backend writes every registration at once
+        if not config.get("dry_run", False):
+            for server_name in self._flush_config_backend():
+                results[server_name] = False
+
+        # Keep the original order for metadata and reporting
+        verified_servers = [name for name in known_servers if results.get(name)]
+        failed_servers = [name for name in known_servers if name in results and not results[name]]
+        installed_count = len(verified_servers)
 
         # Update the list of successfully managed servers
         self.installed_servers_in_session = verified_servers
@@ -731,16 +973,11 @@ class MCPComponent(Component):
         if not config.get("dry_run", False):
             self.logger.info("Verifying MCP server installation...")
             try:
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+                output = self._list_mcp_servers()
 
-                if result.returncode == 0:
+                if output is not None:
                     self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split('\n'):
+                    for line in output.strip().split('\n'):
                         if line.strip():
                             self.logger.debug(f"  {line.strip()}")
                 else:
@@ -810,68 +1047,15 @@ class MCPComponent(Component):
             self.logger.exception(f"Unexpected error during MCP uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
-        """Update MCP component"""
-        try:
-            self.logger.info("Updating SuperClaude MCP servers...")
-            
-            # Check current version
-            current_version = self.settings_manager.get_component_version("mcp")
-            target_version = self.get_metadata()["version"]
-            
-            if current_version == target_version:
-                self.logger.info(f"MCP component already at version {target_version}")
-                return True
-            
-            self.logger.info(f"Updating MCP component from {current_version} to {target_version}")
-            
-            # For MCP servers, update means reinstall to get latest versions
-            updated_count = 0
-            failed_servers = []
-            
-            for server_name, server_info in self.mcp_servers.items():
-                try:
-                    # Uninstall old version
-                    if self._check_mcp_server_installed(server_name):
-                        self._uninstall_mcp_server(server_name)
-                    
-                    # Install new version
-                    if self._install_mcp_server(server_info, config):
-                        updated_count += 1
-                    else:
-                        failed_servers.append(server_name)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error updating MCP server {server_name}: {e}")
-                    failed_servers.append(server_name)
-            
-            # Update metadata
-            try:
-                # Update component version in metadata
-                metadata = self.settings_manager.load_metadata()
-                if "components" in metadata and "mcp" in metadata["components"]:
-                    metadata["components"]["mcp"]["version"] = target_version
-                    metadata["components"]["mcp"]["servers_count"] = len(self.mcp_servers)
-                if "mcp" in metadata:
-                    metadata["mcp"]["servers"] = list(self.mcp_servers.keys())
-                self.settings_manager.save_metadata(metadata)
-            except Exception as e:
-                self.logger.warning(f"Could not update metadata: {e}")
-            
-            if failed_servers:
-                self.logger.warning(f"Some MCP servers failed to update: {failed_servers}")
-                return False
-            else:
-                self.logger.success(f"MCP component updated to version {target_version}")
-                return True
-            
-        except Exception as e:
-            self.logger.exception(f"Unexpected error during MCP update: {e}")
-            return False
+        """
+        Update MCP component
+
+        Runs the install flow in update mode, the same way the installer
+        does, so only servers whose spec changed are reinstalled (see
+        plan_update).
+        """
+        return self.install(dict(config, update_mode=True))
     
     def validate_installation(self) -> Tuple[bool, List[str]]:
         """Validate MCP component installation"""
@@ -890,23 +1074,16 @@ class MCPComponent(Component):
         
         # Check if Claude CLI is available and validate installed servers
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            index = self._get_server_index()
 
-            if result.returncode != 0:
+            if index is None:
                 errors.append("Could not communicate with Claude CLI for MCP server verification")
             else:
-                claude_mcp_output = result.stdout.lower()
-
                 # Get the list of servers that should be installed from metadata
                 installed_servers = self.settings_manager.get_metadata_setting("mcp.servers", [])
 
                 for server_name in installed_servers:
-                    if server_name.lower() not in claude_mcp_output:
+                    if server_name.lower() not in index:
                         errors.append(f"Installed MCP server '{server_name}' not found in 'claude mcp list' output.")
 
         except Exception as e:
@@ -8,41 +8,28 @@ from pathlib import Path
 from ..core.base import Component
 from setup import __version__
 from ..services.claude_md import CLAUDEMdService
+from ..services.mcp_catalog import get_mcp_catalog
 
 
 class MCPDocsComponent(Component):
     """MCP documentation component - installs docs for selected MCP servers"""
     
+    NAME = "mcp_docs"
+    DESCRIPTION = "MCP server documentation and usage guides"
+    CATEGORY = "documentation"
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP docs component"""
         # Initialize attributes before calling parent constructor
         # because parent calls _discover_component_files() which needs these
         self.selected_servers: List[str] = []
         
-        # Map server names to documentation files
-        self.server_docs_map = {
-            "context7": "MCP_Context7.md",
-            "sequential": "MCP_Sequential.md",
-            "sequential-thinking": "MCP_Sequential.md",  # Handle both naming conventions
-            "magic": "MCP_Magic.md",
-            "playwright": "MCP_Playwright.md",
-            "serena": "MCP_Serena.md",
-            "morphllm": "MCP_Morphllm.md",
-            "morphllm-fast-apply": "MCP_Morphllm.md",  # Handle both naming conventions
-            "tavily": "MCP_Tavily.md"
-        }
+        # Map server names and aliases to documentation files
+        self.server_docs_map = get_mcp_catalog().docs_map()
         
         super().__init__(install_dir, Path(""))
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "mcp_docs",
-            "version": __version__,
-            "description": "MCP server documentation and usage guides",
-            "category": "documentation"
-        }
-
     def is_reinstallable(self) -> bool:
         """
         Allow mcp_docs to be reinstalled to handle different server selections.
@@ -137,25 +124,7 @@ class MCPDocsComponent(Component):
 
     def _normalize_server_name(self, server_name: str) -> Optional[str]:
         """Normalize server name to match our documentation mapping"""
-        if not server_name:
-            return None
-
-        server_name = server_name.lower().strip()
-
-        # Map common variations to our server_docs_map keys
-        name_mappings = {
-            "context7": "context7",
-            "sequential-thinking": "sequential-thinking",
-            "sequential": "sequential-thinking",
-            "magic": "magic",
-            "playwright": "playwright",
-            "serena": "serena",
-            "morphllm": "morphllm",
-            "morphllm-fast-apply": "morphllm",
-            "morph": "morphllm"
-        }
-
-        return name_mappings.get(server_name)
+        return get_mcp_catalog().resolve(server_name)
 
     def _install(self, config: Dict[str, Any]) -> bool:
         """Install MCP documentation component with auto-detection"""
@@ -171,11 +140,12 @@ class MCPDocsComponent(Component):
         # Get previously documented servers from metadata
         previous_servers = self.settings_manager.get_metadata_setting("components.mcp_docs.servers_documented", [])
 
-        # Merge all server lists
-        all_servers = list(set(detected_servers + selected_servers + previous_servers))
+        # Merge all server lists, folding aliases into one name per server
+        catalog = get_mcp_catalog()
+        all_servers = {catalog.resolve(s) or s for s in detected_servers + selected_servers + previous_servers}
 
         # Filter to only servers we have documentation for
-        valid_servers = [s for s in all_servers if s in self.server_docs_map]
+        valid_servers = sorted(s for s in all_servers if s in self.server_docs_map)
 
         if not valid_servers:
             self.logger.info("No MCP servers detected or selected for documentation installation")
@@ -211,18 +181,8 @@ class MCPDocsComponent(Component):
             return False
 
         # Copy documentation files
-        success_count = 0
-        successfully_copied_files = []
-
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                successfully_copied_files.append(source.name)
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        successfully_copied_files = [source.name for source in self._install_files(files_to_install, config)]
+        success_count = len(successfully_copied_files)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} documentation files copied successfully")
@@ -307,10 +267,6 @@ class MCPDocsComponent(Component):
             self.logger.exception(f"Unexpected error during MCP docs uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for MCP documentation files"""
         # Assume we're in SuperClaude/setup/components/mcp_docs.py
@@ -2,7 +2,7 @@
 Modes component for SuperClaude behavioral modes
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Optional, Any
 from pathlib import Path
 
 from ..core.base import Component
@@ -13,19 +13,15 @@ from ..services.claude_md import CLAUDEMdService
 class ModesComponent(Component):
     """SuperClaude behavioral modes component"""
     
+    NAME = "modes"
+    DESCRIPTION = "7 behavioral modes for enhanced Claude Code operation"
+    CATEGORY = "modes"
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize modes component"""
         super().__init__(install_dir, Path(""))
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "modes",
-            "version": __version__,
-            "description": "7 behavioral modes for enhanced Claude Code operation",
-            "category": "modes"
-        }
-    
     def _install(self, config: Dict[str, Any]) -> bool:
         """Install modes component"""
         self.logger.info("Installing SuperClaude behavioral modes...")
@@ -45,15 +41,7 @@ class ModesComponent(Component):
             return False
 
         # Copy mode files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        success_count = len(self._install_files(files_to_install, config))
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} mode files copied successfully")
@@ -130,10 +118,6 @@ class ModesComponent(Component):
             self.logger.exception(f"Unexpected error during modes uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for mode files"""
         # Assume we're in SuperClaude/setup/components/modes.py
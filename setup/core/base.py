@@ -5,7 +5,6 @@ Abstract base class for installable components
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
-import json
 from ..services.files import FileService
 from ..services.settings import SettingsService
 from ..utils.logger import get_logger
@@ -15,6 +14,13 @@ from ..utils.security import SecurityValidator
 class Component(ABC):
     """Base class for all installable components"""
     
+    # Declarative metadata, readable from the class so the registry can list
+    # components and resolve dependencies without creating instances
+    NAME: str = ""
+    DESCRIPTION: str = ""
+    CATEGORY: str = ""
+    DEPENDENCIES: Tuple[str, ...] = ()
+    
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
         """
         Initialize component with installation directory
@@ -32,7 +38,26 @@ class Component(ABC):
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
     
-    @abstractmethod
+    @classmethod
+    def get_class_metadata(cls) -> Dict[str, str]:
+        """
+        Return component metadata declared on the class
+        
+        Returns:
+            Dict containing:
+                - name: Component name
+                - version: Component version
+                - description: Component description
+                - category: Component category (core, command, integration, etc.)
+        """
+        from .. import __version__
+        return {
+            "name": cls.NAME,
+            "version": __version__,
+            "description": cls.DESCRIPTION,
+            "category": cls.CATEGORY
+        }
+    
     def get_metadata(self) -> Dict[str, str]:
         """
         Return component metadata
@@ -44,7 +69,7 @@ class Component(ABC):
                 - description: Component description
                 - category: Component category (core, command, integration, etc.)
         """
-        pass
+        return self.get_class_metadata()
 
     def is_reinstallable(self) -> bool:
         """
@@ -163,15 +188,7 @@ class Component(ABC):
         files_to_install = self.get_files_to_install()
 
         # Copy framework files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        success_count = len(self._install_files(files_to_install, config))
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
@@ -182,6 +199,102 @@ class Component(ABC):
         return self._post_install()
 
     
+    def _install_files(self, files_to_install: List[Tuple[Path, Path]],
+                       config: Dict[str, Any]) -> List[Path]:
+        """
+        Copy component files, skipping those unchanged since the last install
+        
+        A file is skipped when the installed copy still matches the recorded
+        manifest entry (size and mtime) and the source content hash matches.
+        The manifest is then rewritten for the files now in place.
+        
+        When config carries a "staging" area, changed files are written there
+        and only reach their targets when the installer commits it.
+        
+        Args:
+            files_to_install: List of (source_path, target_path) tuples
+            config: Installation configuration ("force" copies every file)
+            
+        Returns:
+            List of source paths that are installed and up to date
+        """
+        component_name = self.get_metadata()['name']
+        previous = {} if config.get("force") else self.settings_manager.get_install_manifest(component_name)
+        staging = config.get("staging")
+        manifest = {}
+        hashes = {}
+        to_copy = []
+        skipped = 0
+
+        for source, target in files_to_install:
+            key = self._manifest_key(target)
+            hashes[source] = self.file_manager.get_file_hash(source)
+
+            if self._is_unchanged(target, previous.get(key), hashes[source]):
+                manifest[key] = previous[key]
+                skipped += 1
+                self.logger.debug(f"Skipping unchanged {source.name}")
+            else:
+                self.logger.debug(f"Copying {source.name} to {target}")
+                to_copy.append((source, staging.stage_path(target) if staging else target))
+
+        results = self.file_manager.copy_many(to_copy, max_workers=config.get("copy_workers"),
+                                              copy_mode=config.get("copy_mode"))
+        failed = set()
+        for result in results:
+            source, written = result["source"], result["target"]
+            if not result["success"]:
+                failed.add(source)
+                self.logger.error(f"Failed to copy {source.name}: {result['error']}")
+                continue
+
+            # A rename keeps size and mtime, so the staged file's stat is
+            # what the target will have after commit
+            stat = written.stat()
+            target = staging.target_for(written) if staging else written
+            manifest[self._manifest_key(target)] = {
+                "sha256": hashes[source],
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns
+            }
+            self.logger.debug(f"Successfully copied {source.name}")
+
+        installed = [source for source, _ in files_to_install if source not in failed]
+
+        if skipped:
+            self.logger.info(f"{skipped}/{len(files_to_install)} files unchanged, skipped")
+
+        self.settings_manager.set_install_manifest(component_name, manifest)
+        return installed
+
+    def _manifest_key(self, target: Path) -> str:
+        """Get the install-relative manifest key for a target path"""
+        try:
+            return target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return str(target)
+
+    @staticmethod
+    def _is_unchanged(target: Path, entry: Optional[Dict[str, Any]], source_hash: Optional[str]) -> bool:
+        """
+        Check whether an installed file still matches its manifest entry
+        
+        Args:
+            target: Installed file path
+            entry: Manifest entry recorded at last install, if any
+            source_hash: sha256 of the file about to be installed
+            
+        Returns:
+            True if the target can be left as is
+        """
+        if not entry or source_hash is None or entry.get("sha256") != source_hash:
+            return False
+        try:
+            stat = target.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime")
+
     @abstractmethod
     def _post_install(self) -> bool:
         pass
@@ -197,7 +310,6 @@ class Component(ABC):
         """
         pass
     
-    @abstractmethod
     def get_dependencies(self) -> List[str]:
         """
         Return list of component dependencies
@@ -205,7 +317,7 @@ class Component(ABC):
         Returns:
             List of component names this component depends on
         """
-        pass
+        return list(self.DEPENDENCIES)
 
     @abstractmethod
     def _get_source_dir(self) -> Optional[Path]:
@@ -235,20 +347,13 @@ class Component(ABC):
             Version string if installed, None otherwise
         """
         self.logger.debug("Checking installed version")
-        metadata_file = self.install_dir / ".superclaude-metadata.json"
-        if metadata_file.exists():
-            self.logger.debug("Metadata file exists, reading version")
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                component_name = self.get_metadata()['name']
-                version = metadata.get('components', {}).get(component_name, {}).get('version')
-                self.logger.debug(f"Found version: {version}")
-                return version
-            except Exception as e:
-                self.logger.warning(f"Failed to read version from metadata: {e}")
-        else:
-            self.logger.debug("Metadata file does not exist")
+        try:
+            component_name = self.get_metadata()['name']
+            version = self.settings_manager.get_component_version(component_name)
+            self.logger.debug(f"Found version: {version}")
+            return version
+        except Exception as e:
+            self.logger.warning(f"Failed to read version from metadata: {e}")
         return None
     
     def is_installed(self) -> bool:
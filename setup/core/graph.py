@@ -0,0 +1,374 @@
+"""
+Dependency graph for SuperClaude components
+Topological ordering, dependency levels and reverse-dependency lookups in
+linear time, memoized until the graph changes
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class CycleError(ValueError):
+    """Raised when components depend on each other in a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        """
+        Args:
+            cycle: Component names along the cycle, first name repeated at the end
+        """
+        self.cycle = cycle
+        super().__init__(f"Circular dependency detected: {' -> '.join(cycle)}")
+
+
+class DependencyGraph:
+    """Component -> dependencies mapping with memoized graph queries"""
+
+    def __init__(self, edges: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Initialize graph
+
+        Args:
+            edges: Optional mapping of component name -> dependency names
+        """
+        self._edges: Dict[str, Set[str]] = {}
+        self._insertion: Dict[str, int] = {}
+        self._version = 0
+        self._memo: Dict[str, object] = {}
+        self._memo_version = 0
+        for name, dependencies in (edges or {}).items():
+            self.add(name, dependencies)
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every change; memoized results use it"""
+        return self._version
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def _cached(self, key: str, compute):
+        """Return a memoized result for the current graph version"""
+        if self._memo_version != self._version:
+            self._memo.clear()
+            self._memo_version = self._version
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def add(self, name: str, dependencies: Iterable[str] = ()) -> None:
+        """
+        Add or replace a component
+
+        Args:
+            name: Component name
+            dependencies: Names of components it depends on
+        """
+        if name not in self._insertion:
+            self._insertion[name] = len(self._insertion)
+        self._edges[name] = set(dependencies)
+        self._changed()
+
+    def remove(self, name: str) -> None:
+        """Remove a component (edges pointing at it are kept as missing)"""
+        if self._edges.pop(name, None) is not None:
+            self._insertion.pop(name, None)
+            self._changed()
+
+    def clear(self) -> None:
+        """Remove every component"""
+        self._edges.clear()
+        self._insertion.clear()
+        self._changed()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._edges
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Component names in the order they were added"""
+        return list(self._edges)
+
+    def as_dict(self) -> Dict[str, Set[str]]:
+        """
+        Get the raw mapping
+
+        Returns:
+            Dict of component name -> set of dependency names (a copy)
+        """
+        return {name: set(deps) for name, deps in self._edges.items()}
+
+    def get_dependencies(self, name: str) -> Set[str]:
+        """
+        Get direct dependencies of a component
+
+        Args:
+            name: Component name
+
+        Returns:
+            Set of dependency names (empty for unknown components)
+        """
+        return set(self._edges.get(name, ()))
+
+    def _reverse_index(self) -> Dict[str, Set[str]]:
+        def build() -> Dict[str, Set[str]]:
+            reverse: Dict[str, Set[str]] = {name: set() for name in self._edges}
+            for name, deps in self._edges.items():
+                for dep in deps:
+                    reverse.setdefault(dep, set()).add(name)
+            return reverse
+        return self._cached("reverse", build)
+
+    def get_dependents(self, name: str, transitive: bool = False) -> Set[str]:
+        """
+        Get components that depend on a component
+
+        Args:
+            name: Component name
+            transitive: Include indirect dependents
+
+        Returns:
+            Set of dependent component names
+        """
+        reverse = self._reverse_index()
+        if not transitive:
+            return set(reverse.get(name, ()))
+
+        found: Set[str] = set()
+        stack = [name]
+        while stack:
+            for dependent in reverse.get(stack.pop(), ()):
+                if dependent not in found:
+                    found.add(dependent)
+                    stack.append(dependent)
+        found.discard(name)
+        return found
+
+    def get_missing_dependencies(self) -> Dict[str, Set[str]]:
+        """
+        Find dependencies on components that are not in the graph
+
+        Returns:
+            Dict of component name -> missing dependency names
+        """
+        def build() -> Dict[str, Set[str]]:
+            missing = {}
+            for name, deps in self._edges.items():
+                unknown = deps - self._edges.keys()
+                if unknown:
+                    missing[name] = unknown
+            return missing
+        return {name: set(deps) for name, deps in self._cached("missing", build).items()}
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """
+        Find one dependency cycle
+
+        Returns:
+            Names along the cycle with the first repeated at the end
+            (e.g. ["a", "b", "a"]), or None if the graph is acyclic
+        """
+        def build() -> Optional[List[str]]:
+            # Iterative DFS; nodes on the current path are "in progress"
+            done: Set[str] = set()
+            for root in self._edges:
+                if root in done:
+                    continue
+                path: List[str] = []
+                on_path: Dict[str, int] = {}
+                stack = [(root, iter(sorted(self._edges[root])))]
+                path.append(root)
+                on_path[root] = 0
+                while stack:
+                    node, children = stack[-1]
+                    child = next(children, None)
+                    if child is None:
+                        stack.pop()
+                        path.pop()
+                        del on_path[node]
+                        done.add(node)
+                        continue
+                    if child in on_path:
+                        return path[on_path[child]:] + [child]
+                    if child in done or child not in self._edges:
+                        continue
+                    on_path[child] = len(path)
+                    path.append(child)
+                    stack.append((child, iter(sorted(self._edges[child]))))
+            return None
+        cycle = self._cached("cycle", build)
+        return list(cycle) if cycle else None
+
+    def closure(self, names: Iterable[str], satisfied: Iterable[str] = ()) -> Set[str]:
+        """
+        Get components together with all of their transitive dependencies
+
+        Args:
+            names: Requested component names
+            satisfied: Components already available; as in resolve() they
+                       are only included when requested
+
+        Returns:
+            Set of component names
+
+        Raises:
+            ValueError: If a component or dependency is unknown
+        """
+        names = list(names)
+        requested = set(names)
+        satisfied = set(satisfied) - requested
+        found: Set[str] = set()
+        stack = names
+        while stack:
+            name = stack.pop()
+            if name in found or name in satisfied:
+                continue
+            if name not in self._edges:
+                raise ValueError(f"Unknown component: {name}")
+            found.add(name)
+            stack.extend(self._edges[name] - found)
+        return found
+
+    def levels(self, names: Optional[Iterable[str]] = None,
+               satisfied: Iterable[str] = ()) -> List[List[str]]:
+        """
+        Group components into dependency levels with Kahn's algorithm
+
+        Every component's dependencies are in earlier levels, so the
+        components of one level can be installed in parallel.
+
+        Args:
+            names: Components to include with their dependencies (default: all)
+            satisfied: Components already available (see closure())
+
+        Returns:
+            List of levels, each in the order components were added
+
+        Raises:
+            ValueError: If a component or dependency is unknown
+            CycleError: If the components depend on each other in a cycle
+        """
+        if names is None:
+            missing = self.get_missing_dependencies()
+            if missing:
+                name = next(iter(missing))
+                raise ValueError(f"Unknown component: {sorted(missing[name])[0]}")
+            return [list(level) for level in self._cached("levels", lambda: self._levels(set(self._edges)))]
+        return self._levels(self.closure(names, satisfied))
+
+    def _levels(self, members: Set[str]) -> List[List[str]]:
+        indegree = {name: len(self._edges[name] & members) for name in members}
+        reverse = self._reverse_index()
+        current = sorted((name for name, count in indegree.items() if count == 0),
+                         key=self._insertion.__getitem__)
+        levels = []
+        placed = 0
+        while current:
+            levels.append(current)
+            placed += len(current)
+            following = []
+            for name in current:
+                for dependent in reverse.get(name, ()):
+                    if dependent in indegree:
+                        indegree[dependent] -= 1
+                        if indegree[dependent] == 0:
+                            following.append(dependent)
+            current = sorted(following, key=self._insertion.__getitem__)
+
+        if placed != len(members):
+            raise CycleError(self.find_cycle() or sorted(name for name, count in indegree.items() if count))
+        return levels
+
+    def resolve(self, names: Iterable[str], satisfied: Iterable[str] = ()) -> List[str]:
+        """
+        Order components so every dependency comes before its dependents
+
+        Requested components keep their relative order where dependencies
+        allow it.
+
+        Args:
+            names: Requested component names
+            satisfied: Components already available; they are not added to
+                       the result, and unknown ones are not an error
+
+        Returns:
+            Ordered list of component names including dependencies
+
+        Raises:
+            ValueError: If a component or dependency is unknown
+            CycleError: If the components depend on each other in a cycle
+        """
+        names = list(names)
+        requested = set(names)
+        satisfied = set(satisfied)
+        resolved: List[str] = []
+        seen: Set[str] = set()
+
+        for root in names:
+            if root in seen:
+                continue
+            if root not in self._edges:
+                raise ValueError(f"Unknown component: {root}")
+            path = [root]
+            on_path = {root}
+            stack = [(root, iter(sorted(self._edges[root])))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    path.pop()
+                    on_path.discard(node)
+                    seen.add(node)
+                    resolved.append(node)
+                    continue
+                if child in seen:
+                    continue
+                if child in on_path:
+                    raise CycleError(path[path.index(child):] + [child])
+                if child not in self._edges:
+                    if child in satisfied:
+                        continue
+                    raise ValueError(f"Unknown component: {child}")
+                if child in satisfied and child not in requested:
+                    continue
+                on_path.add(child)
+                path.append(child)
+                stack.append((child, iter(sorted(self._edges[child]))))
+
+        return resolved
+
+    def sort(self, names: Iterable[str]) -> List[str]:
+        """
+        Order a set of components by dependency without adding any
+
+        Args:
+            names: Component names (unknown names are kept, at the end)
+
+        Returns:
+            The same names, dependencies first
+        """
+        names = list(dict.fromkeys(names))
+        known = [name for name in names if name in self._edges]
+        missing = set().union(*self.get_missing_dependencies().values())
+        order = {name: index for index, name in enumerate(self.resolve(known, satisfied=missing))}
+        selected = set(names)
+        return ([name for name in order if name in selected] +
+                [name for name in names if name not in self._edges])
+
+    def validate(self) -> List[str]:
+        """
+        Check for missing dependencies and cycles
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        errors = [
+            f"Component {name} has missing dependencies: {deps}"
+            for name, deps in self.get_missing_dependencies().items()
+        ]
+        cycle = self.find_cycle()
+        if cycle:
+            errors.append(str(CycleError(cycle)))
+        return errors
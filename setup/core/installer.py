@@ -3,12 +3,16 @@ Base installer logic for SuperClaude installation system fixed some issues
 """
 
 from typing import List, Dict, Optional, Set, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
-import tempfile
-from datetime import datetime
+import threading
 from .base import Component
+from .graph import DependencyGraph
+from ..services.backup import BackupService
+from ..services.staging import StagingArea
 from ..utils.logger import get_logger
+from ..utils.ui import format_size
 
 
 class Installer:
@@ -28,14 +32,18 @@ class Installer:
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
         self.components: Dict[str, Component] = {}
+        self.dependency_graph = DependencyGraph()
         from ..services.settings import SettingsService
-        settings_manager = SettingsService(self.install_dir)
-        self.installed_components: Set[str] = set(settings_manager.get_installed_components().keys())
+        self.settings_manager = SettingsService(self.install_dir)
+        self.installed_components: Set[str] = set(self.settings_manager.get_installed_components().keys())
         self.updated_components: Set[str] = set()
 
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
         self.backup_path: Optional[Path] = None
+        self.backup_stats: Optional[Dict[str, Any]] = None
+        # Guards the result sets when components of a level install concurrently
+        self._results_lock = threading.Lock()
         self.logger = get_logger()
 
     def register_component(self, component: Component) -> None:
@@ -47,6 +55,7 @@ class Installer:
         """
         metadata = component.get_metadata()
         self.components[metadata['name']] = component
+        self.dependency_graph.add(metadata['name'], component.get_dependencies())
 
     def register_components(self, components: List[Component]) -> None:
         """
@@ -66,39 +75,33 @@ class Installer:
             component_names: List of component names to install
             
         Returns:
-            Ordered list of component names including dependencies
+            Ordered list of component names including dependencies; installed
+            components that were not registered are left out
             
         Raises:
             ValueError: If circular dependencies detected or unknown component
         """
-        resolved = []
-        resolving = set()
+        return self.dependency_graph.resolve(component_names, satisfied=self._already_installed())
 
-        def resolve(name: str) -> None:
-            if name in resolved:
-                return
-
-            if name in resolving:
-                raise ValueError(
-                    f"Circular dependency detected involving {name}")
-
-            if name not in self.components:
-                raise ValueError(f"Unknown component: {name}")
-
-            resolving.add(name)
-
-            # Resolve dependencies first
-            for dep in self.components[name].get_dependencies():
-                resolve(dep)
-
-            resolving.remove(name)
-            resolved.append(name)
-
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
+    def get_installation_levels(self, component_names: List[str]) -> List[List[str]]:
+        """
+        Group components into dependency levels
+        
+        Args:
+            component_names: List of component names to install
+            
+        Returns:
+            List of levels; the components of a level only depend on
+            components of earlier levels and can be installed concurrently
+            
+        Raises:
+            ValueError: If circular dependencies detected or unknown component
+        """
+        return self.dependency_graph.levels(component_names, satisfied=self._already_installed())
 
-        return resolved
+    def _already_installed(self) -> Set[str]:
+        """Dependencies installed by an earlier run, which need not be registered"""
+        return self.installed_components - self.components.keys()
 
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
@@ -131,10 +134,16 @@ class Installer:
 
         return len(errors) == 0, errors
 
-    def create_backup(self) -> Optional[Path]:
+    def create_backup(self, excludes: Optional[List[str]] = None,
+                      backup_format: str = "archive") -> Optional[Path]:
         """
         Create backup of existing installation
         
+        Args:
+            excludes: Extra top-level entries to skip (backups, local and the
+                      cache and staging directories are always skipped)
+            backup_format: "archive" (tar.gz) or "dedup" (content-addressed snapshot)
+            
         Returns:
             Path to backup archive or None if no existing installation
         """
@@ -144,45 +153,25 @@ class Installer:
         if self.dry_run:
             return self.install_dir / "backup_dryrun.tar.gz"
 
-        # Create backup directory
-        backup_dir = self.install_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"superclaude_backup_{timestamp}"
-        backup_path = backup_dir / f"{backup_name}.tar.gz"
-
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
-
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files except backups and local directories
-            for item in self.install_dir.iterdir():
-                if item.name not in ["backups", "local"]:
-                    try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
-                        # Log warning but continue backup process
-                        self.logger.warning(f"Could not backup {item.name}: {e}")
-
-            # Always create an archive, even if empty, to ensure it's a valid tarball
-            base_path = backup_dir / backup_name
-            shutil.make_archive(str(base_path), 'gztar', temp_backup)
-
-            if not any(temp_backup.iterdir()):
-                self.logger.warning(
-                    f"No files to backup, created empty backup archive: {backup_path.name}"
-                )
+        service = BackupService(self.install_dir, excludes=excludes)
+        if backup_format == "dedup":
+            stats = service.create_snapshot()
+        else:
+            stats = service.create_backup()
 
-        self.backup_path = backup_path
-        return backup_path
+        if stats["files"] == 0:
+            self.logger.warning(
+                f"No files to backup, created empty backup archive: {stats['path'].name}"
+            )
+        else:
+            self.logger.info(
+                f"Backed up {stats['files']} files ({format_size(stats['bytes'])}) "
+                f"in {stats['duration']:.1f} seconds"
+            )
+
+        self.backup_stats = stats
+        self.backup_path = stats["path"]
+        return self.backup_path
 
     def install_component(self, component_name: str,
                           config: Dict[str, Any]) -> bool:
@@ -203,7 +192,8 @@ class Installer:
 
         # Skip if already installed and not in update mode, unless component is reinstallable
         if not component.is_reinstallable() and component_name in self.installed_components and not config.get("update_mode"):
-            self.skipped_components.add(component_name)
+            with self._results_lock:
+                self.skipped_components.add(component_name)
             self.logger.info(f"Skipping already installed component: {component_name}")
             return True
 
@@ -213,28 +203,53 @@ class Installer:
             self.logger.error(f"Prerequisites failed for {component_name}:")
             for error in errors:
                 self.logger.error(f"  - {error}")
-            self.failed_components.add(component_name)
+            with self._results_lock:
+                self.failed_components.add(component_name)
             return False
 
         # Perform installation
+        staging = None
+        records = None
         try:
             if self.dry_run:
                 self.logger.info(f"[DRY RUN] Would install {component_name}")
                 success = True
+            elif config.get("staged", True):
+                # Build the component's files beside the installation and
+                # rename them into place only if the whole component succeeds.
+                # install() registers the component and its manifest, so
+                # those are put back as they were if the files are not.
+                records = component.settings_manager.get_component_records(component_name)
+                staging = StagingArea(self.install_dir, component_name)
+                success = component.install({**config, "staging": staging})
+                if success:
+                    staging.commit()
+                else:
+                    staging.discard()
+                    component.settings_manager.restore_component_records(component_name, records)
             else:
                 success = component.install(config)
 
-            if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
-            else:
-                self.failed_components.add(component_name)
+            with self._results_lock:
+                if success:
+                    self.installed_components.add(component_name)
+                    self.updated_components.add(component_name)
+                else:
+                    self.failed_components.add(component_name)
 
             return success
 
         except Exception as e:
             self.logger.error(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            if staging is not None:
+                staging.discard()
+            if records is not None:
+                try:
+                    component.settings_manager.restore_component_records(component_name, records)
+                except ValueError as restore_error:
+                    self.logger.warning(f"Could not restore metadata for {component_name}: {restore_error}")
+            with self._results_lock:
+                self.failed_components.add(component_name)
             return False
 
     def install_components(self,
@@ -243,6 +258,10 @@ class Installer:
         """
         Install multiple components in dependency order
         
+        With config["component_jobs"] > 1 the components of each dependency
+        level are installed concurrently, and a level starts only after the
+        previous one has finished.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
@@ -252,9 +271,12 @@ class Installer:
         """
         config = config or {}
 
+        jobs = max(1, config.get("component_jobs") or 1)
+
         # Resolve dependencies
         try:
             ordered_names = self.resolve_dependencies(component_names)
+            levels = self.get_installation_levels(component_names) if jobs > 1 else None
         except ValueError as e:
             self.logger.error(f"Dependency resolution error: {e}")
             return False
@@ -267,28 +289,64 @@ class Installer:
                 self.logger.error(f"  - {error}")
             return False
 
+        # Staging only covers files copied by _install_files; CLAUDE.md,
+        # metadata, settings and MCP registrations are still written in
+        # place, so the full-tree backup stays on unless disabled
+        backup = config.get("backup", True)
+
         # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        if backup and self.install_dir.exists() and not self.dry_run:
             self.logger.info("Creating backup of existing installation...")
             try:
-                self.create_backup()
+                self.create_backup(config.get("backup_excludes"),
+                                   config.get("backup_format", "archive"))
             except Exception as e:
                 self.logger.error(f"Failed to create backup: {e}")
                 return False
 
-        # Install each component
+        # Install each component, collecting metadata changes in one session
+        # so the metadata file is written once when the operation commits
         all_success = True
-        for name in ordered_names:
-            self.logger.info(f"Installing {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+        with self.settings_manager.metadata_session():
+            if levels is not None:
+                all_success = self._install_levels(levels, config, jobs)
+            else:
+                for name in ordered_names:
+                    self.logger.info(f"Installing {name}...")
+                    if not self.install_component(name, config):
+                        all_success = False
+                        # Continue installing other components even if one fails
 
         if not self.dry_run:
             self._run_post_install_validation()
 
         return all_success
 
+    def _install_levels(self, levels: List[List[str]], config: Dict[str, Any],
+                        jobs: int) -> bool:
+        """
+        Install dependency levels one after another, each level concurrently
+        
+        Args:
+            levels: Dependency levels from get_installation_levels()
+            config: Installation configuration
+            jobs: Maximum components installed at once
+            
+        Returns:
+            True if all successful, False if any failed
+        """
+        all_success = True
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="install") as executor:
+            for level in levels:
+                self.logger.info(f"Installing {', '.join(level)}...")
+                # map() returns once every component of the level is done,
+                # which is the barrier before dependents start
+                results = list(executor.map(lambda name: self.install_component(name, config), level))
+                if not all(results):
+                    all_success = False
+                    # Continue with the next level even if a component failed
+        return all_success
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -2,28 +2,103 @@
 Component registry for auto-discovery and dependency resolution
 """
 
+import ast
+import builtins
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+import sys
+from typing import Any, Dict, List, Set, Optional, Tuple, Type
 from pathlib import Path
 from .base import Component
+from .graph import DependencyGraph
 from ..utils.logger import get_logger
+from ..utils.paths import get_user_cache_directory
+
+
+# Discovery results persisted between runs; bump when the layout changes
+INDEX_FILE = "component-index.json"
+INDEX_FORMAT = 2
+
+# Entry-point group through which installed packages provide components,
+# e.g. in pyproject.toml:
+#   [project.entry-points."superclaude.components"]
+#   company_agents = "company_superclaude.agents:CompanyAgentsComponent"
+ENTRY_POINT_GROUP = "superclaude.components"
+
+
+def default_index_path() -> Path:
+    """Get the default location of the persisted component index"""
+    return get_user_cache_directory() / INDEX_FILE
+
+
+def _iter_entry_points(group: str) -> List[Any]:
+    """Get the entry points of a group across Python versions"""
+    from importlib.metadata import entry_points
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+def _find_module_source(module_name: str) -> Optional[Path]:
+    """
+    Locate a module's source file on sys.path without importing it
+    
+    Args:
+        module_name: Dotted module name
+        
+    Returns:
+        Path to the .py file, or None if it is not a plain source module
+    """
+    relative = Path(*module_name.split("."))
+    for entry in sys.path:
+        if not entry or not os.path.isdir(entry):
+            continue
+        for candidate in (Path(entry) / relative.with_suffix(".py"),
+                          Path(entry) / relative / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def _file_stat(path: Path) -> Optional[List[int]]:
+    """Get [mtime_ns, size] of a file, or None if it is missing"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    def __init__(self, components_dir: Path, index_path: Optional[Path] = None,
+                 use_index: bool = True, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            index_path: Persisted discovery results (default: user cache directory)
+            use_index: Read and write the persisted index
+            entry_point_group: Entry-point group providing plugin components
+                               (None: built-in components only)
         """
         self.components_dir = components_dir
+        self.index_path = (index_path or default_index_path()) if use_index else None
+        self.entry_point_group = entry_point_group
+        # Plugin component name -> source file the index entry was read from
+        self.plugin_sources: Dict[str, Optional[str]] = {}
+        # Classes are imported on first use; discovery only reads the source
         self.component_classes: Dict[str, Type[Component]] = {}
+        self.component_locations: Dict[str, Tuple[str, str]] = {}
+        self.component_metadata: Dict[str, Dict[str, str]] = {}
+        # Instances for the default install directory, created on first request
         self.component_instances: Dict[str, Component] = {}
-        self.dependency_graph: Dict[str, Set[str]] = {}
+        self.dependency_graph = DependencyGraph()
         self._discovered = False
         self.logger = get_logger()
     
@@ -38,14 +113,21 @@ class ComponentRegistry:
             return
         
         self.component_classes.clear()
+        self.component_locations.clear()
+        self.component_metadata.clear()
         self.component_instances.clear()
+        self.plugin_sources.clear()
         self.dependency_graph.clear()
         
         if not self.components_dir.exists():
             return
         
+        signature = self._index_signature()
+        if self._load_index(signature):
+            self._discovered = True
+            return
+        
         # Add components directory to Python path temporarily
-        import sys
         original_path = sys.path.copy()
         
         try:
@@ -55,21 +137,310 @@ class ComponentRegistry:
                 sys.path.insert(0, str(setup_dir))
             
             # Discover all Python files in components directory
-            for py_file in self.components_dir.glob("*.py"):
+            for py_file in sorted(self.components_dir.glob("*.py")):
                 if py_file.name.startswith("__"):
                     continue
                 
                 module_name = py_file.stem
-                self._load_component_module(module_name)
+                self._index_component_module(py_file, module_name)
         
         finally:
             # Restore original Python path
             sys.path = original_path
         
-        # Build dependency graph
-        self._build_dependency_graph()
+        if self.entry_point_group:
+            self._discover_plugins()
+        
+        self._save_index(signature)
         self._discovered = True
     
+    def _index_signature(self) -> Dict[str, Any]:
+        """
+        Describe the component sources the index was built from
+        
+        Returns:
+            Dict with package version, components directory, the
+            (mtime_ns, size) of every component module and, when plugins
+            are enabled, the mtime of every site-packages directory on
+            sys.path (installing or removing a package changes it)
+        """
+        from .. import __version__
+        modules = {}
+        for py_file in sorted(self.components_dir.glob("*.py")):
+            if py_file.name.startswith("__"):
+                continue
+            try:
+                st = py_file.stat()
+            except OSError:
+                continue
+            modules[py_file.stem] = [st.st_mtime_ns, st.st_size]
+        search_path = {}
+        if self.entry_point_group:
+            # Only package directories: sys.path[0] is the working directory
+            # under "python -m" and would invalidate the index on every cd
+            for entry in sys.path:
+                if os.path.basename(entry.rstrip(os.sep)) in ("site-packages", "dist-packages") \
+                        and os.path.isdir(entry):
+                    search_path[entry] = os.stat(entry).st_mtime_ns
+        return {
+            "format": INDEX_FORMAT,
+            "version": __version__,
+            "components_dir": str(self.components_dir.resolve()),
+            "modules": modules,
+            "entry_point_group": self.entry_point_group,
+            "search_path": search_path
+        }
+    
+    def _load_index(self, signature: Dict[str, Any]) -> bool:
+        """
+        Restore discovery results from the persisted index
+        
+        Args:
+            signature: Current _index_signature()
+            
+        Returns:
+            True if the index matched the current sources and was loaded
+        """
+        if self.index_path is None:
+            return False
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("signature") != signature:
+                return False
+            
+            # Editable plugin installs change without touching site-packages
+            for name, entry in data["components"].items():
+                source = entry.get("source")
+                if source is not None and _file_stat(Path(source)) != entry.get("source_stat"):
+                    self.logger.debug(f"Plugin component {name} changed, rebuilding index")
+                    raise ValueError("plugin source changed")
+            
+            for name, entry in data["components"].items():
+                self.component_locations[name] = (entry["module"], entry["class"])
+                self.component_metadata[name] = dict(entry["metadata"])
+                self.dependency_graph.add(name, entry["dependencies"])
+                if "plugin" in entry:
+                    self.plugin_sources[name] = entry.get("source")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if not isinstance(e, FileNotFoundError):
+                self.logger.debug(f"Ignoring unusable component index {self.index_path}: {e}")
+            self.component_locations.clear()
+            self.component_metadata.clear()
+            self.plugin_sources.clear()
+            self.dependency_graph.clear()
+            return False
+        
+        self.logger.debug(f"Loaded {len(self.component_metadata)} components from {self.index_path}")
+        return True
+    
+    def _save_index(self, signature: Dict[str, Any]) -> None:
+        """
+        Persist discovery results (best effort)
+        
+        Args:
+            signature: _index_signature() the results were built from
+        """
+        if self.index_path is None:
+            return
+        
+        components = {}
+        for name, metadata in self.component_metadata.items():
+            entry = {
+                "module": self.component_locations[name][0],
+                "class": self.component_locations[name][1],
+                "metadata": metadata,
+                "dependencies": sorted(self.dependency_graph.get_dependencies(name))
+            }
+            if name in self.plugin_sources:
+                source = self.plugin_sources[name]
+                entry["plugin"] = True
+                entry["source"] = source
+                entry["source_stat"] = _file_stat(Path(source)) if source else None
+            components[name] = entry
+        
+        data = {"signature": signature, "components": components}
+        temp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            self.logger.debug(f"Could not write component index {self.index_path}: {e}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+    
+    def _index_component_module(self, py_file: Path, module_name: str) -> None:
+        """
+        Record the components a module declares without importing it
+        
+        Classes deriving from Component whose NAME, DESCRIPTION, CATEGORY and
+        DEPENDENCIES are literals are indexed from the source. A module with
+        any other Component subclass, or a class whose bases can't be
+        resolved from the source, is imported and inspected instead.
+        
+        Args:
+            py_file: Module source file
+            module_name: Name of module
+        """
+        declared = self._read_declared_components(py_file)
+        if declared is None:
+            return
+        
+        for class_name, attributes in declared:
+            if not attributes.get("NAME"):
+                # Metadata only available at runtime
+                self._load_component_module(module_name)
+                return
+        
+        for class_name, attributes in declared:
+            self._register_declared(f"setup.components.{module_name}", class_name, attributes)
+    
+    def _read_declared_components(self, py_file: Path) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Parse the Component subclasses a source file declares
+        
+        Args:
+            py_file: Module source file
+            
+        Returns:
+            List of (class name, literal metadata attributes), or None if
+            the file cannot be parsed
+        """
+        try:
+            tree = ast.parse(py_file.read_text(encoding='utf-8'), filename=str(py_file))
+        except (OSError, SyntaxError, ValueError) as e:
+            self.logger.warning(f"Could not read component module {py_file}: {e}")
+            return None
+        
+        declared = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            derives = self._derives_from_component(node)
+            if derives:
+                declared.append((node.name, self._read_class_literals(node)))
+            elif derives is None:
+                # e.g. a subclass of another component; without literal
+                # metadata the class is imported and inspected instead
+                self.logger.debug(f"Cannot resolve the bases of {node.name} in {py_file} statically")
+                declared.append((node.name, {}))
+        return declared
+    
+    def _register_declared(self, module_name: str, class_name: str,
+                           attributes: Dict[str, Any]) -> str:
+        """
+        Record a component from its declared class attributes
+        
+        Args:
+            module_name: Dotted name of the module defining the class
+            class_name: Component class name
+            attributes: Literal NAME/DESCRIPTION/CATEGORY/DEPENDENCIES values
+            
+        Returns:
+            Component name
+        """
+        from .. import __version__
+        component_name = attributes["NAME"]
+        self.component_locations[component_name] = (module_name, class_name)
+        self.component_metadata[component_name] = {
+            "name": component_name,
+            "version": __version__,
+            "description": attributes.get("DESCRIPTION", ""),
+            "category": attributes.get("CATEGORY", "")
+        }
+        self.dependency_graph.add(component_name, attributes.get("DEPENDENCIES", ()))
+        return component_name
+    
+    def _discover_plugins(self) -> None:
+        """
+        Record components provided through the entry-point group
+        
+        Entry points are read from package metadata and the plugin source
+        is parsed like a built-in module, so plugins are only imported
+        when selected. Plugins whose metadata isn't declared as literals
+        are imported here instead. Built-in components win name clashes.
+        """
+        try:
+            entry_points = _iter_entry_points(self.entry_point_group)
+        except Exception as e:
+            self.logger.warning(f"Could not read {self.entry_point_group} entry points: {e}")
+            return
+        
+        for entry_point in entry_points:
+            module_name, _, attribute = entry_point.value.partition(":")
+            class_name = attribute.strip()
+            module_name = module_name.strip()
+            
+            source = _find_module_source(module_name) if class_name and "." not in class_name else None
+            declared = dict(self._read_declared_components(source) or []) if source else {}
+            attributes = declared.get(class_name, {})
+            
+            if attributes.get("NAME"):
+                if attributes["NAME"] in self.component_metadata:
+                    self.logger.warning(f"Ignoring plugin component {entry_point.name}: "
+                                        f"'{attributes['NAME']}' is already defined")
+                    continue
+                component_name = self._register_declared(module_name, class_name, attributes)
+                self.plugin_sources[component_name] = str(source)
+                continue
+            
+            try:
+                component_class = entry_point.load()
+                if not (inspect.isclass(component_class) and issubclass(component_class, Component)):
+                    raise TypeError(f"{entry_point.value} is not a Component subclass")
+                name = component_class.NAME or component_class().get_metadata()["name"]
+                if name in self.component_metadata:
+                    self.logger.warning(f"Ignoring plugin component {entry_point.name}: "
+                                        f"'{name}' is already defined")
+                    continue
+                self._register_class(component_class)
+                self.plugin_sources[name] = None
+            except Exception as e:
+                self.logger.warning(f"Could not load plugin component {entry_point.name}: {e}")
+    
+    @staticmethod
+    def _derives_from_component(node: ast.ClassDef) -> Optional[bool]:
+        """
+        Check whether a class statement names Component as a base
+        
+        Returns:
+            True if Component is a direct base, False if every base is a
+            builtin (or there are none), None if another base may itself
+            be a Component subclass
+        """
+        unresolved = False
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id == "Component":
+                return True
+            if isinstance(base, ast.Attribute) and base.attr == "Component":
+                return True
+            if not (isinstance(base, ast.Name) and hasattr(builtins, base.id)):
+                unresolved = True
+        return None if unresolved else False
+    
+    @staticmethod
+    def _read_class_literals(node: ast.ClassDef) -> Dict[str, object]:
+        """Read the declarative metadata attributes assigned in a class body"""
+        attributes = {}
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets = statement.targets
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                targets = [statement.target]
+            else:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id in ("NAME", "DESCRIPTION", "CATEGORY", "DEPENDENCIES"):
+                    try:
+                        attributes[target.id] = ast.literal_eval(statement.value)
+                    except ValueError:
+                        pass
+        return attributes
+    
     def _load_component_module(self, module_name: str) -> None:
         """
         Load component classes from a module
@@ -82,36 +453,46 @@ class ComponentRegistry:
             full_module_name = f"setup.components.{module_name}"
             module = importlib.import_module(full_module_name)
             
-            # Find all Component subclasses in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Component) and 
-                    obj is not Component):
+            # Find all Component subclasses defined in the module
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if (issubclass(obj, Component) and
+                    obj is not Component and
+                    obj.__module__ == module.__name__):
                     
-                    # Create instance to get metadata
                     try:
-                        instance = obj()
-                        metadata = instance.get_metadata()
-                        component_name = metadata["name"]
-                        
-                        self.component_classes[component_name] = obj
-                        self.component_instances[component_name] = instance
-                        
+                        self._register_class(obj)
                     except Exception as e:
-                        self.logger.warning(f"Could not instantiate component {name}: {e}")
+                        self.logger.warning(f"Could not register component {name}: {e}")
         
         except Exception as e:
             self.logger.warning(f"Could not load component module {module_name}: {e}")
     
-    def _build_dependency_graph(self) -> None:
-        """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                self.logger.warning(f"Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+    def _register_class(self, component_class: Type[Component]) -> None:
+        """
+        Record a component class with its metadata and dependencies
+        
+        Components that declare NAME are described from class attributes
+        alone; others are instantiated once for get_metadata() and
+        get_dependencies().
+        
+        Args:
+            component_class: Component subclass
+        """
+        if component_class.NAME:
+            metadata = component_class.get_class_metadata()
+            dependencies = set(component_class.DEPENDENCIES)
+        else:
+            instance = component_class()
+            metadata = instance.get_metadata()
+            dependencies = set(instance.get_dependencies())
+            self.component_instances[metadata["name"]] = instance
+        
+        component_name = metadata["name"]
+        self.component_classes[component_name] = component_class
+        self.component_locations[component_name] = (component_class.__module__,
+                                                     component_class.__name__)
+        self.component_metadata[component_name] = metadata
+        self.dependency_graph.add(component_name, dependencies)
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
@@ -124,7 +505,20 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        
+        if component_name not in self.component_classes:
+            location = self.component_locations.get(component_name)
+            if location is None:
+                return None
+            module_name, class_name = location
+            try:
+                module = importlib.import_module(module_name)
+                self.component_classes[component_name] = getattr(module, class_name)
+            except Exception as e:
+                self.logger.error(f"Could not load component {component_name}: {e}")
+                return None
+        
+        return self.component_classes[component_name]
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -132,24 +526,28 @@ class ComponentRegistry:
         
         Args:
             component_name: Name of component
-            install_dir: Installation directory (creates new instance with this dir)
+            install_dir: Installation directory (creates new instance with this dir;
+                         otherwise a default-directory instance is created once)
             
         Returns:
             Component instance or None if not found
         """
-        self.discover_components()
+        component_class = self.get_component_class(component_name)
+        if component_class is None:
+            return None
+        
+        if install_dir is None and component_name in self.component_instances:
+            return self.component_instances[component_name]
         
-        if install_dir is not None:
-            # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    self.logger.error(f"Error creating component instance {component_name}: {e}")
-                    return None
-        
-        return self.component_instances.get(component_name)
+        try:
+            instance = component_class(install_dir) if install_dir is not None else component_class()
+        except Exception as e:
+            self.logger.error(f"Error creating component instance {component_name}: {e}")
+            return None
+        
+        if install_dir is None:
+            self.component_instances[component_name] = instance
+        return instance
     
     def list_components(self) -> List[str]:
         """
@@ -159,7 +557,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_metadata.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -172,13 +570,8 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        metadata = self.component_metadata.get(component_name)
+        return dict(metadata) if metadata is not None else None
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -194,34 +587,7 @@ class ComponentRegistry:
             ValueError: If circular dependencies detected or unknown component
         """
         self.discover_components()
-        
-        resolved = []
-        resolving = set()
-        
-        def resolve(name: str):
-            if name in resolved:
-                return
-                
-            if name in resolving:
-                raise ValueError(f"Circular dependency detected involving {name}")
-                
-            if name not in self.dependency_graph:
-                raise ValueError(f"Unknown component: {name}")
-                
-            resolving.add(name)
-            
-            # Resolve dependencies first
-            for dep in self.dependency_graph[name]:
-                resolve(dep)
-                
-            resolving.remove(name)
-            resolved.append(name)
-        
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
-            
-        return resolved
+        return self.dependency_graph.resolve(component_names)
     
     def get_dependencies(self, component_name: str) -> Set[str]:
         """
@@ -234,26 +600,21 @@ class ComponentRegistry:
             Set of dependency component names
         """
         self.discover_components()
-        return self.dependency_graph.get(component_name, set())
+        return self.dependency_graph.get_dependencies(component_name)
     
-    def get_dependents(self, component_name: str) -> Set[str]:
+    def get_dependents(self, component_name: str, transitive: bool = False) -> Set[str]:
         """
         Get components that depend on the given component
         
         Args:
             component_name: Name of component
+            transitive: Include indirect dependents
             
         Returns:
             Set of component names that depend on this component
         """
         self.discover_components()
-        dependents = set()
-        
-        for name, deps in self.dependency_graph.items():
-            if component_name in deps:
-                dependents.add(name)
-                
-        return dependents
+        return self.dependency_graph.get_dependents(component_name, transitive)
     
     def validate_dependency_graph(self) -> List[str]:
         """
@@ -263,23 +624,7 @@ class ComponentRegistry:
             List of validation errors (empty if valid)
         """
         self.discover_components()
-        errors = []
-        
-        # Check for missing dependencies
-        all_components = set(self.dependency_graph.keys())
-        for name, deps in self.dependency_graph.items():
-            missing_deps = deps - all_components
-            if missing_deps:
-                errors.append(f"Component {name} has missing dependencies: {missing_deps}")
-        
-        # Check for circular dependencies
-        for name in all_components:
-            try:
-                self.resolve_dependencies([name])
-            except ValueError as e:
-                errors.append(str(e))
-        
-        return errors
+        return self.dependency_graph.validate()
     
     def get_components_by_category(self, category: str) -> List[str]:
         """
@@ -294,13 +639,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, metadata in self.component_metadata.items():
+            if metadata.get("category") == category:
+                components.append(name)
         
         return components
     
@@ -316,32 +657,7 @@ class ComponentRegistry:
             that can be installed in parallel at that dependency level
         """
         self.discover_components()
-        
-        # Get all components including dependencies
-        all_components = set(self.resolve_dependencies(component_names))
-        
-        # Group by dependency level
-        levels = []
-        remaining = all_components.copy()
-        
-        while remaining:
-            # Find components with no unresolved dependencies
-            current_level = []
-            for name in list(remaining):
-                deps = self.dependency_graph.get(name, set())
-                unresolved_deps = deps & remaining
-                
-                if not unresolved_deps:
-                    current_level.append(name)
-            
-            if not current_level:
-                # This shouldn't happen if dependency graph is valid
-                raise ValueError("Circular dependency detected in installation order calculation")
-            
-            levels.append(current_level)
-            remaining -= set(current_level)
-        
-        return levels
+        return self.dependency_graph.levels(component_names)
     
     def create_component_instances(self, component_names: List[str], install_dir: Optional[Path] = None) -> Dict[str, Component]:
         """
@@ -377,21 +693,13 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, metadata in self.component_metadata.items():
+            category = metadata.get("category") or "unknown"
+            categories.setdefault(category, []).append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_metadata),
             "categories": categories,
-            "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
+            "dependency_graph": {name: sorted(deps) for name, deps in self.dependency_graph.as_dict().items()},
             "validation_errors": self.validate_dependency_graph()
         }
\ No newline at end of file
@@ -7,10 +7,14 @@ from .claude_md import CLAUDEMdService
 from .config import ConfigService
 from .files import FileService
 from .settings import SettingsService
+from .staging import StagingArea
+from .tool_probe import ToolProbeService
 
 __all__ = [
     'CLAUDEMdService',
     'ConfigService', 
     'FileService',
-    'SettingsService'
+    'SettingsService',
+    'StagingArea',
+    'ToolProbeService'
 ]
\ No newline at end of file
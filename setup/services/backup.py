@@ -0,0 +1,549 @@
+"""
+Backup archive creation for SuperClaude installation system
+Archives are written in a single streaming pass over the install directory;
+deduplicated snapshots store each file once in a content-addressed store
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import stat
+import tarfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from ..utils.logger import get_logger
+from ..utils.paths import CACHE_DIR, STAGING_DIR
+
+
+# Top-level entries of the install directory that are never archived
+DEFAULT_BACKUP_EXCLUDES = ("backups", "local", CACHE_DIR, STAGING_DIR)
+
+# Archive member holding backup metadata
+METADATA_MEMBER = "backup_metadata.json"
+
+# Suffix of the sidecar index written next to each archive; it deliberately
+# does not match "*.tar*" so archive globs never pick it up
+INDEX_SUFFIX = ".index.json"
+
+# Content-addressed store layout under the backup directory
+OBJECTS_DIR = "objects"
+SNAPSHOTS_DIR = "snapshots"
+REFCOUNTS_FILE = "refcounts.json"
+
+# tarfile write mode and file suffix per compression method
+COMPRESSION_MODES = {
+    "gzip": ("w:gz", ".tar.gz"),
+    "bzip2": ("w:bz2", ".tar.bz2"),
+    "none": ("w", ".tar"),
+}
+
+
+class _HashingReader:
+    """
+    File wrapper that hashes data as tarfile reads it
+
+    tarfile has already written the member header with the size from stat,
+    so if the file fails or shrinks mid-read the rest is padded with zeros
+    to keep the archive readable; `error` is set and the member must not be
+    listed in the index.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.hasher = hashlib.sha256()
+        self.error: Optional[str] = None
+
+    def read(self, size: int = -1) -> bytes:
+        if self.error is None:
+            try:
+                data = self._fileobj.read(size)
+            except OSError as e:
+                self.error = str(e)
+                data = b""
+            if size >= 0 and len(data) < size and self.error is None:
+                self.error = "file shrank while it was being read"
+            self.hasher.update(data)
+        else:
+            data = b""
+        if size >= 0 and len(data) < size:
+            data += b"\0" * (size - len(data))
+        return data
+
+
+def get_index_path(backup_path: Path) -> Path:
+    """
+    Get the sidecar index path for a backup archive
+
+    Args:
+        backup_path: Archive path (e.g. name.tar.gz)
+
+    Returns:
+        Index path (e.g. name.index.json)
+    """
+    name = backup_path.name
+    for _, suffix in COMPRESSION_MODES.values():
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return backup_path.with_name(f"{name}{INDEX_SUFFIX}")
+
+
+def read_backup_index(backup_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read the sidecar index of a backup archive
+
+    Args:
+        backup_path: Archive path
+
+    Returns:
+        Index dict, or None if missing, unreadable or for a different archive
+    """
+    try:
+        with open(get_index_path(backup_path), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(index, dict) or index.get("archive") != backup_path.name:
+        return None
+    return index
+
+
+def _hash_file(path: str) -> str:
+    """Get the sha256 of a file"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class BackupService:
+    """Creates backup archives and deduplicated snapshots of a SuperClaude installation"""
+
+    # Serializes refcount updates between snapshots created in one process
+    _store_lock = threading.Lock()
+
+    def __init__(self, install_dir: Path, backup_dir: Optional[Path] = None,
+                 excludes: Optional[List[str]] = None):
+        """
+        Initialize backup service
+
+        Args:
+            install_dir: Installation directory to back up
+            backup_dir: Where archives are written (default: install_dir/backups)
+            excludes: Extra top-level entry names to skip, on top of
+                      DEFAULT_BACKUP_EXCLUDES
+        """
+        self.install_dir = Path(install_dir)
+        self.backup_dir = Path(backup_dir) if backup_dir else self.install_dir / "backups"
+        self.excludes = set(DEFAULT_BACKUP_EXCLUDES) | set(excludes or ())
+        self.objects_dir = self.backup_dir / OBJECTS_DIR
+        self.snapshots_dir = self.backup_dir / SNAPSHOTS_DIR
+        self.logger = get_logger()
+
+    def create_backup(self, backup_name: Optional[str] = None, compression: str = "gzip",
+                      metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create a backup archive
+
+        The tree is walked with os.scandir and every file is streamed straight
+        into the compressor; the archive is written under a temporary name and
+        renamed when complete, so a partial archive is never listed. A sidecar
+        index (metadata, file count, total size and per-member sha256) is
+        written next to the archive so listing never has to open it.
+
+        Args:
+            backup_name: Archive base name (default: superclaude_backup_<timestamp>)
+            compression: One of COMPRESSION_MODES
+            metadata: Optional metadata stored as backup_metadata.json
+
+        Returns:
+            Dict with path, index, files, bytes (uncompressed) and duration (seconds)
+        """
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown compression method: {compression}")
+        mode, suffix = COMPRESSION_MODES[compression]
+
+        if not backup_name:
+            backup_name = f"superclaude_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_path = self.backup_dir / f"{backup_name}{suffix}"
+        temp_path = self.backup_dir / f".{backup_name}.partial"
+
+        start_time = time.time()
+        files = 0
+        total_bytes = 0
+        checksums: Dict[str, str] = {}
+
+        try:
+            with tarfile.open(temp_path, mode) as tar:
+                if metadata is not None:
+                    data = json.dumps(metadata, indent=2).encode("utf-8")
+                    info = tarfile.TarInfo(METADATA_MEMBER)
+                    info.size = len(data)
+                    info.mtime = int(time.time())
+                    tar.addfile(info, io.BytesIO(data))
+
+                for path, arcname in self._walk():
+                    try:
+                        info = tar.gettarinfo(path, arcname)
+                        if info.isreg():
+                            with open(path, "rb") as f:
+                                reader = _HashingReader(f)
+                                tar.addfile(info, reader)
+                            if reader.error:
+                                self.logger.warning(f"Could not backup {arcname}: {reader.error}")
+                                continue
+                            checksums[arcname] = reader.hasher.hexdigest()
+                            files += 1
+                            total_bytes += info.size
+                        else:
+                            tar.addfile(info)
+                    except OSError as e:
+                        # Log warning but continue backup process
+                        self.logger.warning(f"Could not backup {arcname}: {e}")
+
+            os.replace(temp_path, backup_path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+        index_path = self._write_index(backup_path, {
+            "archive": backup_path.name,
+            "created": datetime.now().isoformat(),
+            "compression": compression,
+            "metadata": metadata or {},
+            "files": files,
+            "total_size": total_bytes,
+            "archive_size": backup_path.stat().st_size,
+            "members": checksums
+        })
+
+        return {
+            "path": backup_path,
+            "index": index_path,
+            "files": files,
+            "bytes": total_bytes,
+            "duration": time.time() - start_time
+        }
+
+    def create_snapshot(self, backup_name: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create a deduplicated snapshot
+
+        Every file is stored once under objects/<hash[:2]>/<hash> and the
+        snapshot itself is a small manifest in snapshots/<name>.json. Files
+        whose size and mtime match the previous snapshot reuse its hash, so
+        only changed files are read and only new content is written.
+
+        Args:
+            backup_name: Snapshot name (default: superclaude_backup_<timestamp>)
+            metadata: Optional metadata stored in the manifest
+
+        Returns:
+            Dict with path, files, bytes, new_objects, new_bytes and duration
+        """
+        if not backup_name:
+            backup_name = f"superclaude_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_path = self.snapshots_dir / f"{backup_name}.json"
+
+        start_time = time.time()
+        previous = self._latest_snapshot_hashes()
+        entries = []
+        total_bytes = 0
+        new_objects = 0
+        new_bytes = 0
+
+        with self._store_lock:
+            for path, arcname in self._walk():
+                try:
+                    st = os.lstat(path)
+                    entry = {"path": arcname, "mode": stat.S_IMODE(st.st_mode), "mtime": st.st_mtime_ns}
+
+                    if stat.S_ISDIR(st.st_mode):
+                        entry["type"] = "dir"
+                    elif stat.S_ISLNK(st.st_mode):
+                        entry["type"] = "symlink"
+                        entry["target"] = os.readlink(path)
+                    elif stat.S_ISREG(st.st_mode):
+                        cached = previous.get(arcname)
+                        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+                            digest = cached["sha256"]
+                        else:
+                            digest = _hash_file(path)
+                        if self._store_object(path, digest):
+                            new_objects += 1
+                            new_bytes += st.st_size
+                        entry.update({"type": "file", "sha256": digest, "size": st.st_size})
+                        total_bytes += st.st_size
+                    else:
+                        continue
+
+                    entries.append(entry)
+                except OSError as e:
+                    # Log warning but continue backup process
+                    self.logger.warning(f"Could not backup {arcname}: {e}")
+
+            manifest = {
+                "name": backup_name,
+                "created": datetime.now().isoformat(),
+                "metadata": metadata or {},
+                "files": sum(1 for e in entries if e["type"] == "file"),
+                "total_size": total_bytes,
+                "entries": entries
+            }
+            replaced = self._read_json(snapshot_path) if snapshot_path.exists() else None
+            self._write_json(snapshot_path, manifest)
+            self._adjust_refcounts(self._snapshot_objects(manifest), 1)
+            if isinstance(replaced, dict):
+                self._release_objects(replaced)
+
+        return {
+            "path": snapshot_path,
+            "files": manifest["files"],
+            "bytes": total_bytes,
+            "new_objects": new_objects,
+            "new_bytes": new_bytes,
+            "duration": time.time() - start_time
+        }
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        List deduplicated snapshots without reading any objects
+
+        Returns:
+            List of manifest dicts (without entries) plus their path
+        """
+        snapshots = []
+        if not self.snapshots_dir.exists():
+            return snapshots
+
+        for snapshot_path in self.snapshots_dir.glob("*.json"):
+            manifest = self._read_json(snapshot_path)
+            if not isinstance(manifest, dict):
+                continue
+            summary = {k: v for k, v in manifest.items() if k != "entries"}
+            summary["path"] = snapshot_path
+            snapshots.append(summary)
+
+        return snapshots
+
+    def restore_snapshot(self, snapshot_path: Path, target_dir: Path, overwrite: bool = False) -> int:
+        """
+        Restore a deduplicated snapshot
+
+        Args:
+            snapshot_path: Snapshot manifest path
+            target_dir: Directory to restore into
+            overwrite: Whether to replace existing files
+
+        Returns:
+            Number of files restored
+        """
+        manifest = self._read_json(snapshot_path)
+        if not isinstance(manifest, dict) or "entries" not in manifest:
+            raise ValueError(f"Invalid snapshot manifest: {snapshot_path}")
+
+        restored = 0
+        for entry in manifest["entries"]:
+            target = Path(target_dir) / entry["path"]
+            if entry["type"] == "dir":
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+
+            if (target.exists() or target.is_symlink()) and not overwrite:
+                self.logger.warning(f"Skipping existing file: {target}")
+                continue
+
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if target.is_symlink() or target.exists():
+                    target.unlink()
+                if entry["type"] == "symlink":
+                    os.symlink(entry["target"], target)
+                    continue
+
+                shutil.copyfile(self._object_path(entry["sha256"]), target)
+                os.chmod(target, entry["mode"])
+                os.utime(target, ns=(entry["mtime"], entry["mtime"]))
+                restored += 1
+            except OSError as e:
+                self.logger.warning(f"Could not restore {entry['path']}: {e}")
+
+        return restored
+
+    def delete_snapshot(self, snapshot_path: Path) -> int:
+        """
+        Delete a snapshot and garbage-collect objects no longer referenced
+
+        Args:
+            snapshot_path: Snapshot manifest path
+
+        Returns:
+            Number of objects removed from the store
+        """
+        with self._store_lock:
+            manifest = self._read_json(snapshot_path)
+            snapshot_path.unlink()
+            if not isinstance(manifest, dict):
+                return 0
+            return self._release_objects(manifest)
+
+    def _release_objects(self, manifest: Dict[str, Any]) -> int:
+        """
+        Drop a snapshot's references and remove objects nothing else uses
+
+        Args:
+            manifest: Snapshot manifest being removed
+
+        Returns:
+            Number of objects removed from the store
+        """
+        removed = 0
+        for digest in self._adjust_refcounts(self._snapshot_objects(manifest), -1):
+            object_path = self._object_path(digest)
+            try:
+                object_path.unlink()
+                removed += 1
+                object_path.parent.rmdir()  # Only succeeds once the shard is empty
+            except OSError:
+                pass
+        return removed
+
+    def _object_path(self, digest: str) -> Path:
+        """Get the store path for an object hash"""
+        return self.objects_dir / digest[:2] / digest
+
+    def _store_object(self, path: str, digest: str) -> bool:
+        """
+        Copy a file into the object store unless its content is already there
+
+        Returns:
+            True if a new object was written
+        """
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            return False
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = object_path.with_name(f".{digest}.{os.getpid()}.tmp")
+        shutil.copyfile(path, temp_path)
+        os.replace(temp_path, object_path)
+        return True
+
+    @staticmethod
+    def _snapshot_objects(manifest: Dict[str, Any]) -> List[str]:
+        """Get the distinct object hashes a snapshot references"""
+        return sorted({e["sha256"] for e in manifest.get("entries", []) if e.get("type") == "file"})
+
+    def _adjust_refcounts(self, digests: List[str], delta: int) -> List[str]:
+        """
+        Add delta to the reference count of each object
+
+        Args:
+            digests: Object hashes
+            delta: +1 when a snapshot is added, -1 when one is removed
+
+        Returns:
+            Hashes whose count dropped to zero
+        """
+        refcounts_path = self.objects_dir / REFCOUNTS_FILE
+        refcounts = self._read_json(refcounts_path) or {}
+        unreferenced = []
+
+        for digest in digests:
+            count = refcounts.get(digest, 0) + delta
+            if count > 0:
+                refcounts[digest] = count
+            else:
+                refcounts.pop(digest, None)
+                unreferenced.append(digest)
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._write_json(refcounts_path, refcounts)
+        return unreferenced
+
+    def _latest_snapshot_hashes(self) -> Dict[str, Dict[str, Any]]:
+        """Get path -> file entry from the most recent snapshot"""
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return {}
+
+        latest = max(snapshots, key=lambda s: s.get("created", ""))
+        manifest = self._read_json(latest["path"]) or {}
+        return {e["path"]: e for e in manifest.get("entries", []) if e.get("type") == "file"}
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Any]:
+        """Read a JSON file, returning None if missing or invalid"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Write a JSON file atomically"""
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+
+    def _write_index(self, backup_path: Path, index: Dict[str, Any]) -> Path:
+        """
+        Write the sidecar index for an archive
+
+        Args:
+            backup_path: Archive path
+            index: Index contents
+
+        Returns:
+            Path to the index file
+        """
+        index_path = get_index_path(backup_path)
+        self._write_json(index_path, index)
+        return index_path
+
+    def _walk(self) -> Iterator[Tuple[str, str]]:
+        """
+        Walk the install directory without building a file list
+
+        Yields:
+            (filesystem path, archive name) for directories, files and links
+        """
+        backup_dir = os.path.abspath(self.backup_dir)
+        stack = [(str(self.install_dir), "")]
+
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = sorted(os.scandir(directory), key=lambda e: e.name)
+            except OSError as e:
+                self.logger.warning(f"Could not read {directory}: {e}")
+                continue
+
+            for entry in entries:
+                if not prefix and entry.name in self.excludes:
+                    continue
+                if os.path.abspath(entry.path) == backup_dir:
+                    continue
+
+                arcname = f"{prefix}{entry.name}"
+                yield entry.path, arcname
+
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{arcname}/"))
@@ -2,12 +2,28 @@
 CLAUDE.md Manager for preserving user customizations while managing framework imports
 """
 
+import functools
 import re
+import threading
 from pathlib import Path
 from typing import List, Set, Dict, Optional
 from ..utils.logger import get_logger
 
 
+# CLAUDE.md is rewritten as a whole; components installing concurrently
+# must not interleave their read-modify-write cycles
+_claude_md_lock = threading.RLock()
+
+
+def _locked(method):
+    """Run a CLAUDE.md read-modify-write while holding _claude_md_lock"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _claude_md_lock:
+            return method(*args, **kwargs)
+    return wrapper
+
+
 class CLAUDEMdService:
     """Manages CLAUDE.md file updates while preserving user customizations"""
     
@@ -119,6 +135,7 @@ class CLAUDEMdService:
         
         return "\n".join(sections)
     
+    @_locked
     def add_imports(self, files: List[str], category: str = "Framework") -> bool:
         """
         Add new imports with duplicate checking and user content preservation
@@ -259,6 +276,7 @@ The SuperClaude framework components will be automatically imported below.
             self.logger.error(f"Failed to create CLAUDE.md: {e}")
             raise
     
+    @_locked
     def remove_imports(self, files: List[str]) -> bool:
         """
         Remove specific imports from CLAUDE.md
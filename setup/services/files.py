@@ -2,27 +2,55 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import os
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from pathlib import Path
 import fnmatch
 import hashlib
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Copy modes for bulk installation:
+#   copy     - shutil.copy2, always portable
+#   clone    - reflink clone (FICLONE), then os.copy_file_range, then copy2
+#   hardlink - hard link to the source, for read-only shared deployments
+COPY_MODES = ("copy", "clone", "hardlink")
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+FICLONE = 0x40049409
+
+# Default worker count for bulk copies; copies are I/O bound, so this mainly
+# hides per-file latency on network home directories
+DEFAULT_COPY_WORKERS = 8
+
 
 class FileService:
     """Cross-platform file operations manager"""
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, copy_mode: str = "copy"):
         """
         Initialize file manager
         
         Args:
             dry_run: If True, only simulate file operations
+            copy_mode: Default copy mode for copy_many (see COPY_MODES)
         """
+        if copy_mode not in COPY_MODES:
+            raise ValueError(f"Unknown copy mode: {copy_mode}")
         self.dry_run = dry_run
+        self.copy_mode = copy_mode
         self.copied_files: List[Path] = []
         self.created_dirs: List[Path] = []
+        self._tracking_lock = threading.Lock()
         
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
@@ -63,6 +91,156 @@ class FileService:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def copy_many(self, pairs: List[Tuple[Path, Path]], preserve_permissions: bool = True,
+                  max_workers: Optional[int] = None, copy_mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Copy many files concurrently
+        
+        Parent directories are created once up front, then copies run on a
+        bounded thread pool. Failures are reported per file rather than raised.
+        
+        Args:
+            pairs: List of (source_path, target_path) tuples
+            preserve_permissions: Whether to preserve file permissions
+            max_workers: Worker pool size (default: DEFAULT_COPY_WORKERS)
+            copy_mode: Copy mode override (default: self.copy_mode)
+            
+        Returns:
+            List of dicts with source, target, success and error, in input order
+        """
+        if not pairs:
+            return []
+        
+        copy_mode = copy_mode or self.copy_mode
+        if copy_mode not in COPY_MODES:
+            raise ValueError(f"Unknown copy mode: {copy_mode}")
+        
+        if self.dry_run:
+            for source, target in pairs:
+                print(f"[DRY RUN] Would copy {source} -> {target}")
+            return [{"source": source, "target": target, "success": True, "error": None}
+                    for source, target in pairs]
+        
+        # Create each parent directory once instead of once per file
+        dir_errors: Dict[Path, str] = {}
+        for parent in sorted({target.parent for _, target in pairs}):
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                dir_errors[parent] = str(e)
+        
+        def copy_one(pair: Tuple[Path, Path]) -> Dict[str, Any]:
+            source, target = pair
+            result = {"source": source, "target": target, "success": False, "error": None}
+            if target.parent in dir_errors:
+                result["error"] = f"Could not create directory {target.parent}: {dir_errors[target.parent]}"
+                return result
+            try:
+                self._copy_with_mode(source, target, preserve_permissions, copy_mode)
+            except Exception as e:
+                result["error"] = str(e)
+                return result
+            
+            with self._tracking_lock:
+                self.copied_files.append(target)
+            result["success"] = True
+            return result
+        
+        workers = max(1, min(max_workers or DEFAULT_COPY_WORKERS, len(pairs)))
+        if workers == 1:
+            return [copy_one(pair) for pair in pairs]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(copy_one, pairs))
+    
+    def _copy_with_mode(self, source: Path, target: Path, preserve_permissions: bool, copy_mode: str) -> None:
+        """
+        Copy one file using the requested mode, falling back to a plain copy
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            preserve_permissions: Whether to preserve file permissions
+            copy_mode: One of COPY_MODES
+        """
+        # Never write through an existing hard link into someone else's file
+        try:
+            if target.stat().st_nlink > 1:
+                target.unlink()
+        except FileNotFoundError:
+            pass
+        
+        if copy_mode == "hardlink" and self._hardlink(source, target):
+            return
+        
+        if copy_mode == "clone" and self._clone(source, target):
+            if preserve_permissions:
+                shutil.copystat(source, target)
+            else:
+                shutil.copymode(source, target)
+            return
+        
+        if preserve_permissions:
+            shutil.copy2(source, target)
+        else:
+            shutil.copy(source, target)
+    
+    @staticmethod
+    def _hardlink(source: Path, target: Path) -> bool:
+        """
+        Replace target with a hard link to source
+        
+        Returns:
+            True if linked, False if linking is not possible (e.g. cross-device)
+        """
+        temp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.link")
+        try:
+            os.link(source, temp)
+        except OSError:
+            return False
+        try:
+            os.replace(temp, target)
+        except OSError:
+            temp.unlink()
+            return False
+        return True
+    
+    @staticmethod
+    def _clone(source: Path, target: Path) -> bool:
+        """
+        Copy file data without moving it through user space
+        
+        Tries a reflink clone (copy-on-write, metadata only) and then
+        os.copy_file_range. Both are Linux-only.
+        
+        Returns:
+            True if the data was copied, False to fall back to a plain copy
+        """
+        if not sys.platform.startswith("linux"):
+            return False
+        
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return True
+                except OSError:
+                    pass
+            
+            if not hasattr(os, "copy_file_range"):
+                return False
+            
+            remaining = os.fstat(src.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                return False
+            return remaining <= 0
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -0,0 +1,180 @@
+"""
+MCP package cache for SuperClaude installation system
+Prefetches the npm and uv packages behind MCP servers into a local cache
+directory so later installs (and the servers themselves) resolve offline
+"""
+
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.logger import get_logger
+from ..utils.paths import CACHE_DIR
+
+
+# Default cache location inside the install directory (excluded from backups)
+MCP_CACHE_SUBDIR = "mcp-packages"
+
+# Records what was prefetched into a cache directory and when
+MANIFEST_FILE = "manifest.json"
+
+DEFAULT_PREFETCH_TIMEOUT = 900
+
+
+def default_cache_dir(install_dir: Path) -> Path:
+    """Get the default MCP package cache for an installation"""
+    return install_dir / CACHE_DIR / MCP_CACHE_SUBDIR
+
+
+class MCPPackageCache:
+    """Local npm/uv cache for MCP server packages"""
+
+    def __init__(self,
+                 cache_dir: Path,
+                 runner: Optional[Callable[..., subprocess.CompletedProcess]] = None,
+                 registry: Optional[str] = None,
+                 offline: bool = False):
+        """
+        Initialize package cache
+
+        Args:
+            cache_dir: Cache directory (npm/ and uv/ are created inside)
+            runner: Runs a command list (default: subprocess.run)
+            registry: npm registry URL to use instead of the public one
+                      (e.g. a local registry stand-in)
+            offline: Never hit the network once packages are cached
+        """
+        self.cache_dir = Path(cache_dir)
+        self.npm_cache = self.cache_dir / "npm"
+        self.uv_cache = self.cache_dir / "uv"
+        self.manifest_path = self.cache_dir / MANIFEST_FILE
+        self.runner = runner or subprocess.run
+        self.registry = registry
+        self.offline = offline
+        self.logger = get_logger()
+
+    def environment(self) -> Dict[str, str]:
+        """
+        Environment variables that point npm/npx and uv/uvx at this cache
+
+        Returns:
+            Dict of environment variable -> value
+        """
+        env = {
+            "npm_config_cache": str(self.npm_cache),
+            "UV_CACHE_DIR": str(self.uv_cache),
+        }
+        if self.offline:
+            env["npm_config_offline"] = "true"
+            env["UV_OFFLINE"] = "1"
+        else:
+            env["npm_config_prefer_offline"] = "true"
+        if self.registry:
+            env["npm_config_registry"] = self.registry
+        return env
+
+    def prefetch(self, servers: Dict[str, Dict[str, Any]],
+                 timeout: int = DEFAULT_PREFETCH_TIMEOUT) -> Dict[str, bool]:
+        """
+        Download the packages of the given MCP servers into the cache
+
+        npm servers are installed into a throwaway prefix so the cache holds
+        the package and its whole dependency tree; uv/GitHub servers run
+        their install command with UV_CACHE_DIR pointing at the cache.
+
+        Args:
+            servers: Dict of server name -> server info (MCPComponent.mcp_servers)
+            timeout: Seconds to allow per package
+
+        Returns:
+            Dict of server name -> success
+        """
+        self.npm_cache.mkdir(parents=True, exist_ok=True)
+        self.uv_cache.mkdir(parents=True, exist_ok=True)
+        env = {**os.environ, **self.environment()}
+        # Downloading is the point here
+        env.pop("npm_config_offline", None)
+        env.pop("UV_OFFLINE", None)
+
+        manifest = self.read_manifest()
+        results: Dict[str, bool] = {}
+
+        for name, server_info in servers.items():
+            cmd = self._prefetch_command(server_info)
+            if cmd is None:
+                self.logger.warning(f"Nothing to prefetch for MCP server {name}")
+                results[name] = False
+                continue
+
+            self.logger.info(f"Prefetching {name}: {' '.join(cmd)}")
+            with tempfile.TemporaryDirectory(prefix="superclaude-prefetch-") as prefix:
+                fetch_cmd = cmd + ["--prefix", prefix] if cmd[0] == "npm" else cmd
+                try:
+                    result = self.runner(fetch_cmd, capture_output=True, text=True,
+                                         timeout=timeout, env=env)
+                    success = result.returncode == 0
+                    if not success:
+                        error = result.stderr.strip() if result.stderr else "Unknown error"
+                        self.logger.error(f"Failed to prefetch {name}: {error}")
+                except (subprocess.TimeoutExpired, OSError) as e:
+                    self.logger.error(f"Failed to prefetch {name}: {e}")
+                    success = False
+
+            results[name] = success
+            if success:
+                manifest[name] = {
+                    "command": cmd,
+                    "fetched": time.strftime("%Y-%m-%dT%H:%M:%S")
+                }
+
+        self._write_manifest(manifest)
+        return results
+
+    @staticmethod
+    def _prefetch_command(server_info: Dict[str, Any]) -> Optional[List[str]]:
+        """Get the command that pulls a server's package into the cache"""
+        if server_info.get("install_method") in ("uv", "github"):
+            install_command = server_info.get("install_command")
+            return shlex.split(install_command) if install_command else None
+
+        package = server_info.get("npm_package")
+        if not package and server_info.get("install_command"):
+            # "npx -y tavily-mcp@0.1.2" -> "tavily-mcp@0.1.2"
+            args = [arg for arg in shlex.split(server_info["install_command"])[1:]
+                    if not arg.startswith("-")]
+            package = args[0] if args else None
+        if not package:
+            return None
+        return ["npm", "install", "--no-save", "--ignore-scripts", "--no-audit", "--no-fund", package]
+
+    def read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read what has been prefetched into this cache
+
+        Returns:
+            Dict of server name -> {command, fetched}
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """Write the manifest atomically"""
+        temp_path = self.manifest_path.with_name(f".{MANIFEST_FILE}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+
+    def clear(self) -> None:
+        """Remove the whole cache directory"""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
@@ -0,0 +1,111 @@
+"""
+MCP server catalog for SuperClaude installation system
+Loads the declarative server definitions in setup/data/mcp_servers.json once
+and indexes them by name and alias
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+CATALOG_FILE = Path(__file__).parent.parent / "data" / "mcp_servers.json"
+
+
+class MCPCatalog:
+    """Server definitions shared by the MCP components and the installer UI"""
+
+    def __init__(self, servers: List[Dict[str, Any]]):
+        """
+        Build the catalog indexes
+
+        Args:
+            servers: Server definitions in display order; each has a name and
+                     optionally aliases and a docs file
+
+        Raises:
+            ValueError: If a name or alias is defined twice
+        """
+        self.servers: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+
+        for server in servers:
+            name = server["name"]
+            if name in self.servers:
+                raise ValueError(f"Duplicate MCP server in catalog: {name}")
+            self.servers[name] = server
+
+            for alias in [name] + list(server.get("aliases", [])):
+                key = alias.lower().strip()
+                if self._aliases.get(key, name) != name:
+                    raise ValueError(f"MCP server alias '{alias}' used by {self._aliases[key]} and {name}")
+                self._aliases[key] = name
+
+    @classmethod
+    def load(cls, path: Path = CATALOG_FILE) -> "MCPCatalog":
+        """
+        Load a catalog file
+
+        Args:
+            path: JSON file with a "servers" list
+
+        Returns:
+            MCPCatalog instance
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get("servers", []))
+
+    def resolve(self, server_name: str) -> Optional[str]:
+        """
+        Map a server name or alias to its catalog name
+
+        Args:
+            server_name: Name as found in a config file or CLI listing
+
+        Returns:
+            Catalog name, or None if the server is not in the catalog
+        """
+        if not server_name:
+            return None
+        return self._aliases.get(server_name.lower().strip())
+
+    def get(self, server_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a server definition by name or alias
+
+        Args:
+            server_name: Server name or alias
+
+        Returns:
+            Server definition, or None if unknown
+        """
+        name = self.resolve(server_name)
+        return self.servers[name] if name else None
+
+    def docs_map(self) -> Dict[str, str]:
+        """
+        Map every server name and alias to its documentation file
+
+        Returns:
+            Dict of name/alias -> file name in SuperClaude/MCP
+        """
+        return {
+            alias: self.servers[name]["docs"]
+            for alias, name in self._aliases.items()
+            if self.servers[name].get("docs")
+        }
+
+
+_catalog: Optional[MCPCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_mcp_catalog() -> MCPCatalog:
+    """Get the process-wide MCP server catalog (loaded on first use)"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = MCPCatalog.load()
+        return _catalog
@@ -0,0 +1,201 @@
+"""
+MCP server health checks for SuperClaude installation system
+Launches stdio MCP servers, performs the initialize handshake and measures
+how long each server takes to become ready
+"""
+
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .. import __version__
+from ..utils.logger import get_logger
+
+
+# MCP protocol revision sent in the initialize request
+PROTOCOL_VERSION = "2024-11-05"
+
+DEFAULT_HEALTH_TIMEOUT = 30.0
+DEFAULT_HEALTH_JOBS = 8
+
+
+class _StdioSession:
+    """Newline-delimited JSON-RPC over a server process's stdin/stdout"""
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        """Queue every JSON message the server writes; None marks EOF"""
+        for line in self.process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                # Servers sometimes log to stdout; ignore anything that isn't JSON-RPC
+                continue
+            if isinstance(message, dict):
+                self._messages.put(message)
+        self._messages.put(None)
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message"""
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+
+    def request(self, request_id: int, method: str, params: Dict[str, Any],
+                deadline: float) -> Dict[str, Any]:
+        """
+        Send a request and wait for its response
+
+        Raises:
+            TimeoutError: If no response arrives before the deadline
+            RuntimeError: If the server exits or answers with an error
+        """
+        self.send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"no response to {method}")
+            try:
+                message = self._messages.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"no response to {method}")
+            if message is None:
+                raise RuntimeError(f"server exited with status {self.process.poll()} during {method}")
+            if message.get("id") != request_id:
+                continue
+            if "error" in message:
+                error = message["error"]
+                raise RuntimeError(f"{method} failed: {error.get('message', error) if isinstance(error, dict) else error}")
+            return message.get("result") or {}
+
+    def close(self) -> None:
+        """Stop the server process"""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            # Well-behaved servers exit once stdin closes
+            self.process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+def check_server(name: str, spec: Dict[str, Any],
+                 timeout: float = DEFAULT_HEALTH_TIMEOUT) -> Dict[str, Any]:
+    """
+    Launch one MCP server and perform the initialize handshake
+
+    Args:
+        name: Server name
+        spec: mcpServers entry from .claude.json ({command, args, env, ...})
+        timeout: Seconds allowed for startup and handshake together
+
+    Returns:
+        Dict with name, status ("ok", "failed" or "skipped"), startup_ms
+        (launch until the initialize response, i.e. cold start),
+        handshake_ms (initialized notification plus a tools/list round trip),
+        tools, server and error
+    """
+    result: Dict[str, Any] = {
+        "name": name,
+        "status": "failed",
+        "startup_ms": None,
+        "handshake_ms": None,
+        "tools": None,
+        "server": None,
+        "error": None
+    }
+
+    command = spec.get("command")
+    if spec.get("type", "stdio") != "stdio" or not command:
+        result["status"] = "skipped"
+        result["error"] = f"not a stdio server ({spec.get('type') or 'no command'})"
+        return result
+
+    env = {**os.environ, **{key: str(value) for key, value in (spec.get("env") or {}).items()}}
+    started = time.monotonic()
+    deadline = started + timeout
+    try:
+        process = subprocess.Popen(
+            [command] + [str(arg) for arg in spec.get("args", [])],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            text=True,
+            bufsize=1
+        )
+    except OSError as e:
+        result["error"] = f"could not start {command}: {e}"
+        return result
+
+    session = _StdioSession(process)
+    try:
+        initialized = session.request(1, "initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "superclaude-doctor", "version": __version__}
+        }, deadline)
+        ready = time.monotonic()
+        result["startup_ms"] = round((ready - started) * 1000, 1)
+        server_info = initialized.get("serverInfo") or {}
+        result["server"] = " ".join(
+            part for part in (server_info.get("name"), server_info.get("version")) if part
+        ) or None
+
+        session.send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        if "tools" in (initialized.get("capabilities") or {}):
+            tools = session.request(2, "tools/list", {}, deadline)
+            result["tools"] = len(tools.get("tools", []))
+        result["handshake_ms"] = round((time.monotonic() - ready) * 1000, 1)
+        result["status"] = "ok"
+    except (TimeoutError, RuntimeError, OSError, ValueError) as e:
+        result["error"] = str(e)
+    finally:
+        session.close()
+
+    return result
+
+
+def check_servers(servers: Dict[str, Dict[str, Any]],
+                  timeout: float = DEFAULT_HEALTH_TIMEOUT,
+                  max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Check several MCP servers concurrently
+
+    Args:
+        servers: Dict of server name -> mcpServers entry
+        timeout: Seconds allowed per server
+        max_workers: Servers launched at once (default: DEFAULT_HEALTH_JOBS)
+
+    Returns:
+        check_server results in the order of servers
+    """
+    if not servers:
+        return []
+
+    logger = get_logger()
+    workers = max(1, min(max_workers or DEFAULT_HEALTH_JOBS, len(servers)))
+    names = list(servers)
+    logger.debug(f"Checking {len(names)} MCP servers with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda name: check_server(name, servers[name], timeout), names))
@@ -0,0 +1,305 @@
+"""
+MCP server registry helpers for SuperClaude installation system
+Parses Claude CLI server listings into an index keyed by server name and
+manages the mcpServers section of ~/.claude.json directly
+"""
+
+import copy
+import json
+import os
+import re
+import shlex
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# "name: command args - ✓ Connected" (the command part is optional)
+_ENTRY_PATTERN = re.compile(r'^(?P<name>[A-Za-z0-9@._/-]+)(?::\s*(?P<rest>.*))?$')
+
+# Trailing " - <status>" of a listing line, e.g. "- ✓ Connected"
+_STATUS_PATTERN = re.compile(r'\s+-\s+(?P<status>(?:[✓✗✔✘⚠!×]\s*)?[A-Za-z][^-]*)$')
+
+# Lines the CLI prints around the actual listing
+_NOISE_PREFIXES = ("checking", "no mcp servers", "#")
+
+
+def parse_mcp_list_output(output: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse `claude mcp list` output into a server index
+
+    Handles both the health-check format ("name: command args - ✓ Connected")
+    and bare server names, one per line.
+
+    Args:
+        output: Raw listing output
+
+    Returns:
+        Dict of lowercased server name -> {name, command, args, scope, status}
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+
+    for line in (output or "").splitlines():
+        line = line.strip()
+        if not line or line.lower().startswith(_NOISE_PREFIXES):
+            continue
+
+        match = _ENTRY_PATTERN.match(line)
+        if not match:
+            continue
+
+        name = match.group("name")
+        rest = (match.group("rest") or "").strip()
+        status = None
+
+        status_match = _STATUS_PATTERN.search(rest)
+        if status_match:
+            status = status_match.group("status").strip().lstrip("✓✗✔✘⚠!× ").strip()
+            rest = rest[:status_match.start()].strip()
+
+        command, args = _split_command(rest)
+        index[name.lower()] = {
+            "name": name,
+            "command": command,
+            "args": args,
+            "scope": None,
+            "status": status
+        }
+
+    return index
+
+
+def _split_command(command_line: str) -> Tuple[Optional[str], List[str]]:
+    """Split a listed command line into command and arguments"""
+    if not command_line:
+        return None, []
+    try:
+        parts = shlex.split(command_line)
+    except ValueError:
+        parts = command_line.split()
+    if not parts:
+        return None, []
+    return parts[0], parts[1:]
+
+
+def load_server_templates(configs_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load MCP server templates from SuperClaude/MCP/configs/*.json
+
+    Each file holds {server_name: spec}. When several files define the same
+    server (e.g. serena.json and serena-docker.json) the file named after
+    the server wins.
+
+    Args:
+        configs_dir: Directory containing the template files
+
+    Returns:
+        Dict of server name -> mcpServers spec
+    """
+    templates: Dict[str, Dict[str, Any]] = {}
+    preferred: Dict[str, bool] = {}
+
+    if not configs_dir.is_dir():
+        return templates
+
+    for config_file in sorted(configs_dir.glob("*.json")):
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+
+        for name, spec in data.items():
+            is_preferred = config_file.stem == name
+            if name in templates and (preferred[name] or not is_preferred):
+                continue
+            templates[name] = spec
+            preferred[name] = is_preferred
+
+    return templates
+
+
+class ClaudeConfigRegistry:
+    """Reads and writes the mcpServers section of ~/.claude.json in-process"""
+
+    def __init__(self, config_path: Optional[Path] = None):
+        """
+        Initialize registry
+
+        Args:
+            config_path: Claude config file (default: ~/.claude.json)
+        """
+        self.config_path = config_path or Path.home() / ".claude.json"
+        # Deliberately left in place after flush: the config itself is swapped
+        # by os.replace, so its inode cannot carry the lock, and unlinking the
+        # sidecar would let two writers lock different files
+        self.lock_path = self.config_path.with_name(f"{self.config_path.name}.lock")
+        self._servers: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _read_config(self) -> Dict[str, Any]:
+        """
+        Read the whole config file
+
+        Raises:
+            ValueError: If the file exists but is not a JSON object
+        """
+        if not self.config_path.exists():
+            return {}
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read {self.config_path}: {e}")
+        if not isinstance(config, dict):
+            raise ValueError(f"Unexpected content in {self.config_path}")
+        return config
+
+    def get_server_specs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the raw mcpServers entries, including changes not flushed yet
+
+        Returns:
+            Dict of server name -> mcpServers entry (copies)
+        """
+        with self._lock:
+            if self._servers is None:
+                self._servers = self._read_config().get("mcpServers", {}) or {}
+
+            servers = dict(self._servers)
+            for name, spec in self._pending.items():
+                if spec is None:
+                    servers.pop(name, None)
+                else:
+                    servers[name] = spec
+            return copy.deepcopy(servers)
+
+    def list_servers(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the registered servers, including changes not flushed yet
+
+        Returns:
+            Dict of lowercased server name -> {name, command, args, scope, status},
+            the same shape as parse_mcp_list_output
+        """
+        servers = self.get_server_specs()
+        return {
+            name.lower(): {
+                "name": name,
+                "command": spec.get("command") or spec.get("url"),
+                "args": list(spec.get("args", [])),
+                "scope": "user",
+                "status": None
+            }
+            for name, spec in servers.items()
+        }
+
+    def add_server(self, name: str, spec: Dict[str, Any]) -> None:
+        """
+        Stage a server registration (written by flush)
+
+        Args:
+            name: Server name
+            spec: mcpServers entry ({command, args, env, ...})
+        """
+        with self._lock:
+            self._pending[name] = copy.deepcopy(spec)
+
+    def remove_server(self, name: str) -> None:
+        """
+        Stage a server removal (written by flush)
+
+        Args:
+            name: Server name
+        """
+        with self._lock:
+            self._pending[name] = None
+
+    def has_pending_changes(self) -> bool:
+        """Whether add/remove calls are waiting for flush"""
+        with self._lock:
+            return bool(self._pending)
+
+    def flush(self) -> bool:
+        """
+        Write all staged changes in one locked read-modify-write
+
+        The file is re-read under the lock so concurrent edits to other keys
+        (or by other tools) are preserved, then replaced atomically.
+
+        Returns:
+            True if the changes were written
+
+        Raises:
+            ValueError: If the existing config cannot be parsed
+            OSError: If the file cannot be written
+        """
+        with self._lock:
+            if not self._pending:
+                return True
+
+            with self._file_lock():
+                config = self._read_config()
+                servers = dict(config.get("mcpServers", {}) or {})
+                for name, spec in self._pending.items():
+                    if spec is None:
+                        servers.pop(name, None)
+                    else:
+                        servers[name] = spec
+                config["mcpServers"] = servers
+                self._write_config(config)
+
+            self._servers = servers
+            self._pending.clear()
+            return True
+
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """
+        Write the config file atomically, keeping its permissions
+
+        A new file is created owner-only since it holds API keys.
+        """
+        temp_path = self.config_path.with_name(f".{self.config_path.name}.{os.getpid()}.tmp")
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+            if self.config_path.exists():
+                shutil.copymode(self.config_path, temp_path)
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        Hold an exclusive lock on the config's lock file (POSIX only)
+
+        The empty "<config>.lock" sidecar persists between runs and is safe
+        to ignore or delete while no install is running.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -5,11 +5,93 @@ Allows for manipulation of these json files with deep merge and backup
 """
 
 import json
+import os
+import re
 import shutil
-from typing import Dict, Any, Optional, List
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from pathlib import Path
 from datetime import datetime
 import copy
+import hashlib
+
+from ..utils.json_cache import get_json_cache
+from ..utils.merge import deep_merge, deep_merge_with_diff, apply_reverse_diff
+
+
+# Active metadata sessions keyed by resolved metadata file path
+_active_sessions: Dict[str, "MetadataSession"] = {}
+_sessions_lock = threading.Lock()
+
+# Serializes metadata read-modify-write cycles made outside a session
+_metadata_write_lock = threading.RLock()
+
+
+class MetadataSession:
+    """
+    In-memory unit of work over .superclaude-metadata.json
+
+    While a session is open, every SettingsService pointing at the same
+    metadata file reads and writes this shared view instead of the file.
+    The file is written once, atomically, when the session commits.
+    """
+
+    def __init__(self, settings_service: "SettingsService"):
+        """
+        Initialize metadata session
+
+        Args:
+            settings_service: Service owning the metadata file
+        """
+        self._service = settings_service
+        self.metadata_file = settings_service.metadata_file
+        self.lock = threading.RLock()
+        self.dirty = False
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Live metadata view, loaded from disk on first access"""
+        with self.lock:
+            if self._data is None:
+                self._data = self._service._read_metadata_file()
+            return self._data
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Get a private copy of the session metadata
+
+        Returns:
+            Metadata dict safe for the caller to modify
+        """
+        with self.lock:
+            return copy.deepcopy(self.data)
+
+    def save(self, metadata: Dict[str, Any]) -> None:
+        """
+        Replace the session metadata (written on commit)
+
+        Args:
+            metadata: Metadata dict to store
+        """
+        with self.lock:
+            self._data = metadata
+            self.dirty = True
+
+    def commit(self) -> bool:
+        """
+        Write pending changes to disk
+
+        Returns:
+            True if the metadata file was written, False if nothing changed
+        """
+        with self.lock:
+            if not self.dirty:
+                return False
+            self._service._write_metadata_file(self._data)
+            self.dirty = False
+            return True
 
 
 class SettingsService:
@@ -26,6 +108,7 @@ class SettingsService:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self._session_key = str(self.metadata_file.resolve())
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,12 +117,8 @@ class SettingsService:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return get_json_cache().load(self.settings_file) or {}
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
     
@@ -55,16 +134,52 @@ class SettingsService:
         if create_backup and self.settings_file.exists():
             self._create_settings_backup()
         
-        # Ensure directory exists
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        
         # Save with pretty formatting
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
+            self._write_json_atomic(self.settings_file, settings)
+        except (IOError, OSError) as e:
             raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
     
+    @contextmanager
+    def metadata_session(self) -> Iterator[MetadataSession]:
+        """
+        Open a metadata unit of work for the duration of an operation
+
+        All SettingsService instances for this install directory share the
+        session; the metadata file is written once when the outermost
+        session exits cleanly and discarded if it exits with an exception.
+        Nested calls join the already active session.
+
+        Yields:
+            The active MetadataSession
+        """
+        with _sessions_lock:
+            session = _active_sessions.get(self._session_key)
+            owner = session is None
+            if owner:
+                session = MetadataSession(self)
+                _active_sessions[self._session_key] = session
+
+        if not owner:
+            yield session
+            return
+
+        try:
+            yield session
+            session.commit()
+        finally:
+            with _sessions_lock:
+                _active_sessions.pop(self._session_key, None)
+
+    def _get_session(self) -> Optional[MetadataSession]:
+        """Get the metadata session active for this install directory"""
+        return _active_sessions.get(self._session_key)
+
+    def _metadata_lock(self) -> threading.RLock:
+        """Get the lock to hold across a metadata read-modify-write"""
+        session = self._get_session()
+        return session.lock if session is not None else _metadata_write_lock
+
     def load_metadata(self) -> Dict[str, Any]:
         """
         Load SuperClaude metadata from .superclaude-metadata.json
@@ -72,12 +187,30 @@ class SettingsService:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
+        session = self._get_session()
+        if session is not None:
+            return session.load()
+        return self._read_metadata_file()
+
+    def _read_metadata_file(self) -> Dict[str, Any]:
+        """Read metadata straight from disk, bypassing any session"""
+        try:
+            return get_json_cache().load(self.metadata_file) or {}
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+
+    def _peek_metadata(self) -> Dict[str, Any]:
+        """
+        Get a shared, read-only view of the metadata
+
+        Lookups use this to avoid copying the whole document; callers
+        must copy anything they hand back to their own callers.
+        """
+        session = self._get_session()
+        if session is not None:
+            return session.data
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return get_json_cache().read(self.metadata_file) or {}
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
     
@@ -88,16 +221,46 @@ class SettingsService:
         Args:
             metadata: Metadata dict to save
         """
-        # Ensure directory exists
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
+        session = self._get_session()
+        if session is not None:
+            session.save(metadata)
+            return
+        self._write_metadata_file(metadata)
+
+    def _write_metadata_file(self, metadata: Dict[str, Any]) -> None:
+        """Atomically write metadata to disk, bypassing any session"""
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
+            self._write_json_atomic(self.metadata_file, metadata)
+        except (IOError, OSError) as e:
             raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
 
+    def _write_json_atomic(self, path: Path, data: Dict[str, Any]) -> None:
+        """
+        Write JSON through a temporary file and rename it into place
+
+        An existing file keeps its permissions.
+
+        Args:
+            path: Destination file
+            data: JSON-serializable dict
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_name = str(path.parent / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            if path.exists():
+                shutil.copymode(path, temp_name)
+            os.replace(temp_name, path)
+            get_json_cache().invalidate(path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge modifications into existing settings
@@ -117,10 +280,21 @@ class SettingsService:
 
         Args:
             modifications: Settings modifications to apply
-            create_backup: Whether to create backup before updating
         """
-        merged = self.merge_metadata(modifications)
-        self.save_metadata(merged)
+        session = self._get_session()
+        if session is not None:
+            with session.lock:
+                merged, diff = deep_merge_with_diff(session.data, modifications)
+                if diff:
+                    session.save(merged)
+            return
+
+        # The merge never mutates its base, so the shared cached view can be
+        # used directly; unchanged metadata is not rewritten
+        with _metadata_write_lock:
+            merged, diff = deep_merge_with_diff(self._peek_metadata(), modifications)
+            if diff:
+                self._write_metadata_file(merged)
 
     def migrate_superclaude_data(self) -> bool:
         """
@@ -179,10 +353,21 @@ class SettingsService:
         
         Args:
             modifications: Settings modifications to apply
-            create_backup: Whether to create backup before updating
+            create_backup: Whether to record the change before updating
         """
-        merged = self.merge_settings(modifications)
-        self.save_settings(merged, create_backup)
+        try:
+            existing = get_json_cache().read(self.settings_file) or {}
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
+
+        merged, diff = deep_merge_with_diff(existing, modifications)
+        if not diff:
+            return
+
+        # Record only what changed instead of copying the whole file
+        if create_backup and self.settings_file.exists():
+            self._create_settings_diff_backup(diff, merged)
+        self.save_settings(merged, create_backup=False)
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -266,16 +451,17 @@ class SettingsService:
             component_name: Name of component
             component_info: Component metadata dict
         """
-        metadata = self.load_metadata()
-        if "components" not in metadata:
-            metadata["components"] = {}
-        
-        metadata["components"][component_name] = {
-            **component_info,
-            "installed_at": datetime.now().isoformat()
-        }
-        
-        self.save_metadata(metadata)
+        with self._metadata_lock():
+            metadata = self.load_metadata()
+            if "components" not in metadata:
+                metadata["components"] = {}
+            
+            metadata["components"][component_name] = {
+                **component_info,
+                "installed_at": datetime.now().isoformat()
+            }
+            
+            self.save_metadata(metadata)
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -287,12 +473,84 @@ class SettingsService:
         Returns:
             True if component was removed, False if not found
         """
-        metadata = self.load_metadata()
-        if "components" in metadata and component_name in metadata["components"]:
-            del metadata["components"][component_name]
+        with self._metadata_lock():
+            metadata = self.load_metadata()
+            if "components" in metadata and component_name in metadata["components"]:
+                del metadata["components"][component_name]
+                metadata.get("manifests", {}).pop(component_name, None)
+                self.save_metadata(metadata)
+                return True
+            return False
+    
+    def get_install_manifest(self, component_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the per-file manifest recorded for a component
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Dict of install-relative path -> {"sha256", "size", "mtime"}
+        """
+        metadata = self._peek_metadata()
+        return copy.deepcopy(metadata.get("manifests", {}).get(component_name, {}))
+    
+    def set_install_manifest(self, component_name: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the per-file manifest recorded for a component
+        
+        Manifests live beside the component registry rather than inside it,
+        so re-registering a component does not drop them.
+        
+        Args:
+            component_name: Name of component
+            manifest: Dict of install-relative path -> file record
+        """
+        with self._metadata_lock():
+            if self._peek_metadata().get("manifests", {}).get(component_name) == manifest:
+                return
+            
+            metadata = self.load_metadata()
+            metadata.setdefault("manifests", {})[component_name] = copy.deepcopy(manifest)
+            self.save_metadata(metadata)
+    
+    def get_component_records(self, component_name: str) -> Dict[str, Any]:
+        """
+        Snapshot a component's registration and manifest
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Dict with "registration" and "manifest" (None where absent),
+            for restore_component_records()
+        """
+        metadata = self._peek_metadata()
+        return copy.deepcopy({
+            "registration": metadata.get("components", {}).get(component_name),
+            "manifest": metadata.get("manifests", {}).get(component_name)
+        })
+    
+    def restore_component_records(self, component_name: str, records: Dict[str, Any]) -> None:
+        """
+        Put back a component's registration and manifest as snapshotted
+        
+        Args:
+            component_name: Name of component
+            records: Result of get_component_records()
+        """
+        with self._metadata_lock():
+            if self.get_component_records(component_name) == records:
+                return
+            
+            metadata = self.load_metadata()
+            for key, value in (("components", records["registration"]),
+                               ("manifests", records["manifest"])):
+                if value is None:
+                    metadata.get(key, {}).pop(component_name, None)
+                else:
+                    metadata.setdefault(key, {})[component_name] = copy.deepcopy(value)
             self.save_metadata(metadata)
-            return True
-        return False
     
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -301,8 +559,8 @@ class SettingsService:
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        metadata = self._peek_metadata()
+        return copy.deepcopy(metadata.get("components", {}))
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -314,8 +572,7 @@ class SettingsService:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
-        return component_name in components
+        return component_name in self._peek_metadata().get("components", {})
     
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
@@ -327,7 +584,7 @@ class SettingsService:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
+        components = self._peek_metadata().get("components", {})
         component_info = components.get(component_name, {})
         return component_info.get("version")
     
@@ -338,14 +595,15 @@ class SettingsService:
         Args:
             version: Framework version string
         """
-        metadata = self.load_metadata()
-        if "framework" not in metadata:
-            metadata["framework"] = {}
-        
-        metadata["framework"]["version"] = version
-        metadata["framework"]["updated_at"] = datetime.now().isoformat()
-        
-        self.save_metadata(metadata)
+        with self._metadata_lock():
+            metadata = self.load_metadata()
+            if "framework" not in metadata:
+                metadata["framework"] = {}
+            
+            metadata["framework"]["version"] = version
+            metadata["framework"]["updated_at"] = datetime.now().isoformat()
+            
+            self.save_metadata(metadata)
     
     def check_installation_exists(self) -> bool:
         """
@@ -376,13 +634,13 @@ class SettingsService:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
+        metadata = self._peek_metadata()
         
         try:
             value = metadata
             for key in key_path.split('.'):
                 value = value[key]
-            return value
+            return copy.deepcopy(value)
         except (KeyError, TypeError):
             return default
     
@@ -390,6 +648,9 @@ class SettingsService:
         """
         Deep merge two dictionaries
         
+        Only the dicts along modified paths are copied; the result shares
+        untouched subtrees with base.
+        
         Args:
             base: Base dictionary
             overlay: Dictionary to merge on top
@@ -397,15 +658,7 @@ class SettingsService:
         Returns:
             Merged dictionary
         """
-        result = copy.deepcopy(base)
-        
-        for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = copy.deepcopy(value)
-        
-        return result
+        return deep_merge(base, overlay)
     
     def _create_settings_backup(self) -> Path:
         """
@@ -421,10 +674,42 @@ class SettingsService:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
         # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_file = self.backup_dir / f"settings_{timestamp}.json"
         
-        shutil.copy2(self.settings_file, backup_file)
+        shutil.copyfile(self.settings_file, backup_file)
+        shutil.copymode(self.settings_file, backup_file)
+        
+        # Keep only last 10 backups
+        self._cleanup_old_backups()
+        
+        return backup_file
+    
+    def _create_settings_diff_backup(self, diff: List[Dict[str, Any]],
+                                     result: Dict[str, Any]) -> Path:
+        """
+        Record a settings change as a reversible diff
+        
+        Args:
+            diff: Diff entries from deep_merge_with_diff
+            result: Settings after the change
+            
+        Returns:
+            Path to diff backup file
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Diffs form a chain: each names the diff recorded before it, so a
+        # restore can tell whether every later change is still available
+        chain = self._diff_backups()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        backup_file = self.backup_dir / f"settings_{timestamp}.diff.json"
+        self._write_json_atomic(backup_file, {
+            "created": datetime.now().isoformat(),
+            "previous": chain[-1].name if chain else None,
+            "result": self._settings_digest(result),
+            "changes": diff
+        })
         
         # Keep only last 10 backups
         self._cleanup_old_backups()
@@ -441,20 +726,36 @@ class SettingsService:
         if not self.backup_dir.exists():
             return
         
-        # Get all backup files sorted by modification time
-        backup_files = []
-        for file in self.backup_dir.glob("settings_*.json"):
-            backup_files.append((file.stat().st_mtime, file))
-        
-        backup_files.sort(reverse=True)  # Most recent first
+        # Oldest backups go first, so a diff chain is only ever cut at its
+        # old end and every newer diff stays restorable
+        backup_files = sorted(self.backup_dir.glob("settings_*.json"),
+                              key=self._backup_sort_key, reverse=True)
         
         # Remove old backups
-        for _, file in backup_files[keep_count:]:
+        for file in backup_files[keep_count:]:
             try:
                 file.unlink()
             except OSError:
                 pass  # Ignore errors when cleaning up
     
+    @staticmethod
+    def _backup_sort_key(file: Path) -> str:
+        """Order backups by the timestamp in their name (oldest first)"""
+        digits = re.sub(r"\D", "", file.name)
+        return digits.ljust(20, "0")
+    
+    @staticmethod
+    def _settings_digest(settings: Dict[str, Any]) -> str:
+        """Fingerprint settings so a diff chain can be matched to them"""
+        encoded = json.dumps(settings, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _diff_backups(self) -> List[Path]:
+        """Get diff backups, oldest first"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob("settings_*.diff.json"), key=self._backup_sort_key)
+    
     def list_backups(self) -> List[Dict[str, Any]]:
         """
         List available settings backups
@@ -501,7 +802,30 @@ class SettingsService:
         try:
             # Validate backup file first
             with open(backup_file, 'r', encoding='utf-8') as f:
-                json.load(f)  # Will raise exception if invalid
+                backup_data = json.load(f)  # Will raise exception if invalid
+            
+            # Diff backups are restored by reverting every change from the
+            # newest one back to the chosen one
+            if backup_name.endswith(".diff.json"):
+                undone = self._diff_chain_to(backup_file)
+                if undone is None:
+                    return False
+                
+                restored = self.load_settings()
+                for path, data in undone:
+                    restored = apply_reverse_diff(restored, data.get("changes", []))
+                
+                if self.settings_file.exists():
+                    self._create_settings_backup()
+                self.save_settings(restored, create_backup=False)
+                
+                # The undone diffs no longer describe the current settings
+                for path, _ in undone:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                return True
             
             # Create backup of current settings
             if self.settings_file.exists():
@@ -509,7 +833,45 @@ class SettingsService:
             
             # Restore backup
             shutil.copy2(backup_file, self.settings_file)
+            get_json_cache().invalidate(self.settings_file)
             return True
             
         except (json.JSONDecodeError, IOError):
             return False
+    
+    def _diff_chain_to(self, backup_file: Path) -> Optional[List[Tuple[Path, Dict[str, Any]]]]:
+        """
+        Load the diff backups from the newest back to a given one
+        
+        Args:
+            backup_file: Oldest diff backup to include
+            
+        Returns:
+            List of (path, diff data), newest first, or None if a diff in
+            between is missing or unreadable, or the settings were changed
+            since the newest diff (e.g. edited by hand or restored from a
+            full backup)
+        """
+        chain = self._diff_backups()
+        if not chain:
+            return None
+        
+        undone = []
+        expected = self._settings_digest(self.load_settings())
+        current: Optional[Path] = chain[-1]
+        while current is not None:
+            try:
+                with open(current, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if not undone and data.get("result") != expected:
+                return None
+            undone.append((current, data))
+            if current == backup_file:
+                return undone
+            previous = data.get("previous")
+            current = self.backup_dir / previous if previous else None
+        
+        # Reached the start of the chain without meeting the requested diff
+        return None
@@ -0,0 +1,138 @@
+"""
+Staged installation for SuperClaude installation system
+Component files are written beside the install directory and renamed into
+place only once the component has installed successfully
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from ..utils.logger import get_logger
+from ..utils.paths import STAGING_DIR
+
+
+class StagingArea:
+    """Collects a component's files in a staging directory until commit"""
+
+    def __init__(self, install_dir: Path, label: str):
+        """
+        Initialize staging area
+
+        The staging directory lives inside install_dir so that commit is a
+        same-filesystem rename. Nothing is created until a file is staged.
+
+        Args:
+            install_dir: Installation directory (typically ~/.claude)
+            label: Name used for the staging subdirectory (e.g. component name)
+        """
+        self.install_dir = Path(install_dir)
+        self.root = self.install_dir / STAGING_DIR / f"{label}-{os.getpid()}"
+        self.logger = get_logger()
+        self._staged: Dict[Path, Path] = {}
+        self._lock = threading.Lock()
+
+    def stage_path(self, target: Path) -> Path:
+        """
+        Get the staging path for a final target path
+
+        Targets outside the install directory cannot be staged and are
+        returned unchanged, so they are written in place.
+
+        Args:
+            target: Final installation path
+
+        Returns:
+            Path to write the file to before commit
+        """
+        try:
+            relative = target.relative_to(self.install_dir)
+        except ValueError:
+            return target
+
+        staged = self.root / relative
+        with self._lock:
+            self._staged[staged] = target
+        return staged
+
+    def target_for(self, path: Path) -> Path:
+        """
+        Get the final target path for a staged path
+
+        Args:
+            path: Path returned by stage_path
+
+        Returns:
+            Final installation path
+        """
+        with self._lock:
+            return self._staged.get(path, path)
+
+    def commit(self) -> List[Path]:
+        """
+        Move every staged file into place and remove the staging directory
+
+        Files being replaced are first moved aside inside the staging
+        directory. If any rename fails, the files already committed are
+        restored before the error is raised, so the install directory is
+        left as it was.
+
+        Returns:
+            List of target paths that were replaced
+
+        Raises:
+            OSError: If a file could not be moved into place (after rollback)
+        """
+        with self._lock:
+            staged_items = list(self._staged.items())
+            self._staged.clear()
+
+        replaced_dir = self.root.with_name(f"{self.root.name}.replaced")
+        # (target, previous file moved aside or None if the target was new)
+        committed: List[Tuple[Path, Optional[Path]]] = []
+        try:
+            for index, (staged, target) in enumerate(staged_items):
+                if not staged.exists():
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                previous = None
+                if target.exists():
+                    replaced_dir.mkdir(parents=True, exist_ok=True)
+                    previous = replaced_dir / str(index)
+                    os.replace(target, previous)
+                committed.append((target, previous))
+                os.replace(staged, target)
+        except OSError:
+            self._rollback(committed)
+            raise
+        finally:
+            shutil.rmtree(replaced_dir, ignore_errors=True)
+            self.discard()
+
+        self.logger.debug(f"Committed {len(committed)} staged files from {self.root}")
+        return [target for target, _ in committed]
+
+    def _rollback(self, committed: List[Tuple[Path, Optional[Path]]]) -> None:
+        """Put back the files replaced by a failed commit"""
+        for target, previous in reversed(committed):
+            try:
+                if previous is not None and previous.exists():
+                    os.replace(previous, target)
+                elif previous is None and target.exists():
+                    target.unlink()
+            except OSError as e:
+                self.logger.error(f"Could not restore {target} after failed commit: {e}")
+
+    def discard(self) -> None:
+        """Remove the staging directory and everything in it"""
+        with self._lock:
+            self._staged.clear()
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+        # Remove the shared staging parent once no install is using it
+        try:
+            self.root.parent.rmdir()
+        except OSError:
+            pass
@@ -0,0 +1,214 @@
+"""
+Tool probing service for SuperClaude installation system
+Runs `<tool> --version` probes concurrently and caches the results per
+process and on disk, keyed by the resolved binary and its mtime
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+
+# Probe results persisted between runs
+PROBE_CACHE_FILE = "tool_probes.json"
+
+DEFAULT_PROBE_TIMEOUT = 10
+
+
+class ToolProbeService:
+    """Finds external tools (node, npm, claude, uv, ...) and their versions"""
+
+    # Results shared by every instance for the lifetime of the process
+    _results: Dict[str, Dict[str, Any]] = {}
+    _results_lock = threading.Lock()
+
+    def __init__(self,
+                 cache_path: Optional[Path] = None,
+                 runner: Optional[Callable[..., subprocess.CompletedProcess]] = None,
+                 timeout: int = DEFAULT_PROBE_TIMEOUT):
+        """
+        Initialize tool probe service
+
+        Args:
+            cache_path: JSON file to persist probe results in (None: process cache only)
+            runner: Runs a command list for tools not found on PATH, e.g. a
+                    CommandRunner, which only goes through the user's shell
+                    when SUPERCLAUDE_SHELL_FALLBACK is set (default: subprocess.run)
+            timeout: Seconds to wait for each probe
+        """
+        self.cache_path = cache_path
+        self.runner = runner or subprocess.run
+        self.timeout = timeout
+        self.logger = get_logger()
+        self._disk_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._disk_lock = threading.Lock()
+        self._disk_dirty = False
+
+    def probe(self, tool: str) -> Dict[str, Any]:
+        """
+        Probe a single tool
+
+        Args:
+            tool: Executable name
+
+        Returns:
+            Dict with tool, available, version and path
+        """
+        result = self._probe(tool)
+        self._save_disk_cache()
+        return result
+
+    def probe_many(self, tools: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe several tools concurrently
+
+        Args:
+            tools: Executable names
+
+        Returns:
+            Dict of tool -> probe result (see probe())
+        """
+        tools = list(dict.fromkeys(tools))
+        if not tools:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            results = dict(zip(tools, executor.map(self._probe, tools)))
+
+        self._save_disk_cache()
+        return results
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget the process-wide results (the disk cache is kept)"""
+        with cls._results_lock:
+            cls._results.clear()
+
+    def _probe(self, tool: str) -> Dict[str, Any]:
+        """Probe a tool, using the process and disk caches when still valid"""
+        command, path, mtime_ns = self._resolve(tool)
+
+        with self._results_lock:
+            cached = self._results.get(tool)
+        if cached is not None and cached.get("path") == path and cached.get("mtime_ns") == mtime_ns:
+            return cached
+
+        if path is not None:
+            with self._disk_lock:
+                entry = self._load_disk_cache().get(tool)
+            if entry and entry.get("path") == path and entry.get("mtime_ns") == mtime_ns:
+                result = self._make_result(tool, entry.get("version"), path, mtime_ns)
+                self.logger.debug(f"Using cached probe for {tool}: {result['version']}")
+            else:
+                result = self._run_probe(tool, [command, "--version"], path, mtime_ns)
+                if result["available"]:
+                    with self._disk_lock:
+                        self._load_disk_cache()[tool] = {
+                            "path": path,
+                            "mtime_ns": mtime_ns,
+                            "version": result["version"]
+                        }
+                        self._disk_dirty = True
+        else:
+            # Not on this process's PATH; the runner may still find it
+            # (e.g. through $SHELL when SUPERCLAUDE_SHELL_FALLBACK is set),
+            # but there is nothing stable to key a persisted result on
+            result = self._run_probe(tool, [tool, "--version"], None, None)
+
+        with self._results_lock:
+            self._results[tool] = result
+        return result
+
+    @staticmethod
+    def _resolve(tool: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        """
+        Resolve a tool on PATH and the real binary behind it
+
+        The PATH entry is what gets run: shims such as volta's pick the
+        real tool from the name they were called by, so running the
+        symlink target would call them under the wrong name. The real
+        path and its mtime only key the caches.
+
+        Returns:
+            (command, real path, mtime_ns), or (None, None, None) if the
+            tool is not on PATH
+        """
+        command = shutil.which(tool)
+        if not command:
+            return None, None, None
+        path = os.path.realpath(command)
+        try:
+            return command, path, os.stat(path).st_mtime_ns
+        except OSError:
+            return None, None, None
+
+    def _run_probe(self, tool: str, cmd: List[str],
+                   path: Optional[str], mtime_ns: Optional[int]) -> Dict[str, Any]:
+        """Run a version probe and build its result"""
+        try:
+            if path is not None:
+                completed = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
+            else:
+                completed = self.runner(cmd, capture_output=True, text=True, timeout=self.timeout)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.logger.debug(f"Probe for {tool} failed: {e}")
+            return self._make_result(tool, None, path, mtime_ns, available=False)
+
+        if completed.returncode != 0:
+            return self._make_result(tool, None, path, mtime_ns, available=False)
+
+        output = (completed.stdout or "").strip() or (completed.stderr or "").strip()
+        version = output.splitlines()[0].strip() if output else ""
+        return self._make_result(tool, version, path, mtime_ns)
+
+    @staticmethod
+    def _make_result(tool: str, version: Optional[str], path: Optional[str],
+                     mtime_ns: Optional[int], available: bool = True) -> Dict[str, Any]:
+        """Build a probe result"""
+        return {
+            "tool": tool,
+            "available": available,
+            "version": version,
+            "path": path,
+            "mtime_ns": mtime_ns
+        }
+
+    def _load_disk_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted probe results once"""
+        if self._disk_cache is None:
+            self._disk_cache = {}
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._disk_cache = data
+                except (OSError, ValueError) as e:
+                    self.logger.debug(f"Ignoring unreadable probe cache {self.cache_path}: {e}")
+        return self._disk_cache
+
+    def _save_disk_cache(self) -> None:
+        """Persist new probe results (best effort)"""
+        with self._disk_lock:
+            if not self._disk_dirty or self.cache_path is None:
+                return
+            self._disk_dirty = False
+            temp_path = self.cache_path.with_name(f".{self.cache_path.name}.{os.getpid()}.tmp")
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._disk_cache, f, indent=2, sort_keys=True)
+                os.replace(temp_path, self.cache_path)
+            except OSError as e:
+                self.logger.debug(f"Could not write probe cache {self.cache_path}: {e}")
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
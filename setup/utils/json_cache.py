@@ -0,0 +1,110 @@
+"""
+Process-wide cache of parsed JSON files for SuperClaude installation system
+Entries are keyed by path and validated against the file's stat signature
+"""
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+StatSignature = Tuple[int, int, int]
+
+
+class JSONFileCache:
+    """Caches parsed JSON documents until the file on disk changes"""
+
+    def __init__(self):
+        """Initialize empty cache"""
+        self._entries: Dict[str, Tuple[StatSignature, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[StatSignature]:
+        """
+        Get the stat signature used to detect changes
+
+        Args:
+            path: File path
+
+        Returns:
+            (mtime_ns, size, inode) or None if the file doesn't exist
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def read(self, path: Path) -> Optional[Any]:
+        """
+        Get the shared parsed document for a file
+
+        The returned object is shared by every caller and must be treated
+        as read-only; use load() for a private copy.
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            Parsed JSON or None if the file doesn't exist
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+            OSError: If the file cannot be read
+        """
+        key = str(path)
+        signature = self._signature(path)
+        if signature is None:
+            self.invalidate(path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        with self._lock:
+            self._entries[key] = (signature, data)
+        return data
+
+    def load(self, path: Path) -> Optional[Any]:
+        """
+        Get a private copy of the parsed document for a file
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            Parsed JSON safe to modify, or None if the file doesn't exist
+        """
+        return copy.deepcopy(self.read(path))
+
+    def invalidate(self, path: Path) -> None:
+        """
+        Drop the cached document for a file (call after writing it)
+
+        Args:
+            path: JSON file path
+        """
+        with self._lock:
+            self._entries.pop(str(path), None)
+
+    def clear(self) -> None:
+        """Drop all cached documents"""
+        with self._lock:
+            self._entries.clear()
+
+
+_json_cache = JSONFileCache()
+
+
+def get_json_cache() -> JSONFileCache:
+    """Get the process-wide JSON file cache"""
+    return _json_cache
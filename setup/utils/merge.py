@@ -0,0 +1,112 @@
+"""
+Structural-sharing deep merge for SuperClaude settings and metadata
+Only the dicts along modified paths are copied; untouched subtrees are
+shared with the base document
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+# Marker for "key did not exist" in diff entries
+_MISSING = object()
+
+
+def deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep merge overlay on top of base without copying untouched subtrees
+
+    Neither argument is modified. The result shares every subtree that
+    the overlay does not change with base, so callers must treat base and
+    result as immutable snapshots (copy before mutating in place).
+
+    Args:
+        base: Base dictionary
+        overlay: Dictionary to merge on top
+
+    Returns:
+        Merged dictionary (base itself if nothing changed)
+    """
+    merged, _ = deep_merge_with_diff(base, overlay)
+    return merged
+
+
+def deep_merge_with_diff(base: Dict[str, Any],
+                         overlay: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Deep merge overlay on top of base and report what changed
+
+    Args:
+        base: Base dictionary
+        overlay: Dictionary to merge on top
+
+    Returns:
+        Tuple of (merged dict, diff). Each diff entry is a dict with
+        "path" (list of keys), "op" ("add" or "change"), "new" and, for
+        changes, "old".
+    """
+    diff: List[Dict[str, Any]] = []
+    merged = _merge(base, overlay, [], diff)
+    return merged, diff
+
+
+def _merge(base: Dict[str, Any], overlay: Dict[str, Any],
+           path: List[str], diff: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge one level, copying base only if something below it changed"""
+    result = base
+
+    for key, value in overlay.items():
+        current = base.get(key, _MISSING)
+
+        if isinstance(current, dict) and isinstance(value, dict):
+            new_value = _merge(current, value, path + [key], diff)
+            if new_value is current:
+                continue
+        elif current is not _MISSING and current == value:
+            continue
+        else:
+            # Overlay values are copied so the result never aliases the
+            # caller's modifications; this is proportional to the change
+            new_value = copy.deepcopy(value)
+            entry = {"path": path + [key], "op": "add" if current is _MISSING else "change", "new": new_value}
+            if current is not _MISSING:
+                entry["old"] = current
+            diff.append(entry)
+
+        if result is base:
+            result = dict(base)
+        result[key] = new_value
+
+    return result
+
+
+def apply_reverse_diff(document: Dict[str, Any], diff: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Undo a diff produced by deep_merge_with_diff
+
+    Args:
+        document: Document the diff was applied to
+        diff: Diff entries to revert
+
+    Returns:
+        New document with added keys removed and changed keys restored
+    """
+    result = copy.deepcopy(document)
+
+    for entry in reversed(diff):
+        keys = entry["path"]
+        parent = result
+        try:
+            for key in keys[:-1]:
+                parent = parent[key]
+        except (KeyError, TypeError):
+            continue
+        if not isinstance(parent, dict):
+            continue
+
+        if entry["op"] == "add":
+            parent.pop(keys[-1], None)
+        else:
+            parent[keys[-1]] = copy.deepcopy(entry["old"])
+
+    return result
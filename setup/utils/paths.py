@@ -7,6 +7,13 @@ import os
 from pathlib import Path
 
 
+# Per-installation cache directory (excluded from backups)
+CACHE_DIR = ".superclaude-cache"
+
+# Per-installation directory components are staged in before commit
+STAGING_DIR = ".superclaude-staging"
+
+
 def get_home_directory() -> Path:
     """
     Get the correct home directory path, handling immutable distros.
@@ -51,4 +58,24 @@ def get_home_directory() -> Path:
 
     # Method 3: Last resort - use the original Path.home() even if it seems wrong
     # This ensures we don't crash the installation
-    return Path.home()
\ No newline at end of file
+    return Path.home()
+
+
+def get_user_cache_directory() -> Path:
+    """
+    Get the per-user cache directory for SuperClaude.
+
+    Honours SUPERCLAUDE_CACHE_DIR, then XDG_CACHE_HOME, and falls back to
+    ~/.cache/superclaude. Unlike the install directory's cache, this one
+    is shared by every installation the user runs.
+
+    Returns:
+        Path: Cache directory (not created)
+    """
+    override = os.environ.get('SUPERCLAUDE_CACHE_DIR')
+    if override:
+        return Path(override)
+
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    base = Path(xdg_cache) if xdg_cache else get_home_directory() / '.cache'
+    return base / 'superclaude'
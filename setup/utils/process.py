@@ -0,0 +1,153 @@
+"""
+Subprocess runner for SuperClaude installation system
+Executes commands directly with cached executable lookups instead of going
+through the user's shell, and records how long each command took
+"""
+
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .logger import get_logger
+
+
+# Set to run commands that are not on PATH through $SHELL (aliases, functions)
+SHELL_FALLBACK_ENV = "SUPERCLAUDE_SHELL_FALLBACK"
+
+# Exit status reported for commands that cannot be found, as a shell would
+COMMAND_NOT_FOUND = 127
+
+
+class CommandRunner:
+    """Runs commands without spawning a shell per call"""
+
+    def __init__(self, shell_fallback: Optional[bool] = None):
+        """
+        Initialize command runner
+
+        Args:
+            shell_fallback: Run commands not found on PATH through $SHELL so
+                            aliases resolve (default: from SUPERCLAUDE_SHELL_FALLBACK)
+        """
+        if shell_fallback is None:
+            shell_fallback = os.environ.get(SHELL_FALLBACK_ENV, "").lower() in ("1", "true", "yes")
+        self.shell_fallback = shell_fallback
+        self.logger = get_logger()
+        self._paths: Dict[str, Optional[str]] = {}
+        self._timings: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def which(self, executable: str) -> Optional[str]:
+        """
+        Resolve an executable on PATH, caching the result
+
+        Args:
+            executable: Command name or path
+
+        Returns:
+            Full path, or None if not found
+        """
+        with self._lock:
+            if executable in self._paths:
+                return self._paths[executable]
+
+        path = shutil.which(executable)
+        with self._lock:
+            self._paths[executable] = path
+        return path
+
+    def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a command
+
+        On Windows the command is wrapped in `cmd /c` so .cmd shims such as
+        npx resolve. Elsewhere the executable is looked up once and exec'd
+        directly; a missing command yields exit status 127 unless the shell
+        fallback is enabled.
+
+        Args:
+            cmd: Command as list of strings
+            **kwargs: Additional subprocess.run arguments
+
+        Returns:
+            CompletedProcess result
+        """
+        cmd = [str(arg) for arg in cmd]
+        start = time.perf_counter()
+        result = None
+        try:
+            result = self._run(cmd, **kwargs)
+            return result
+        finally:
+            self._record(cmd, time.perf_counter() - start, result)
+
+    def _run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Dispatch a command to the platform-specific execution path"""
+        if platform.system() == "Windows":
+            return subprocess.run(["cmd", "/c"] + cmd, **kwargs)
+
+        executable = self.which(cmd[0])
+        if executable is not None:
+            return subprocess.run([executable] + cmd[1:], **kwargs)
+
+        if self.shell_fallback:
+            # Opt-in: let the user's shell resolve aliases and functions
+            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
+            user_shell = os.environ.get('SHELL', '/bin/bash')
+            kwargs.setdefault("env", os.environ)
+            return subprocess.run(cmd_str, shell=True, executable=user_shell, **kwargs)
+
+        message = f"{cmd[0]}: command not found"
+        text = kwargs.get("text") or kwargs.get("universal_newlines") or kwargs.get("encoding")
+        captured = kwargs.get("capture_output") or kwargs.get("stderr") == subprocess.PIPE
+        if not captured:
+            return subprocess.CompletedProcess(cmd, COMMAND_NOT_FOUND)
+        if text:
+            return subprocess.CompletedProcess(cmd, COMMAND_NOT_FOUND, "", message)
+        return subprocess.CompletedProcess(cmd, COMMAND_NOT_FOUND, b"", message.encode())
+
+    def _record(self, cmd: List[str], seconds: float,
+                result: Optional[subprocess.CompletedProcess]) -> None:
+        """Record the timing of a finished (or failed) command"""
+        returncode = result.returncode if result is not None else None
+        with self._lock:
+            self._timings.append({
+                "command": cmd,
+                "seconds": seconds,
+                "returncode": returncode
+            })
+        self.logger.debug(f"{' '.join(cmd[:3])} took {seconds:.2f}s (exit {returncode})")
+
+    def get_timings(self) -> List[Dict[str, Any]]:
+        """
+        Get per-command timings in completion order
+
+        Returns:
+            List of {command, seconds, returncode} (returncode is None if
+            the command raised, e.g. on timeout)
+        """
+        with self._lock:
+            return list(self._timings)
+
+    def clear_cache(self) -> None:
+        """Forget resolved executables (e.g. after installing a tool)"""
+        with self._lock:
+            self._paths.clear()
+
+
+_runner: Optional[CommandRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_runner() -> CommandRunner:
+    """Get the process-wide command runner"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = CommandRunner()
+        return _runner
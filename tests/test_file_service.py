@@ -0,0 +1,52 @@
+import pytest
+from pathlib import Path
+from setup.services.files import FileService
+
+
+class TestFileService:
+    def test_copy_many_reports_per_file_results(self, tmp_path):
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        pairs = []
+        for i in range(5):
+            source = source_dir / f"file{i}.md"
+            source.write_text(f"content {i}")
+            pairs.append((source, tmp_path / "out" / "nested" / source.name))
+        pairs.append((source_dir / "missing.md", tmp_path / "out" / "missing.md"))
+
+        service = FileService()
+        results = service.copy_many(pairs, max_workers=3)
+
+        assert [r["target"] for r in results] == [target for _, target in pairs]
+        assert [r["success"] for r in results] == [True] * 5 + [False]
+        assert results[-1]["error"]
+        assert (tmp_path / "out" / "nested" / "file3.md").read_text() == "content 3"
+        assert len(service.copied_files) == 5
+
+    @pytest.mark.parametrize("copy_mode", ["clone", "hardlink"])
+    def test_copy_modes_produce_identical_files(self, tmp_path, copy_mode):
+        source = tmp_path / "source.md"
+        source.write_text("framework")
+        target = tmp_path / "out" / "source.md"
+        target.parent.mkdir()
+        target.write_text("stale")
+
+        results = FileService().copy_many([(source, target)], copy_mode=copy_mode)
+
+        assert results[0]["success"]
+        assert target.read_text() == "framework"
+        assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    def test_copy_does_not_write_through_hardlinks(self, tmp_path):
+        source = tmp_path / "source.md"
+        source.write_text("v1")
+        target = tmp_path / "target.md"
+        service = FileService()
+        service.copy_many([(source, target)], copy_mode="hardlink")
+
+        update = tmp_path / "update.md"
+        update.write_text("v2")
+        service.copy_many([(update, target)])
+
+        assert target.read_text() == "v2"
+        assert source.read_text() == "v1"
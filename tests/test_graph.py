@@ -0,0 +1,50 @@
+import pytest
+
+from setup.core.graph import CycleError, DependencyGraph
+
+
+def make_graph():
+    return DependencyGraph({
+        "core": [],
+        "commands": ["core"],
+        "agents": ["core"],
+        "mcp": ["core"],
+        "mcp_docs": ["core", "mcp"],
+    })
+
+
+def test_levels_group_components_by_dependency_depth():
+    graph = make_graph()
+    assert graph.levels() == [["core"], ["commands", "agents", "mcp"], ["mcp_docs"]]
+    assert graph.levels(["mcp_docs"]) == [["core"], ["mcp"], ["mcp_docs"]]
+
+
+def test_resolve_orders_dependencies_first():
+    graph = make_graph()
+    assert graph.resolve(["mcp_docs", "commands"]) == ["core", "mcp", "mcp_docs", "commands"]
+    assert graph.resolve(["commands"], satisfied={"core"}) == ["commands"]
+    assert graph.sort(["mcp_docs", "mcp", "unknown"]) == ["mcp", "mcp_docs", "unknown"]
+    with pytest.raises(ValueError, match="Unknown component: missing"):
+        graph.resolve(["missing"])
+
+
+def test_dependents_use_reverse_index():
+    graph = make_graph()
+    assert graph.get_dependents("mcp") == {"mcp_docs"}
+    assert graph.get_dependents("core", transitive=True) == {"commands", "agents", "mcp", "mcp_docs"}
+
+    graph.add("extras", ["mcp_docs"])
+    assert graph.get_dependents("core", transitive=True) >= {"extras"}
+
+
+def test_cycles_are_reported_with_their_path():
+    graph = make_graph()
+    graph.add("core", ["mcp_docs"])
+
+    assert graph.find_cycle() == ["core", "mcp_docs", "core"]
+    with pytest.raises(CycleError) as excinfo:
+        graph.levels()
+    assert excinfo.value.cycle == ["core", "mcp_docs", "core"]
+    with pytest.raises(CycleError, match="core -> mcp_docs -> core"):
+        graph.resolve(["mcp"])
+    assert graph.validate() == ["Circular dependency detected: core -> mcp_docs -> core"]
@@ -93,3 +93,236 @@ class TestInstaller:
         # Assert
         mock_comp1.validate_installation.assert_called_once()
         mock_comp2.validate_installation.assert_not_called()
+
+    def test_failed_staged_install_leaves_existing_files_untouched(self, tmp_path):
+        from unittest.mock import patch
+        from setup.components.mcp_docs import MCPDocsComponent
+        from setup.services.staging import STAGING_DIR
+
+        existing = tmp_path / "MCP_Magic.md"
+        existing.write_text("previous version")
+
+        component = MCPDocsComponent(install_dir=tmp_path)
+        installer = Installer(install_dir=tmp_path)
+        installer.register_component(component)
+        config = {"selected_mcp_servers": ["magic"]}
+
+        with patch('setup.core.base.Component.validate_prerequisites', return_value=(True, [])), \
+             patch.object(MCPDocsComponent, '_detect_existing_mcp_servers_from_config', return_value=[]):
+            with patch.object(MCPDocsComponent, '_post_install', return_value=False):
+                assert not installer.install_component('mcp_docs', config)
+
+            assert existing.read_text() == "previous version"
+            assert not (tmp_path / STAGING_DIR).exists()
+
+            with patch.object(MCPDocsComponent, '_post_install', return_value=True):
+                assert installer.install_component('mcp_docs', config)
+
+        assert existing.read_text() != "previous version"
+        assert not (tmp_path / STAGING_DIR).exists()
+
+    def test_failed_staging_commit_does_not_register_component(self, tmp_path):
+        from unittest.mock import patch
+        from setup.components.mcp_docs import MCPDocsComponent
+        from setup.services.staging import StagingArea
+
+        component = MCPDocsComponent(install_dir=tmp_path)
+        installer = Installer(install_dir=tmp_path)
+        installer.register_component(component)
+        config = {"selected_mcp_servers": ["magic"]}
+
+        with component.settings_manager.metadata_session():
+            with patch('setup.core.base.Component.validate_prerequisites', return_value=(True, [])), \
+                 patch.object(MCPDocsComponent, '_detect_existing_mcp_servers_from_config', return_value=[]), \
+                 patch.object(StagingArea, 'commit', side_effect=OSError("disk full")):
+                assert not installer.install_component('mcp_docs', config)
+
+        assert 'mcp_docs' in installer.failed_components
+        assert not component.settings_manager.is_component_installed('mcp_docs')
+        assert component.settings_manager.get_install_manifest('mcp_docs') == {}
+        assert not (tmp_path / "MCP_Magic.md").exists()
+
+    def test_create_backup_streams_tree_with_excludes(self, tmp_path):
+        (tmp_path / "commands" / "sc").mkdir(parents=True)
+        (tmp_path / "commands" / "sc" / "build.md").write_text("build")
+        (tmp_path / "CLAUDE.md").write_text("imports")
+        (tmp_path / "local").mkdir()
+        (tmp_path / "local" / "cache.bin").write_text("skip me")
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "logs" / "install.log").write_text("skip me too")
+
+        installer = Installer(install_dir=tmp_path)
+        backup_path = installer.create_backup(excludes=["logs"])
+
+        with tarfile.open(backup_path, "r:gz") as tar:
+            names = set(tar.getnames())
+        assert names == {"CLAUDE.md", "commands", "commands/sc", "commands/sc/build.md"}
+        assert installer.backup_stats["files"] == 2
+        assert installer.backup_stats["bytes"] == len("build") + len("imports")
+        assert sorted(p.name for p in (tmp_path / "backups").iterdir()) == [
+            backup_path.name.replace(".tar.gz", ".index.json"), backup_path.name
+        ]
+
+    def test_default_backup_skips_leftover_staging_tree(self, tmp_path):
+        (tmp_path / "CLAUDE.md").write_text("imports")
+        (tmp_path / ".superclaude-staging" / "core-1").mkdir(parents=True)
+        (tmp_path / ".superclaude-staging" / "core-1" / "CLAUDE.md").write_text("leftover")
+
+        backup_path = Installer(install_dir=tmp_path).create_backup()
+
+        with tarfile.open(backup_path, "r:gz") as tar:
+            assert set(tar.getnames()) == {"CLAUDE.md"}
+
+    def test_backup_listing_reads_sidecar_index(self, tmp_path):
+        from unittest.mock import patch
+        from setup.cli.commands.backup import list_backups
+        from setup.services.backup import read_backup_index
+
+        (tmp_path / "CLAUDE.md").write_text("imports")
+        backup_path = Installer(install_dir=tmp_path).create_backup()
+
+        index = read_backup_index(backup_path)
+        assert index["files"] == 1
+        assert set(index["members"]) == {"CLAUDE.md"}
+
+        with patch('setup.cli.commands.backup.tarfile.open') as mock_open:
+            backups = list_backups(tmp_path / "backups")
+            mock_open.assert_not_called()
+        assert [b["path"] for b in backups] == [backup_path]
+        assert backups[0]["files"] == 1
+
+    def test_backup_pads_member_that_shrinks_and_leaves_it_out_of_index(self, tmp_path):
+        import tarfile
+        from unittest.mock import patch
+        from setup.services.backup import BackupService, read_backup_index
+
+        install_dir = tmp_path / "install"
+        install_dir.mkdir()
+        (install_dir / "CLAUDE.md").write_text("imports")
+        (install_dir / "MODE_Brainstorming.md").write_text("mode")
+        service = BackupService(install_dir)
+
+        gettarinfo = tarfile.TarFile.gettarinfo
+
+        def stale_stat(tar, name=None, arcname=None, fileobj=None):
+            info = gettarinfo(tar, name, arcname, fileobj)
+            if arcname == "CLAUDE.md":
+                info.size += 600
+            return info
+
+        with patch.object(tarfile.TarFile, 'gettarinfo', autospec=True, side_effect=stale_stat):
+            result = service.create_backup("shrunk")
+
+        index = read_backup_index(result["path"])
+        assert set(index["members"]) == {"MODE_Brainstorming.md"}
+        assert index["files"] == 1
+        with tarfile.open(result["path"]) as tar:
+            assert tar.extractfile("MODE_Brainstorming.md").read() == b"mode"
+            assert tar.getmember("CLAUDE.md").size == len("imports") + 600
+
+    def test_dedup_snapshots_share_objects_and_collect_garbage(self, tmp_path):
+        from setup.services.backup import BackupService
+
+        install_dir = tmp_path / "install"
+        install_dir.mkdir()
+        (install_dir / "CLAUDE.md").write_text("imports")
+        (install_dir / "MODE_Brainstorming.md").write_text("v1")
+        service = BackupService(install_dir)
+
+        first = service.create_snapshot("first")
+        (install_dir / "MODE_Brainstorming.md").write_text("v2")
+        second = service.create_snapshot("second")
+
+        assert first["new_objects"] == 2
+        assert second["new_objects"] == 1
+        objects = [p for p in service.objects_dir.rglob("*") if p.is_file() and p.name != "refcounts.json"]
+        assert len(objects) == 3
+
+        assert service.delete_snapshot(first["path"]) == 1
+
+        restore_dir = tmp_path / "restore"
+        assert service.restore_snapshot(second["path"], restore_dir) == 2
+        assert (restore_dir / "MODE_Brainstorming.md").read_text() == "v2"
+        assert (restore_dir / "CLAUDE.md").read_text() == "imports"
+
+    def test_component_jobs_install_levels_concurrently(self, tmp_path):
+        import threading
+        import time
+
+        events = []
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+
+        def make_component(name, dependencies):
+            def install(config):
+                with lock:
+                    running["now"] += 1
+                    running["max"] = max(running["max"], running["now"])
+                    events.append(("start", name))
+                time.sleep(0.05)
+                settings = Installer(install_dir=tmp_path).settings_manager
+                settings.add_component_registration(name, {"version": "1"})
+                with lock:
+                    running["now"] -= 1
+                    events.append(("end", name))
+                return True
+
+            component = MagicMock()
+            component.get_metadata.return_value = {'name': name}
+            component.get_dependencies.return_value = dependencies
+            component.is_reinstallable.return_value = False
+            component.validate_prerequisites.return_value = (True, [])
+            component.validate_installation.return_value = (True, [])
+            component.install.side_effect = install
+            return component
+
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([
+            make_component("core", []),
+            make_component("commands", ["core"]),
+            make_component("agents", ["core"]),
+            make_component("modes", ["core"]),
+        ])
+
+        assert installer.get_installation_levels(["commands", "agents", "modes"]) == [
+            ["core"], ["commands", "agents", "modes"]
+        ]
+        assert installer.install_components(["commands", "agents", "modes"],
+                                            {"staged": False, "component_jobs": 4})
+
+        # core finished before any dependent started, the rest overlapped
+        assert events[:2] == [("start", "core"), ("end", "core")]
+        assert running["max"] == 3
+        assert installer.installed_components == {"core", "commands", "agents", "modes"}
+        registered = installer.settings_manager.get_installed_components()
+        assert set(registered) == {"core", "commands", "agents", "modes"}
+
+    def test_staging_commit_rolls_back_on_failure(self, tmp_path):
+        import os
+        from unittest.mock import patch
+        from setup.services.staging import StagingArea, STAGING_DIR
+
+        (tmp_path / "a.md").write_text("old a")
+        (tmp_path / "b.md").write_text("old b")
+
+        staging = StagingArea(tmp_path, "core")
+        for name in ("a.md", "b.md", "c.md"):
+            staged = staging.stage_path(tmp_path / name)
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            staged.write_text(f"new {name}")
+
+        real_replace = os.replace
+
+        def failing_replace(src, dst):
+            if Path(dst) == tmp_path / "c.md":
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        with patch("setup.services.staging.os.replace", side_effect=failing_replace):
+            with pytest.raises(OSError):
+                staging.commit()
+
+        assert (tmp_path / "a.md").read_text() == "old a"
+        assert (tmp_path / "b.md").read_text() == "old b"
+        assert not (tmp_path / "c.md").exists()
+        assert not (tmp_path / STAGING_DIR).exists()
@@ -2,6 +2,17 @@ import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from setup.components.mcp import MCPComponent
+from setup.utils.process import CommandRunner
+
+
+@pytest.fixture(autouse=True)
+def runner_with_claude_on_path(monkeypatch):
+    """Resolve every command as if node, npm and claude were installed"""
+    runner = CommandRunner(shell_fallback=False)
+    monkeypatch.setattr(runner, "which", lambda executable: f"/usr/bin/{executable}")
+    monkeypatch.setattr("setup.components.mcp.get_runner", lambda: runner)
+    return runner
+
 
 class TestMCPComponent:
     @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
@@ -71,3 +82,263 @@ class TestMCPComponent:
         assert success is False
         assert len(errors) == 1
         assert "playwright" in errors[0]
+
+    @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    @patch('setup.components.mcp.MCPComponent._detect_existing_mcp_servers_from_config', return_value=[])
+    @patch('subprocess.run')
+    def test_install_shares_one_server_listing(self, mock_subprocess_run, mock_detect_config,
+                                               mock_validate_prereqs, mock_post_install):
+        mock_subprocess_run.return_value.returncode = 0
+        mock_subprocess_run.return_value.stdout = "magic\nplaywright\ncontext7\n"
+
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+
+        assert component._install({"selected_mcp_servers": ["magic", "playwright", "context7"]})
+
+        list_calls = [c for c in mock_subprocess_run.call_args_list if c.args[0][1:3] == ["mcp", "list"]]
+        assert len(list_calls) == 1
+
+        # Adding a server drops the snapshot so the next check sees it
+        component._run_mcp_change(["claude", "mcp", "add", "serena"], capture_output=True, text=True)
+        component._check_mcp_server_installed("serena")
+        list_calls = [c for c in mock_subprocess_run.call_args_list if c.args[0][1:3] == ["mcp", "list"]]
+        assert len(list_calls) == 2
+
+    def test_parse_mcp_list_output_indexes_servers_by_name(self):
+        from setup.services.mcp_registry import parse_mcp_list_output
+
+        index = parse_mcp_list_output(
+            "Checking MCP server health...\n"
+            "\n"
+            "magic-helper: npx -y magic-helper - ✓ Connected\n"
+            "serena: uvx --from git+https://github.com/oraios/serena serena start-mcp-server - ✗ Failed to connect\n"
+        )
+
+        assert set(index) == {"magic-helper", "serena"}
+        assert "magic" not in index
+        assert index["magic-helper"]["command"] == "npx"
+        assert index["magic-helper"]["args"] == ["-y", "magic-helper"]
+        assert index["magic-helper"]["status"] == "Connected"
+        assert index["serena"]["status"] == "Failed to connect"
+
+    @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    @patch('setup.components.mcp.MCPComponent._detect_existing_mcp_servers_from_config', return_value=[])
+    @patch('setup.components.mcp.MCPComponent._check_mcp_server_installed', return_value=False)
+    @patch('setup.components.mcp.MCPComponent._install_mcp_server')
+    def test_required_server_failure_stops_concurrent_install(self, mock_install_mcp_server, mock_check,
+                                                              mock_detect_config, mock_validate_prereqs,
+                                                              mock_post_install):
+        mock_install_mcp_server.side_effect = lambda info, config: info["name"] != "context7"
+
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+
+        config = {"selected_mcp_servers": ["context7"], "mcp_jobs": 2, "dry_run": True}
+        assert component._install(config) is False
+        mock_post_install.assert_not_called()
+
+        config = {"selected_mcp_servers": ["magic", "playwright", "tavily"], "mcp_jobs": 2, "dry_run": True}
+        assert component._install(config) is True
+        assert set(component.installed_servers_in_session) == {"magic", "playwright", "tavily"}
+
+    @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    @patch('setup.components.mcp.MCPComponent._detect_existing_mcp_servers_from_config', return_value=[])
+    @patch('setup.components.mcp.MCPComponent._list_mcp_servers', return_value=None)
+    @patch('setup.components.mcp.MCPComponent._run_command_cross_platform')
+    def test_config_backend_writes_claude_json_once(self, mock_run_command, mock_list, mock_detect_config,
+                                                    mock_validate_prereqs, mock_post_install, tmp_path):
+        import json
+        from setup.services.mcp_registry import ClaudeConfigRegistry
+
+        claude_json = tmp_path / ".claude.json"
+        claude_json.write_text(json.dumps({"numStartups": 3, "mcpServers": {"other": {"command": "other"}}}))
+
+        component = MCPComponent(install_dir=tmp_path)
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+
+        config = {
+            "selected_mcp_servers": ["context7", "sequential-thinking"],
+            "mcp_backend": "config",
+            "claude_config_path": claude_json
+        }
+        with patch.object(ClaudeConfigRegistry, '_write_config', autospec=True,
+                          side_effect=ClaudeConfigRegistry._write_config) as mock_write:
+            assert component._install(config) is True
+
+        assert mock_write.call_count == 1
+        mock_run_command.assert_not_called()
+
+        written = json.loads(claude_json.read_text())
+        assert written["numStartups"] == 3
+        assert set(written["mcpServers"]) == {"other", "context7", "sequential-thinking"}
+        assert written["mcpServers"]["context7"]["command"] == "npx"
+
+    def test_cli_fallback_replays_reinstall_remove_then_add(self, tmp_path):
+        import subprocess
+        from setup.services.mcp_registry import ClaudeConfigRegistry
+
+        component = MCPComponent(install_dir=tmp_path)
+        component._use_config_backend({"mcp_backend": "config", "claude_config_path": tmp_path / ".claude.json"})
+        remove_cmd = ["claude", "mcp", "remove", "tavily"]
+        add_cmd = component._mcp_add_command("tavily") + ["npx", "-y", "tavily-mcp@0.1.2"]
+        component._run_mcp_change(remove_cmd)
+        component._run_mcp_change(add_cmd)
+
+        with patch.object(ClaudeConfigRegistry, 'flush', side_effect=OSError("read-only")), \
+                patch.object(MCPComponent, '_run_command_cross_platform',
+                             return_value=subprocess.CompletedProcess([], 0, "", "")) as mock_run:
+            assert component._flush_config_backend() == []
+
+        assert [c.args[0] for c in mock_run.call_args_list] == [remove_cmd, add_cmd]
+
+    def test_config_registry_creates_new_claude_json_owner_only(self, tmp_path):
+        import json
+        import os
+        import stat
+        from setup.services.mcp_registry import ClaudeConfigRegistry
+
+        claude_json = tmp_path / ".claude.json"
+        registry = ClaudeConfigRegistry(claude_json)
+        registry.add_server("context7", {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]})
+
+        old_umask = os.umask(0o022)
+        try:
+            assert registry.flush() is True
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(claude_json.stat().st_mode) == 0o600
+        assert json.loads(claude_json.read_text())["mcpServers"]["context7"]["command"] == "npx"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".claude.json", ".claude.json.lock"]
+
+    def test_command_runner_execs_directly_and_records_timings(self, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+
+        monkeypatch.setenv("PATH", str(tmp_path))
+        runner = CommandRunner(shell_fallback=False)
+
+        with patch('setup.utils.process.subprocess.run') as mock_run, \
+                patch('setup.utils.process.shutil.which', return_value=sys.executable) as mock_which:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "ok", "")
+            runner.run(["python", "--version"], capture_output=True, text=True)
+            runner.run(["python", "-c", "pass"], capture_output=True, text=True)
+
+        mock_which.assert_called_once_with("python")
+        assert mock_run.call_args.args[0] == [sys.executable, "-c", "pass"]
+        assert "shell" not in mock_run.call_args.kwargs
+
+        result = runner.run(["no-such-command-xyz"], capture_output=True, text=True)
+        assert result.returncode == 127
+        assert "command not found" in result.stderr
+
+        timings = runner.get_timings()
+        assert [t["returncode"] for t in timings] == [0, 0, 127]
+        assert all(t["seconds"] >= 0 for t in timings)
+
+    def test_command_runner_shell_fallback_passes_env_through(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATH", str(tmp_path))
+        monkeypatch.setenv("SHELL", "/bin/sh")
+        runner = CommandRunner(shell_fallback=True)
+
+        # `export -p` is a shell builtin, so only the fallback can run it
+        result = runner.run(["export", "-p"], capture_output=True, text=True,
+                            env={"npm_config_cache": str(tmp_path / "npm")})
+
+        assert result.returncode == 0
+        assert "npm_config_cache" in result.stdout
+
+    @patch('setup.components.mcp.MCPComponent._install_mcp_server', return_value=True)
+    @patch('setup.components.mcp.MCPComponent._uninstall_mcp_server', return_value=True)
+    @patch('setup.components.mcp.MCPComponent._detect_existing_mcp_servers_from_config', return_value=[])
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    @patch('subprocess.run')
+    def test_update_reinstalls_only_changed_servers(self, mock_subprocess_run, mock_validate_prereqs,
+                                                    mock_detect_config, mock_uninstall, mock_install):
+        mock_subprocess_run.return_value.returncode = 0
+        mock_subprocess_run.return_value.stdout = (
+            "context7: npx -y @upstash/context7-mcp - ✓ Connected\n"
+            "tavily: npx -y tavily-mcp@0.1.1 - ✓ Connected\n"
+            "magic: npx -y @21st-dev/magic - ✓ Connected\n"
+            "sequential-thinking: npx -y @modelcontextprotocol/server-sequential-thinking@0.6.2 - ✓ Connected\n"
+        )
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        metadata = {
+            "mcp.servers": ["context7", "tavily", "magic", "sequential-thinking", "playwright"],
+            "mcp.server_specs": {"magic": "npx -y @21st-dev/magic@0.0.1"}
+        }
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.side_effect = lambda key, default=None: metadata.get(key, default)
+
+        assert component.plan_update() == {
+            "context7": "unchanged",
+            "tavily": "reinstall",
+            "magic": "reinstall",
+            "sequential-thinking": "reinstall",
+            "playwright": "install"
+        }
+
+        # The installer's update flow and update() take the same path
+        assert component.update({}) is True
+        assert sorted(c.args[0] for c in mock_uninstall.call_args_list) == ["magic", "sequential-thinking", "tavily"]
+        assert sorted(c.args[0]["name"] for c in mock_install.call_args_list) == [
+            "magic", "playwright", "sequential-thinking", "tavily"
+        ]
+
+        written = component.settings_manager.update_metadata.call_args.args[0]
+        assert written["mcp"]["server_specs"]["tavily"] == "npx -y tavily-mcp@0.1.2"
+        assert written["mcp"]["server_specs"]["magic"] == "npx -y @21st-dev/magic"
+
+    def test_prefetch_fills_cache_and_install_registers_cache_env(self, tmp_path):
+        import subprocess
+        from setup.services.mcp_cache import MCPPackageCache
+
+        calls = []
+
+        def runner(cmd, **kwargs):
+            calls.append((cmd, kwargs["env"]))
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        component = MCPComponent(install_dir=tmp_path)
+        cache = MCPPackageCache(tmp_path / "mcp-cache", runner=runner)
+        servers = {name: component.mcp_servers[name] for name in ("context7", "tavily", "serena")}
+        assert cache.prefetch(servers) == {"context7": True, "tavily": True, "serena": True}
+
+        commands = {cmd[-3] if cmd[0] == "npm" else cmd[0]: (cmd, env) for cmd, env in calls}
+        assert commands["@upstash/context7-mcp"][1]["npm_config_cache"] == str(tmp_path / "mcp-cache" / "npm")
+        assert "tavily-mcp@0.1.2" in commands
+        assert commands["uvx"][1]["UV_CACHE_DIR"] == str(tmp_path / "mcp-cache" / "uv")
+        assert set(cache.read_manifest()) == {"context7", "tavily", "serena"}
+
+        component._package_cache = MCPPackageCache(tmp_path / "mcp-cache", offline=True)
+        add_cmd = component._mcp_add_command("context7")
+        assert add_cmd[-2:] == ["--", "context7"]
+        assert f"npm_config_cache={tmp_path / 'mcp-cache' / 'npm'}" in add_cmd
+        assert "npm_config_offline=true" in add_cmd
+
+    def test_npm_package_server_registers_cache_env(self, tmp_path):
+        import subprocess
+        from setup.services.mcp_cache import MCPPackageCache
+
+        component = MCPComponent(install_dir=tmp_path)
+        component._package_cache = MCPPackageCache(tmp_path / "mcp-cache", offline=True)
+        server_info = component.mcp_servers["context7"]
+        assert server_info.get("npm_package") and not server_info.get("install_command")
+
+        with patch.object(MCPComponent, '_check_mcp_server_installed', return_value=False), \
+             patch.object(MCPComponent, '_run_mcp_change',
+                          return_value=subprocess.CompletedProcess([], 0, "", "")) as run_change:
+            assert component._install_mcp_server(server_info, {})
+
+        argv = run_change.call_args[0][0]
+        assert argv[:5] == ["claude", "mcp", "add", "-s", "user"]
+        assert f"npm_config_cache={tmp_path / 'mcp-cache' / 'npm'}" in argv
+        assert "npm_config_offline=true" in argv
+        assert argv[-5:] == ["--", "context7", "npx", "-y", server_info["npm_package"]]
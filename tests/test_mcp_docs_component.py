@@ -1,4 +1,5 @@
 import pytest
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from setup.components.mcp_docs import MCPDocsComponent
@@ -33,3 +34,44 @@ class TestMCPDocsComponent:
 
         assert success is True
         mock_post_install.assert_called_once()
+
+    @patch('setup.core.base.Component.validate_prerequisites', return_value=(True, []))
+    @patch('setup.components.mcp_docs.MCPDocsComponent._detect_existing_mcp_servers_from_config', return_value=[])
+    def test_reinstall_skips_unchanged_files(self, mock_detect, mock_validate_prereqs, tmp_path):
+        config = {"selected_mcp_servers": ["context7", "magic"]}
+        assert MCPDocsComponent(install_dir=tmp_path)._install(config)
+
+        manifest = MCPDocsComponent(install_dir=tmp_path).settings_manager.get_install_manifest("mcp_docs")
+        assert set(manifest) == {"MCP_Context7.md", "MCP_Magic.md"}
+
+        component = MCPDocsComponent(install_dir=tmp_path)
+        with patch('setup.services.files.shutil.copy2', wraps=shutil.copy2) as mock_copy:
+            assert component._install(config)
+            mock_copy.assert_not_called()
+
+            # A locally modified file is detected and replaced
+            (tmp_path / "MCP_Magic.md").write_text("edited")
+            assert component._install(config)
+            assert mock_copy.call_count == 1
+
+    def test_catalog_shared_by_mcp_and_docs_components(self):
+        from setup.components.mcp import MCPComponent
+        from setup.services.mcp_catalog import MCPCatalog, get_mcp_catalog
+
+        catalog = get_mcp_catalog()
+        assert catalog.resolve("Sequential") == "sequential-thinking"
+        assert catalog.resolve("morph") == "morphllm-fast-apply"
+        assert catalog.resolve("unknown") is None
+
+        # Every server has documentation that ships with the framework
+        docs_dir = Path(__file__).parent.parent / "SuperClaude" / "MCP"
+        for name, server in catalog.servers.items():
+            assert (docs_dir / server["docs"]).exists(), name
+
+        docs = MCPDocsComponent(install_dir=Path('/fake/dir'))
+        assert docs.server_docs_map["chrome-devtools"] == "MCP_Chrome-DevTools.md"
+        assert docs.server_docs_map["morphllm"] == docs.server_docs_map["morphllm-fast-apply"]
+        assert MCPComponent(install_dir=Path('/fake/dir')).mcp_servers is catalog.servers
+
+        with pytest.raises(ValueError):
+            MCPCatalog([{"name": "a", "aliases": ["x"]}, {"name": "b", "aliases": ["x"]}])
@@ -0,0 +1,61 @@
+import json
+import sys
+import textwrap
+
+from setup.services.mcp_health import check_server, check_servers
+
+
+STUB_SERVER = textwrap.dedent('''
+    import json, sys, time
+    time.sleep(float(sys.argv[1]) if len(sys.argv) > 1 else 0)
+    print("starting stub server")  # stray log line on stdout
+    sys.stdout.flush()
+    for line in sys.stdin:
+        message = json.loads(line)
+        if message.get("method") == "initialize":
+            result = {"protocolVersion": message["params"]["protocolVersion"],
+                      "capabilities": {"tools": {}},
+                      "serverInfo": {"name": "stub", "version": "1.0"}}
+        elif message.get("method") == "tools/list":
+            result = {"tools": [{"name": "echo"}, {"name": "add"}]}
+        else:
+            continue
+        print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}))
+        sys.stdout.flush()
+''')
+
+
+def stub_spec(tmp_path, *args):
+    script = tmp_path / "stub_server.py"
+    script.write_text(STUB_SERVER)
+    return {"type": "stdio", "command": sys.executable, "args": [str(script)] + list(args), "env": {}}
+
+
+class TestMCPHealth:
+    def test_check_server_performs_handshake(self, tmp_path):
+        result = check_server("stub", stub_spec(tmp_path), timeout=20)
+
+        assert result["status"] == "ok", result["error"]
+        assert result["server"] == "stub 1.0"
+        assert result["tools"] == 2
+        assert result["startup_ms"] > 0
+        assert result["handshake_ms"] >= 0
+        json.dumps(result)
+
+    def test_check_servers_reports_failures_and_timeouts(self, tmp_path):
+        servers = {
+            "ok": stub_spec(tmp_path),
+            "slow": stub_spec(tmp_path, "5"),
+            "missing": {"command": str(tmp_path / "no-such-binary"), "args": []},
+            "remote": {"type": "http", "url": "https://example.invalid/mcp"}
+        }
+
+        results = {r["name"]: r for r in check_servers(servers, timeout=1.5)}
+
+        assert list(results) == ["ok", "slow", "missing", "remote"]
+        assert results["ok"]["status"] == "ok"
+        assert results["slow"]["status"] == "failed"
+        assert "no response to initialize" in results["slow"]["error"]
+        assert results["missing"]["status"] == "failed"
+        assert "could not start" in results["missing"]["error"]
+        assert results["remote"]["status"] == "skipped"
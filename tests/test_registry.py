@@ -0,0 +1,134 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from setup.core.base import Component
+from setup.core.registry import ENTRY_POINT_GROUP, ComponentRegistry
+
+COMPONENTS_DIR = Path(__file__).parent.parent / "setup" / "components"
+
+
+def test_listing_and_resolving_does_not_instantiate_components():
+    registry = ComponentRegistry(COMPONENTS_DIR, use_index=False)
+
+    with patch.object(Component, "__init__", side_effect=AssertionError("instantiated")):
+        assert set(registry.list_components()) == {"core", "commands", "agents", "modes", "mcp", "mcp_docs"}
+        assert registry.get_component_metadata("mcp")["category"] == "integration"
+        assert registry.resolve_dependencies(["mcp_docs"]) == ["core", "mcp_docs"]
+        assert registry.get_registry_info()["validation_errors"] == []
+
+
+@patch.dict(sys.modules)
+def test_component_modules_are_imported_on_demand():
+    for name in [m for m in sys.modules if m.startswith("setup.components.")]:
+        del sys.modules[name]
+
+    registry = ComponentRegistry(COMPONENTS_DIR, use_index=False)
+    registry.list_components()
+    assert "setup.components.mcp" not in sys.modules
+
+    instances = registry.create_component_instances(["modes"], Path("/tmp/superclaude-test"))
+    assert instances["modes"].get_metadata() == registry.get_component_metadata("modes")
+    assert "setup.components.modes" in sys.modules
+    assert "setup.components.mcp" not in sys.modules
+
+
+WIDGET_MODULE = """
+from ..core.base import Component
+
+
+class WidgetComponent(Component):
+    NAME = "widget"
+    DESCRIPTION = "{description}"
+    CATEGORY = "extras"
+    DEPENDENCIES = ("core",)
+"""
+
+
+def test_index_is_reused_until_a_module_changes(tmp_path):
+    components_dir = tmp_path / "components"
+    components_dir.mkdir()
+    module = components_dir / "widget.py"
+    module.write_text(WIDGET_MODULE.format(description="First"))
+    index_path = tmp_path / "cache" / "index.json"
+
+    first = ComponentRegistry(components_dir, index_path=index_path)
+    assert first.get_dependencies("widget") == {"core"}
+    assert index_path.exists()
+
+    with patch("setup.core.registry.ast.parse", side_effect=AssertionError("rescanned")):
+        cached = ComponentRegistry(components_dir, index_path=index_path)
+        assert cached.get_component_metadata("widget")["description"] == "First"
+        assert cached.component_locations["widget"] == ("setup.components.widget", "WidgetComponent")
+
+    module.write_text(WIDGET_MODULE.format(description="Second version"))
+    changed = ComponentRegistry(components_dir, index_path=index_path)
+    assert changed.get_component_metadata("widget")["description"] == "Second version"
+
+
+PLUGIN_MODULE = """
+from setup.core.base import Component
+
+
+class AcmeAgentsComponent(Component):
+    NAME = "acme_agents"
+    DESCRIPTION = "ACME in-house agents"
+    CATEGORY = "agents"
+    DEPENDENCIES = ("agents",)
+
+    def __init__(self, install_dir=None):
+        super().__init__(install_dir)
+"""
+
+
+@patch.dict(sys.modules)
+def test_entry_point_plugins_are_indexed_without_import(tmp_path, monkeypatch):
+    from importlib.metadata import EntryPoint
+
+    package = tmp_path / "site" / "acme_superclaude"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "agents.py").write_text(PLUGIN_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+
+    entry_point = EntryPoint(name="acme_agents", group=ENTRY_POINT_GROUP,
+                             value="acme_superclaude.agents:AcmeAgentsComponent")
+    index_path = tmp_path / "index.json"
+
+    with patch("setup.core.registry._iter_entry_points", return_value=[entry_point]):
+        registry = ComponentRegistry(COMPONENTS_DIR, index_path=index_path)
+        assert "acme_agents" in registry.list_components()
+        assert registry.resolve_dependencies(["acme_agents"]) == ["core", "agents", "acme_agents"]
+        assert "acme_superclaude.agents" not in sys.modules
+
+    # Later runs take the plugin from the index without reading entry points
+    with patch("setup.core.registry._iter_entry_points", side_effect=AssertionError("rescanned")):
+        cached = ComponentRegistry(COMPONENTS_DIR, index_path=index_path)
+        assert cached.get_component_metadata("acme_agents")["description"] == "ACME in-house agents"
+        assert "acme_superclaude.agents" not in sys.modules
+
+        component_class = cached.get_component_class("acme_agents")
+        assert component_class.__name__ == "AcmeAgentsComponent"
+        assert "acme_superclaude.agents" in sys.modules
+
+
+SUBCLASS_MODULE = """
+from .mcp import MCPComponent
+
+
+class ExtraMCPComponent(MCPComponent):
+    NAME = "extra_mcp"
+    DEPENDENCIES = ("mcp",)
+"""
+
+
+def test_subclass_of_another_component_falls_back_to_import(tmp_path):
+    components_dir = tmp_path / "components"
+    components_dir.mkdir()
+    (components_dir / "extra_mcp.py").write_text(SUBCLASS_MODULE)
+    (components_dir / "helpers.py").write_text("class Settings(dict):\n    pass\n")
+
+    with patch.object(ComponentRegistry, "_load_component_module") as mock_load:
+        ComponentRegistry(components_dir, use_index=False).discover_components()
+
+    mock_load.assert_called_once_with("extra_mcp")
@@ -0,0 +1,138 @@
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from setup.services.settings import SettingsService
+
+
+class TestMetadataSession:
+    def test_session_defers_metadata_write_until_commit(self, tmp_path):
+        service = SettingsService(tmp_path)
+        other = SettingsService(tmp_path)
+
+        with service.metadata_session():
+            service.update_metadata({"framework": {"version": "1.0"}})
+            other.add_component_registration("core", {"version": "1.0"})
+
+            # Nothing is written while the session is open...
+            assert not service.metadata_file.exists()
+            # ...but every service sees the in-memory view
+            assert other.get_metadata_setting("framework.version") == "1.0"
+            assert service.is_component_installed("core")
+
+        metadata = json.loads(service.metadata_file.read_text())
+        assert metadata["framework"]["version"] == "1.0"
+        assert metadata["components"]["core"]["version"] == "1.0"
+
+    def test_session_discards_changes_on_error(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.save_metadata({"framework": {"version": "1.0"}})
+
+        with pytest.raises(RuntimeError):
+            with service.metadata_session():
+                service.update_metadata({"framework": {"version": "2.0"}})
+                raise RuntimeError("install failed")
+
+        assert service.get_metadata_setting("framework.version") == "1.0"
+
+
+class TestJSONFileCache:
+    def test_lookups_reuse_parsed_metadata_until_file_changes(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.save_metadata({"components": {"core": {"version": "1.0"}}})
+
+        with patch('setup.utils.json_cache.json.load', wraps=json.load) as mock_load:
+            assert service.get_component_version("core") == "1.0"
+            assert service.is_component_installed("core")
+            assert SettingsService(tmp_path).get_metadata_setting("components.core.version") == "1.0"
+            assert mock_load.call_count == 1
+
+            # An external write is picked up through the stat signature
+            service.metadata_file.write_text(json.dumps({"components": {"core": {"version": "2.0"}}}))
+            assert service.get_component_version("core") == "2.0"
+            assert mock_load.call_count == 2
+
+    def test_returned_values_do_not_alias_the_cache(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.save_metadata({"mcp": {"servers": ["magic"]}})
+
+        servers = service.get_metadata_setting("mcp.servers")
+        servers.append("playwright")
+
+        assert service.get_metadata_setting("mcp.servers") == ["magic"]
+
+
+class TestStructuralMerge:
+    def test_merge_shares_untouched_subtrees(self):
+        from setup.utils.merge import deep_merge_with_diff
+
+        base = {"components": {"core": {"version": "1.0"}}, "mcp": {"servers": ["magic"]}}
+        merged, diff = deep_merge_with_diff(base, {"mcp": {"servers": ["magic", "playwright"]}})
+
+        assert merged["components"] is base["components"]
+        assert base["mcp"]["servers"] == ["magic"]
+        assert diff == [{"path": ["mcp", "servers"], "op": "change",
+                         "new": ["magic", "playwright"], "old": ["magic"]}]
+
+        unchanged, diff = deep_merge_with_diff(base, {"components": {"core": {"version": "1.0"}}})
+        assert unchanged is base
+        assert diff == []
+
+    def test_unchanged_update_does_not_rewrite_file(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.update_settings({"permissions": {"allow": ["Read"]}})
+        mtime = service.settings_file.stat().st_mtime_ns
+
+        service.update_settings({"permissions": {"allow": ["Read"]}})
+
+        assert service.settings_file.stat().st_mtime_ns == mtime
+        assert service.list_backups() == []
+
+    def test_atomic_write_keeps_file_mode(self, tmp_path):
+        import stat
+
+        service = SettingsService(tmp_path)
+        service.update_settings({"permissions": {"allow": ["Read"]}})
+        service.settings_file.chmod(0o600)
+
+        service.update_settings({"permissions": {"allow": ["Read", "Write"]}})
+
+        assert stat.S_IMODE(service.settings_file.stat().st_mode) == 0o600
+
+    def test_diff_backup_restores_previous_settings(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.save_settings({"theme": "dark", "permissions": {"allow": ["Read"]}}, create_backup=False)
+
+        service.update_settings({"theme": "light", "permissions": {"deny": ["Bash"]}})
+        backups = service.list_backups()
+        assert len(backups) == 1
+        assert backups[0]["name"].endswith(".diff.json")
+
+        assert service.restore_backup(backups[0]["name"])
+        assert service.load_settings() == {"theme": "dark", "permissions": {"allow": ["Read"]}}
+
+    def test_restoring_older_diff_backup_undoes_later_changes(self, tmp_path):
+        service = SettingsService(tmp_path)
+        original = {"theme": "dark", "permissions": {"allow": ["Read"]}}
+        service.save_settings(original, create_backup=False)
+
+        service.update_settings({"theme": "light"})
+        service.update_settings({"permissions": {"deny": ["Bash"]}, "model": "opus"})
+        diffs = sorted(b["name"] for b in service.list_backups() if b["name"].endswith(".diff.json"))
+        assert len(diffs) == 2
+
+        assert service.restore_backup(diffs[0])
+        assert service.load_settings() == original
+
+    def test_diff_restore_fails_when_chain_is_broken(self, tmp_path):
+        service = SettingsService(tmp_path)
+        service.save_settings({"theme": "dark"}, create_backup=False)
+
+        service.update_settings({"theme": "light"})
+        service.update_settings({"theme": "blue"})
+        service.update_settings({"theme": "red"})
+        oldest, middle, _ = sorted(b["name"] for b in service.list_backups())
+        (service.backup_dir / middle).unlink()
+
+        assert not service.restore_backup(oldest)
+        assert service.load_settings() == {"theme": "red"}
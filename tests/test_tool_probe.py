@@ -0,0 +1,77 @@
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from setup.services.tool_probe import ToolProbeService
+
+
+@pytest.fixture
+def fake_tool(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "faketool"
+    tool.write_text(f"#!{sys.executable}\nprint('faketool 1.2.3')\n")
+    tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    ToolProbeService.clear_cache()
+    yield tool
+    ToolProbeService.clear_cache()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shebang script")
+class TestToolProbeService:
+    def test_probe_results_persist_until_binary_changes(self, fake_tool, tmp_path):
+        cache_path = tmp_path / "cache" / "tool_probes.json"
+
+        result = ToolProbeService(cache_path).probe_many(["faketool", "faketool"])["faketool"]
+        assert result["available"] is True
+        assert result["version"] == "faketool 1.2.3"
+        assert cache_path.exists()
+
+        # A new process (fresh in-memory cache) reuses the persisted result
+        ToolProbeService.clear_cache()
+        with patch("setup.services.tool_probe.subprocess.run") as mock_run:
+            result = ToolProbeService(cache_path).probe("faketool")
+        mock_run.assert_not_called()
+        assert result["version"] == "faketool 1.2.3"
+
+        # Replacing the binary invalidates the cached result
+        fake_tool.write_text(f"#!{sys.executable}\nprint('faketool 2.0.0')\n")
+        os.utime(fake_tool, ns=(fake_tool.stat().st_atime_ns, fake_tool.stat().st_mtime_ns + 10**9))
+        ToolProbeService.clear_cache()
+        assert ToolProbeService(cache_path).probe("faketool")["version"] == "faketool 2.0.0"
+
+    def test_missing_tool_falls_back_to_runner(self, fake_tool):
+        calls = []
+
+        def runner(cmd, **kwargs):
+            calls.append(cmd)
+            raise FileNotFoundError(cmd[0])
+
+        service = ToolProbeService(runner=runner)
+        assert service.probe("no-such-tool-xyz")["available"] is False
+        assert service.probe("no-such-tool-xyz")["available"] is False
+        assert calls == [["no-such-tool-xyz", "--version"]]
+
+    def test_probe_runs_the_path_entry_not_the_symlink_target(self, tmp_path, monkeypatch):
+        # Like volta: every tool is a symlink to one shim that dispatches on argv[0]
+        shim = tmp_path / "shim" / "volta-shim"
+        shim.parent.mkdir()
+        shim.write_text(f"#!{sys.executable}\nimport os, sys\n"
+                        "name = os.path.basename(sys.argv[0])\n"
+                        "sys.exit(1) if name == 'volta-shim' else print(name + ' 20.1.0')\n")
+        shim.chmod(shim.stat().st_mode | stat.S_IEXEC)
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "shimnode").symlink_to(shim)
+        monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+        ToolProbeService.clear_cache()
+
+        result = ToolProbeService().probe("shimnode")
+
+        assert result["available"] is True
+        assert result["version"] == "shimnode 20.1.0"
+        assert result["path"] == str(shim.resolve())